@@ -0,0 +1,110 @@
+import numpy as np
+import pandas as pd
+
+import lib.core.my_calendar_v2 as my_cal_v2
+
+# *************************************************************************************************** #
+
+
+class CalendarMerge:
+    """
+    Merge table files on (date, primary event). The result has a row for each date of the calendar years and
+    each primary event (in order of first appearance) and a column for the primary event, the date and each
+    selected event column. Each file is read once, the keys are found by hashing (pandas Index) and the values
+    of each file are written to their rows with one vectorized assignment per column.
+    """
+    def __init__(self, listOfYears: [], dateFormat=my_cal_v2.DD_MM_YYYY, dateDelimiter=my_cal_v2.del_slash,
+                 noDataValue=my_cal_v2.NaN):
+        """
+        :param listOfYears: the years of the calendar
+        :param dateFormat: the date format of the files (and the calendar)
+        :param dateDelimiter: the date delimiter of the files (and the calendar)
+        :param noDataValue: the value of the missing (or empty) cells
+        """
+        self.listOfYears = listOfYears
+        self.dateFormat = dateFormat
+        self.dateDelimiter = dateDelimiter
+        self.noDataValue = noDataValue
+        self._listFiles = []  # [{'name', 'data', 'date-column', 'primary-column', 'event-columns'}]
+
+    def addFile(self, fileName: str, path: str, dateColumn: str, primaryColumn: str, eventColumns: [],
+                delimiter=my_cal_v2.del_comma):
+        """
+        Read a CSV file (all the values are read as strings).
+        :param fileName: the name of the file (for the error messages)
+        :param path: the path of the file
+        :param dateColumn: the date column
+        :param primaryColumn: the primary event column
+        :param eventColumns: the selected event columns
+        :param delimiter: the delimiter of the values
+        :return: Nothing
+        """
+        fileData = pd.read_csv(path, sep=delimiter, dtype=str, keep_default_na=False, na_filter=False)
+        self._listFiles.append({'name': fileName,
+                                'data': fileData,
+                                'date-column': dateColumn,
+                                'primary-column': primaryColumn,
+                                'event-columns': eventColumns})
+
+    def columns(self):
+        """
+        :return: the columns of the merged table (the primary event and the date columns of the first file and
+                 the selected event columns of each file in file order)
+        """
+        if self._listFiles.__len__() == 0:
+            return []
+        listColumns = [self._listFiles[0]['primary-column'], self._listFiles[0]['date-column']]
+        for fileInfo in self._listFiles:
+            for column in fileInfo['data'].columns:
+                if column in fileInfo['event-columns'] and column not in listColumns:
+                    listColumns.append(column)
+        return listColumns
+
+    def primaryEvents(self):
+        """
+        :return: the primary events of all the files (in order of first appearance)
+        """
+        if self._listFiles.__len__() == 0:
+            return []
+        return pd.unique(np.concatenate([fileInfo['data'][fileInfo['primary-column']].to_numpy(dtype=object)
+                                         for fileInfo in self._listFiles])).tolist()
+
+    def merge(self):
+        """
+        Outer join of the files on (date, primary event). The values of the later files replace the values of the
+        earlier files (and the later rows of a file the earlier rows).
+        :return: the merged table as a numpy object array (rows = dates x primary events)
+        """
+        listColumns = self.columns()
+        indexDates = pd.Index(my_cal_v2.create_list_dates(self.listOfYears, date_format=self.dateFormat,
+                                                          date_delimiter=self.dateDelimiter))
+        indexEvents = pd.Index(self.primaryEvents())
+        dictColumnIndex = {column: index for index, column in enumerate(listColumns)}
+
+        mergedTable = np.full((indexDates.__len__() * indexEvents.__len__(), listColumns.__len__()),
+                              self.noDataValue, dtype=object)
+        for fileInfo in self._listFiles:
+            fileData = fileInfo['data']
+            dateRows = indexDates.get_indexer(fileData[fileInfo['date-column']])
+            if np.any(dateRows < 0):
+                missingDate = fileData[fileInfo['date-column']].to_numpy(dtype=object)[np.argmax(dateRows < 0)]
+                raise ValueError(fileInfo['name'] + ': the date <' + str(missingDate) + '> is not in the calendar')
+            eventRows = indexEvents.get_indexer(fileData[fileInfo['primary-column']])
+            tableRows = dateRows * indexEvents.__len__() + eventRows
+            lastRows = ~pd.Index(tableRows).duplicated(keep='last')  # the last row of each key
+            tableRows = tableRows[lastRows]
+
+            for column in fileData.columns:
+                if column in dictColumnIndex.keys():
+                    values = fileData[column].to_numpy(dtype=object)[lastRows]
+                    values[values == ''] = self.noDataValue
+                    mergedTable[tableRows, dictColumnIndex[column]] = values
+        return mergedTable
+
+    def exportCSV(self, csvPath: str, delimiter=my_cal_v2.del_comma):
+        """
+        Merge the files and write the merged table (with the header row) to a CSV file at once.
+        :return: Nothing
+        """
+        mergedTable = self.merge()
+        my_cal_v2.write_csv(csv_path=csvPath, list_write=[self.columns()] + mergedTable.tolist(), delimiter=delimiter)
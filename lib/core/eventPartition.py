@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+
+# *************************************************************************************************** #
+
+EP_DEFAULT_EVENT = 'Data'  # the event name used when there is no primary event column
+
+
+class EventPartition:
+    """
+    Group the rows of a table by a primary event column only once. The rows are stably sorted by event
+    (the order of the rows inside each event is kept) and the start/end offsets of each event are stored,
+    so the data of an event can be taken as a numpy view (no copy, no boolean filter).
+    """
+    def __init__(self, eventValues=None, numOfRows=None, defaultEvent=EP_DEFAULT_EVENT):
+        """
+        :param eventValues: the values of the primary event column (or None for a single event)
+        :param numOfRows: the number of rows (needed only if eventValues is None)
+        :param defaultEvent: the name of the single event (if eventValues is None)
+        """
+        if eventValues is None:
+            self._events = [defaultEvent]  # a single event
+            self._order = None  # no need to sort
+            self._offsets = np.array([0, numOfRows], dtype=np.int64)
+        else:
+            # factorize uses a hash table and keeps the order of the first appearance of each event
+            codes, uniques = pd.factorize(np.asarray(eventValues, dtype=object))
+            self._events = uniques.tolist()
+            counts = np.bincount(codes[codes >= 0], minlength=self._events.__len__())  # rows per event (NaN out)
+            self._offsets = np.concatenate(([0], np.cumsum(counts))).astype(np.int64)
+            order = np.argsort(np.where(codes >= 0, codes, self._events.__len__()), kind='stable')
+            order = order[:self._offsets[-1]]  # drop the rows without event
+            # if the rows are already grouped by event there is no need to reorder (copy) the data
+            if order.__len__() == codes.__len__() and np.array_equal(order, np.arange(codes.__len__())):
+                order = None
+            self._order = order
+        self._eventIndex = {event: index for index, event in enumerate(self._events)}
+
+    def events(self):
+        """
+        :return: the unique events (in order of first appearance)
+        """
+        return self._events
+
+    def offsets(self):
+        """
+        :return: the offsets of the events in the sorted rows (size = events + 1)
+        """
+        return self._offsets
+
+    def eventSlice(self, event):
+        """
+        :param event: the event name
+        :return: the slice of the event rows in the sorted array
+        """
+        index = self._eventIndex[event]
+        return slice(int(self._offsets[index]), int(self._offsets[index + 1]))
+
+    def isGrouped(self):
+        """
+        :return: True if the rows are already grouped by event (sortArray returns the array itself, no copy)
+        """
+        return self._order is None
+
+    def sortArray(self, arr):
+        """
+        Sort the rows of arr by event. This is the only copy of the data (and it is skipped if
+        the rows are already grouped by event).
+        :param arr: an array with the same rows as the event column
+        :return: the sorted array
+        """
+        arr = np.asarray(arr)
+        if self._order is None:
+            return arr
+        return arr.take(self._order, axis=0)
+
+    def split(self, arr):
+        """
+        Split arr to a dictionary of views (one per event).
+        :param arr: an array with the same rows as the event column
+        :return: {event: view}
+        """
+        arrSorted = self.sortArray(arr)
+        return {event: arrSorted[self.eventSlice(event)] for event in self._events}
@@ -0,0 +1,180 @@
+import concurrent.futures
+import multiprocessing
+from collections import deque
+
+import numpy as np
+import matplotlib
+import matplotlib.pyplot as plt
+
+# *************************************************************************************************** #
+
+matplotlib.use("Agg")  # Set matplotlib to use non-interface (don't plot figures)
+
+FR_FIGURE_REAL_PREDICTED = 'Real-Predicted'
+FR_FIGURE_QQ_PLOT = 'QQ-Plot'
+FR_FIGURE_ABSOLUTE_ERRORS = 'Absolute-Errors'
+
+FR_DEFAULT_NUMBER_OF_WORKERS = 2  # the render processes (0 = render in the calling process)
+FR_MAX_PENDING_FIGURES_PER_WORKER = 32  # the figures waiting in the queue before the caller waits
+
+_FR_DTYPE = np.float32  # the plot data are sent to the render processes as float32 arrays
+
+
+def saveRealPredictedOutputFigure(y_Real: np.ndarray, y_Pred: np.ndarray, exportPath: str, y_max=None,
+                                  trainTestSplit=None, title='Figure: Real-Predicted Values',
+                                  yLabel='', xLabel='', realLabel=None, predLabel=None):
+    x = np.arange(y_Real.__len__())
+    plt.figure()
+    plt.plot(x, y_Real, 'bs-', label=realLabel)
+    plt.plot(x, y_Pred, 'go-', label=predLabel)
+    plt.gcf().set_size_inches(24.8, 12.4)
+    plt.gcf().subplots_adjust(bottom=0.25)
+    plt.title(title, fontsize=25)
+    plt.legend(fontsize=20, loc='upper center', bbox_to_anchor=(0.5, -0.05), fancybox=True, shadow=False, ncol=2)
+    plt.yticks(fontsize=20)
+    plt.ylabel(yLabel,
+               fontsize=22.5)
+    plt.xticks(fontsize=20)
+    plt.xlabel(xLabel,
+               fontsize=22.5)
+
+    if y_max is not None:
+        y_bottom, y_top = plt.ylim(0, y_max)
+    else:
+        y_bottom, y_top = plt.ylim(0)
+    if trainTestSplit is not None:
+        for _vxLine_ in trainTestSplit:
+            plt.vlines(_vxLine_, y_bottom, y_top, colors='r', linestyles='dashed')
+    plt.savefig(exportPath, bbox_inches='tight', dpi=100)
+    plt.close()
+
+
+def saveQQPlotFigure(y_Real: np.ndarray, y_Pred: np.ndarray, exportPath: str,
+                     title='Figure: QQ-PLot', yLabel='', xLabel=''):
+    plt.figure()
+    plt.scatter(y_Real, y_Pred)
+    plt.plot(y_Real, y_Real, color='r', lw=3, scalex=False, scaley=False)
+    plt.gcf().set_size_inches(24.8, 12.4)
+    plt.gcf().subplots_adjust(bottom=0.25)
+    plt.title(title, fontsize=25)
+    plt.yticks(fontsize=20)
+    plt.ylabel(yLabel,
+               fontsize=22.5)
+    plt.xticks(fontsize=20)
+    plt.xlabel(xLabel,
+               fontsize=22.5)
+
+    plt.savefig(exportPath, bbox_inches='tight', dpi=100)
+    plt.close()
+
+
+def saveAbsoluteErrorsFigure(absErrors: np.ndarray, exportPath: str, y_max=None,
+                             trainTestSplit=None, title='Figure: Absolute Errors',
+                             yLabel='', xLabel='', errorsLabel='Absolute Errors'):
+    plt.figure()
+    plt.plot(np.arange(absErrors.__len__()), absErrors, label=errorsLabel)
+    plt.gcf().set_size_inches(24.8, 12.4)
+    plt.gcf().subplots_adjust(bottom=0.25)
+    plt.title(title, fontsize=25)
+    plt.legend(fontsize=20, loc='upper center', bbox_to_anchor=(0.5, -0.05), fancybox=True, shadow=False, ncol=2)
+    plt.yticks(fontsize=20)
+    plt.ylabel(yLabel,
+               fontsize=22.5)
+    plt.xticks(fontsize=20)
+    plt.xlabel(xLabel,
+               fontsize=22.5)
+
+    if y_max is not None:
+        y_bottom, y_top = plt.ylim(0, y_max)
+    else:
+        y_bottom, y_top = plt.ylim(0)
+    if trainTestSplit is not None:
+        for _vxLine_ in trainTestSplit:
+            plt.vlines(_vxLine_, y_bottom, y_top, colors='r', linestyles='dashed')
+    plt.savefig(exportPath, bbox_inches='tight', dpi=100)
+    plt.close()
+
+
+_FR_dictFigures = {
+    FR_FIGURE_REAL_PREDICTED: saveRealPredictedOutputFigure,
+    FR_FIGURE_QQ_PLOT: saveQQPlotFigure,
+    FR_FIGURE_ABSOLUTE_ERRORS: saveAbsoluteErrorsFigure
+}
+
+
+def renderFigure(figureType: str, kwargs: dict):
+    """
+    Render and save a figure.
+    :param figureType: FR_FIGURE_REAL_PREDICTED, FR_FIGURE_QQ_PLOT or FR_FIGURE_ABSOLUTE_ERRORS
+    :param kwargs: the arguments of the figure function
+    :return: the export path of the figure
+    """
+    _FR_dictFigures[figureType](**kwargs)
+    return kwargs['exportPath']
+
+
+class FigureRenderQueue:
+    """
+    A queue of figures which are rendered by a pool of processes (Agg backend), so the caller doesn't wait
+    for the rendering. The plot data are sent as compact float32 arrays. If the queue is full (the render
+    processes are slower than the caller), submit waits for the oldest figure.
+    """
+    def __init__(self, numOfWorkers=FR_DEFAULT_NUMBER_OF_WORKERS):
+        """
+        :param numOfWorkers: the render processes (0 = render in the calling process, without a queue)
+        """
+        self._numOfWorkers = max(0, numOfWorkers)
+        self._maxPending = max(1, self._numOfWorkers) * FR_MAX_PENDING_FIGURES_PER_WORKER
+        self._pending = deque()
+        self._executor = None
+        if self._numOfWorkers > 0:
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self._numOfWorkers, mp_context=multiprocessing.get_context('spawn'))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, excType, excValue, traceback):
+        self.close(cancelPending=excType is not None)
+
+    def submit(self, figureType: str, **kwargs):
+        """
+        Add a figure to the queue.
+        :param figureType: FR_FIGURE_REAL_PREDICTED, FR_FIGURE_QQ_PLOT or FR_FIGURE_ABSOLUTE_ERRORS
+        :param kwargs: the arguments of the figure function (the arrays are converted to float32)
+        :return: Nothing
+        """
+        for key in kwargs.keys():
+            if isinstance(kwargs[key], np.ndarray) and kwargs[key].dtype.kind in 'biuf':
+                kwargs[key] = np.ascontiguousarray(kwargs[key], dtype=_FR_DTYPE)
+
+        if self._executor is None:
+            renderFigure(figureType, kwargs)
+            return
+
+        while self._pending.__len__() > 0 and self._pending[0].done():
+            self._pending.popleft().result()  # raise the errors of the rendered figures
+        while self._pending.__len__() >= self._maxPending:
+            self._pending.popleft().result()  # wait for the oldest figure
+        self._pending.append(self._executor.submit(renderFigure, figureType, kwargs))
+
+    def close(self, cancelPending=False):
+        """
+        Wait for the figures of the queue and stop the render processes.
+        :param cancelPending: if True the figures which haven't started are not rendered
+        :return: Nothing
+        """
+        if self._executor is None:
+            return
+        try:
+            if cancelPending:
+                for future in self._pending:
+                    future.cancel()
+            for future in self._pending:
+                if not future.cancelled():
+                    future.result()  # raise the errors of the render processes
+        finally:
+            self._pending.clear()
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
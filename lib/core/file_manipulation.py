@@ -103,21 +103,123 @@ def pathFileSuffix(path):
     return os.path.splitext(path)[1]
 
 
-def getColumnNames(path):
+def getTableFileSuffix(path):
     # find the file suffix (extension) and take is as lowercase without the comma
-    suffix = os.path.splitext(path)[1].lower().split('.')[1]
-    columns = []
+    return os.path.splitext(path)[1].lower().split('.')[1]
+
+
+def getColumnNames(path, splitter=','):
+    # Read only the header of the file (no data rows are parsed)
+    fileData = readTableFile(path, splitter=splitter, nrows=0)
+    if fileData is None:
+        return []
+    return fileData.keys().tolist()
+
+
+def readTableFile(path, useColumns=None, dtypes=None, splitter=',', nrows=None):
+    """
+    Read a CSV/XLSX table file. Only the columns in useColumns are parsed and the dtypes are
+    given to the parser (the unused columns are never converted to python objects).
+    :param path: the path of the table file
+    :param useColumns: a list with the columns to be read (None for all columns)
+    :param dtypes: a dictionary {column: dtype} (None to let pandas find the dtypes)
+    :param splitter: the delimiter of the CSV file
+    :param nrows: the number of rows to be read (None for all rows)
+    :return: a DataFrame with the columns in the order of useColumns (None if the suffix is not supported)
+    """
+    suffix = getTableFileSuffix(path)
+    fileData = None
     # Read the file Data - CSV
     if suffix == 'csv':
-        # read only the needed columns
-        fileData = pd.read_csv(path, nrows=1)
-        columns = fileData.keys().tolist()
-        # print(fileData.keys())
+        fileData = pd.read_csv(path, sep=splitter, usecols=useColumns, dtype=dtypes, nrows=nrows)
+    # Read the file Data - XLSX
     elif suffix == 'xlsx':
-        # read only the needed columns
-        fileData = pd.read_excel(path, nrows=1)
-        columns = fileData.keys().tolist()
-    return columns
+        fileData = pd.read_excel(path, usecols=useColumns, dtype=dtypes, nrows=nrows)
+
+    if fileData is not None and useColumns is not None:
+        fileData = fileData[useColumns]  # usecols doesn't keep the order of the columns
+    return fileData
+
+
+def readTableFileByEvent(path, eventColumn, useColumns=None, dtypes=None, splitter=',', chunkSize=100000):
+    """
+    Read a CSV table file grouped by event, in two passes of chunkSize rows. The first pass parses only the
+    event column and counts the rows of each event. The second pass parses the needed columns and writes the
+    rows of each chunk directly to their (event sorted) positions in preallocated column arrays, so the peak
+    memory is about the size of the needed columns plus a chunk. XLSX files are read at once.
+    :param path: the path of the table file
+    :param eventColumn: the column with the events (rows without event are skipped)
+    :param useColumns: a list with the columns to be read (None for all columns)
+    :param dtypes: a dictionary {column: dtype} (None to let pandas find the dtypes)
+    :param splitter: the delimiter of the CSV file
+    :param chunkSize: the number of rows in each chunk
+    :return: a DataFrame grouped by event (events in order of first appearance, rows in file order)
+    """
+    if getTableFileSuffix(path) != 'csv':
+        fileData = readTableFile(path, useColumns=useColumns, dtypes=dtypes, splitter=splitter)
+        if fileData is None:
+            return None
+
+        def readChunks(columns):
+            return [fileData if columns is None else fileData[columns]]
+    else:
+        def readChunks(columns):
+            columnDtypes = dtypes
+            if dtypes is not None and columns is not None:
+                columnDtypes = {key: dtypes[key] for key in dtypes.keys() if key in columns}
+            return pd.read_csv(path, sep=splitter, usecols=columns, dtype=columnDtypes, chunksize=chunkSize)
+
+    # First pass: the events (in order of first appearance) and the number of rows of each event
+    eventCodes = {}  # {event: code}
+    eventCounts = []
+    for chunk in readChunks([eventColumn]):
+        codes, uniques = pd.factorize(chunk[eventColumn].to_numpy(dtype=object))  # the missing events are -1
+        chunkCounts = np.bincount(codes[codes >= 0], minlength=uniques.__len__())
+        for event, count in zip(uniques.tolist(), chunkCounts.tolist()):
+            if event not in eventCodes.keys():
+                eventCodes[event] = eventCounts.__len__()
+                eventCounts.append(0)
+            eventCounts[eventCodes[event]] += count
+
+    numOfRows = int(np.sum(eventCounts))
+    if numOfRows == 0:  # empty file
+        return pd.DataFrame(columns=useColumns)
+    offsets = np.concatenate(([0], np.cumsum(eventCounts))).astype(np.int64)
+    nextRows = offsets[:-1].copy()  # the next free row of each event
+
+    # Second pass: write the rows of each chunk to their positions (the rows of an event stay in file order)
+    columnArrays = {}
+    listColumns = []
+    for chunk in readChunks(useColumns):
+        if useColumns is not None:
+            chunk = chunk[useColumns]  # usecols doesn't keep the order of the columns
+        listColumns = chunk.columns.tolist()
+        codes, uniques = pd.factorize(chunk[eventColumn].to_numpy(dtype=object))
+        isEventRow = codes >= 0
+        rowCodes = np.array([eventCodes[event] for event in uniques.tolist()], dtype=np.int64)[codes[isEventRow]]
+        chunkCounts = np.bincount(rowCodes, minlength=eventCounts.__len__())
+        order = np.argsort(rowCodes, kind='stable')
+        sortedCodes = rowCodes[order]
+        chunkStarts = np.concatenate(([0], np.cumsum(chunkCounts)[:-1]))
+        positions = np.empty(rowCodes.shape[0], dtype=np.int64)
+        positions[order] = nextRows[sortedCodes] + np.arange(order.shape[0]) - chunkStarts[sortedCodes]
+        nextRows += chunkCounts
+
+        for column in listColumns:
+            values = chunk[column].to_numpy()[isEventRow]
+            if column not in columnArrays.keys():
+                columnArrays[column] = np.empty(numOfRows, dtype=values.dtype if values.dtype.kind in 'biufcmM'
+                                                else object)
+            elif values.dtype != columnArrays[column].dtype:  # the chunks were parsed with different dtypes
+                if values.dtype.kind in 'iuf' and columnArrays[column].dtype.kind in 'iuf':
+                    newDtype = np.result_type(values.dtype, columnArrays[column].dtype)
+                else:
+                    newDtype = np.dtype(object)
+                if newDtype != columnArrays[column].dtype:
+                    columnArrays[column] = columnArrays[column].astype(newDtype)
+            columnArrays[column][positions] = values
+
+    return pd.DataFrame(columnArrays, columns=listColumns, copy=False)
 
 
 def exportCSV(csv_path: str, list_write: []):
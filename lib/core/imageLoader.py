@@ -0,0 +1,122 @@
+import collections
+import concurrent.futures
+
+import cv2
+import numpy as np
+
+import lib.core.lazyImport as lazyImport
+
+# The heavy backends are imported when a method which needs them is first used
+tf = lazyImport.LazyModule('tensorflow')
+
+IL_DEFAULT_BATCH_SIZE = 32
+IL_DEFAULT_PREFETCH_BATCHES = 2  # the batches which are decoded while the current batch is used
+IL_DEFAULT_NUMBER_OF_THREADS = None  # None = the default of ThreadPoolExecutor
+IL_IMAGE_CHANNELS = 3
+
+# *************************************************************************************************** #
+
+
+def readImage(imagePath: str, width: int, height: int):
+    """
+    Read an image (BGR, the same as cv2.imread) and resize it to the input layer resolution.
+    :param imagePath: the path of the image
+    :param width: the output width
+    :param height: the output height
+    :return: a float32 array (height x width x 3)
+    """
+    img = cv2.imread(imagePath, cv2.IMREAD_COLOR)
+    if img is None:
+        raise ValueError('Cannot read the image: ' + str(imagePath))
+    if img.shape[0] != height or img.shape[1] != width:
+        img = cv2.resize(img, (width, height), interpolation=cv2.INTER_LINEAR)
+    return img.astype(np.float32)
+
+
+class ImageBatchLoader:
+    """
+    Stream the images of a dataset in batches (like tf.data): the images are decoded and resized in a thread
+    pool (cv2 releases the GIL), a few batches are prefetched while the current one is used and only these
+    batches are in memory, so the whole dataset never has to be loaded at once.
+    """
+    def __init__(self, imagePaths: [], labels: [], width: int, height: int, batchSize=IL_DEFAULT_BATCH_SIZE,
+                 shuffle=False, numOfThreads=IL_DEFAULT_NUMBER_OF_THREADS,
+                 prefetchBatches=IL_DEFAULT_PREFETCH_BATCHES):
+        """
+        :param imagePaths: the paths of the images
+        :param labels: the label of each image (e.g. the one-hot class codes)
+        :param width: the width of the input layer (the images are resized to it)
+        :param height: the height of the input layer
+        :param batchSize: the number of images of each batch
+        :param shuffle: shuffle the images at the start of each pass
+        :param numOfThreads: the number of decoding threads (None = the default of ThreadPoolExecutor)
+        :param prefetchBatches: the number of batches which are decoded ahead
+        """
+        self.imagePaths = np.asarray(imagePaths, dtype=object)
+        self.labels = np.asarray(labels, dtype=np.float32)
+        if self.imagePaths.shape[0] != self.labels.shape[0]:
+            raise ValueError('The number of images and labels must be the same')
+        self.width = width
+        self.height = height
+        self.batchSize = max(1, batchSize)
+        self.shuffle = shuffle
+        self.numOfThreads = numOfThreads
+        self.prefetchBatches = max(0, prefetchBatches)
+
+    def __len__(self):
+        """
+        :return: the number of batches
+        """
+        return int(np.ceil(self.imagePaths.shape[0] / self.batchSize))
+
+    def __iter__(self):
+        return self.batches()
+
+    @property
+    def shape(self):
+        """
+        :return: the shape of the (virtual) image array (images x height x width x channels)
+        """
+        return self.imagePaths.shape[0], self.height, self.width, IL_IMAGE_CHANNELS
+
+    def batches(self, shuffle=None):
+        """
+        A generator of the batches (the decoding of the next batches runs while a batch is used).
+        :param shuffle: shuffle the images (None = the shuffle of the loader)
+        :return: yields (images (batch x height x width x 3, float32), labels (batch x ...))
+        """
+        shuffle = self.shuffle if shuffle is None else shuffle
+        indexes = np.random.permutation(self.imagePaths.shape[0]) if shuffle else np.arange(self.imagePaths.shape[0])
+        batchIndexes = [indexes[start:start + self.batchSize] for start in range(0, indexes.shape[0], self.batchSize)]
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.numOfThreads) as executor:
+            pendingBatches = collections.deque()  # [(indexes, [futures])] in batch order
+            for batchNumber in range(0, batchIndexes.__len__()):
+                # Submit the batches up to prefetchBatches ahead of the current one
+                while pendingBatches.__len__() <= self.prefetchBatches and \
+                        batchNumber + pendingBatches.__len__() < batchIndexes.__len__():
+                    nextIndexes = batchIndexes[batchNumber + pendingBatches.__len__()]
+                    pendingBatches.append((nextIndexes, [executor.submit(readImage, self.imagePaths[_index_],
+                                                                         self.width, self.height)
+                                                         for _index_ in nextIndexes]))
+                currentIndexes, futures = pendingBatches.popleft()
+                images = np.empty((currentIndexes.shape[0], self.height, self.width, IL_IMAGE_CHANNELS),
+                                  dtype=np.float32)
+                for _index_, _future_ in enumerate(futures):
+                    images[_index_] = _future_.result()
+                yield images, self.labels[currentIndexes]
+
+    def toTfDataset(self, repeat=False, shuffle=None):
+        """
+        :param repeat: repeat the passes forever (e.g. for model.fit with steps_per_epoch)
+        :param shuffle: shuffle the images (None = the shuffle of the loader)
+        :return: a tf.data.Dataset of the batches
+        """
+        dataset = tf.data.Dataset.from_generator(
+            lambda: self.batches(shuffle),
+            output_signature=(tf.TensorSpec(shape=(None, self.height, self.width, IL_IMAGE_CHANNELS),
+                                            dtype=tf.float32),
+                              tf.TensorSpec(shape=(None,) + self.labels.shape[1:], dtype=tf.float32)))
+        if repeat:
+            dataset = dataset.repeat()
+        return dataset
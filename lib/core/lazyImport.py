@@ -0,0 +1,41 @@
+import importlib
+import threading
+
+# *************************************************************************************************** #
+
+
+class LazyModule:
+    """
+    A module which is imported the first time one of its attributes is used (e.g. keras.layers), so the heavy
+    backends (tensorflow, keras_tuner, pmdarima) don't slow down the start of the application when the methods
+    which need them are not used.
+    """
+    def __init__(self, moduleName: str):
+        """
+        :param moduleName: the full name of the module (e.g. 'tensorflow.keras')
+        """
+        self._moduleName = moduleName
+        self._module = None
+        self._lock = threading.Lock()  # the methods can be trained in threads
+
+    def __getattr__(self, name):
+        if name in ('_moduleName', '_module', '_lock'):  # not initialized yet (e.g. copy/unpickle)
+            raise AttributeError(name)
+        return getattr(self.load(), name)
+
+    def __repr__(self):
+        return "<LazyModule '" + self._moduleName + "' (" + ("loaded" if self.isLoaded() else "not loaded") + ")>"
+
+    def isLoaded(self):
+        return self._module is not None
+
+    def load(self):
+        """
+        Import the module (only the first time).
+        :return: the module
+        """
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    self._module = importlib.import_module(self._moduleName)
+        return self._module
@@ -6,6 +6,8 @@ import numpy as np
 import openpyxl as op
 
 import lib.core.file_manipulation as file_manip
+import lib.core.lazyImport as lazyImport
+import lib.core.imageLoader as imgLoader
 
 from sklearn.metrics import mean_absolute_error, mean_squared_error, max_error
 
@@ -15,9 +17,10 @@ from sklearn.model_selection import (
     # cross_val_score
 )
 
-import tensorflow as tf
-import tensorflow.keras as keras
-import keras_tuner as kt
+# The heavy backends are imported when a method which needs them is first used
+tf = lazyImport.LazyModule('tensorflow')
+keras = lazyImport.LazyModule('tensorflow.keras')
+kt = lazyImport.LazyModule('keras_tuner')
 
 import matplotlib.pyplot as plt
 
@@ -237,21 +240,19 @@ class MachineLearningImageClassification:
         return model
 
     @staticmethod
-    def DeepLearning_RockPaperScissor_CNN(train_x: list, train_y: list, test_x: list, test_y: list,
+    def DeepLearning_RockPaperScissor_CNN(train_data: imgLoader.ImageBatchLoader,
+                                          test_data: imgLoader.ImageBatchLoader,
                                           epochs: int, exportDirectory: str, activation_function_list: []):
 
         # ============================================================================================================== #
         # ============================================================================================================== #
 
-        size_wh = 150
-
-        train_x = tf.image.resize(train_x, [size_wh, size_wh])
-        test_x = tf.image.resize(test_x, [size_wh, size_wh])
-
+        # The images are resized to the input layer by the loaders (while they are read)
         model = keras.models.Sequential([
-            # Note the input shape is the desired size of the image 150x150 with 3 bytes color
+            # Note the input shape is the desired size of the image (e.g. 150x150) with 3 bytes color
             # This is the first convolution
-            keras.layers.Conv2D(64, (3, 3), activation='relu', input_shape=(size_wh, size_wh, 3)),
+            keras.layers.Conv2D(64, (3, 3), activation='relu',
+                                input_shape=(train_data.height, train_data.width, imgLoader.IL_IMAGE_CHANNELS)),
             keras.layers.MaxPooling2D(2, 2),
             # The second convolution
             keras.layers.Conv2D(64, (3, 3), activation='relu'),
@@ -271,7 +272,7 @@ class MachineLearningImageClassification:
         ])
         model.summary()
         model.compile(loss='categorical_crossentropy', optimizer='rmsprop', metrics=['accuracy'])
-        model.fit(train_x, train_y, epochs=epochs, steps_per_epoch=20)
+        model.fit(train_data.toTfDataset(repeat=True), epochs=epochs, steps_per_epoch=20)
 
         # history = model.fit(train_x, train_y, epochs=epochs, steps_per_epoch=20)
         # acc = history.history['accuracy']
@@ -299,9 +300,15 @@ class MachineLearningImageClassification:
     # ************************ #
     # ***** MAIN EXECUTE ***** #
     # ************************ #
-    def fit(self, X_TrainVal: np.ndarray, y_TrainVal: np.ndarray,
-            X_Test: np.ndarray, y_Test: np.ndarray, exportFolder=PATH_DEFAULT_EXPORT_DATA,
-            validationPercentage: float = 0.25):
+    def fit(self, trainValLoader: imgLoader.ImageBatchLoader, testLoader: imgLoader.ImageBatchLoader,
+            exportFolder=PATH_DEFAULT_EXPORT_DATA, validationPercentage: float = 0.25):
+        """
+        :param trainValLoader: the loader of the train-validation images (and labels)
+        :param testLoader: the loader of the test images (and labels)
+        :param exportFolder: the folder to export the models and the scores
+        :param validationPercentage: the validation percentage
+        :return: the paths of the models, the export folder and the workbook folder
+        """
         # Set variables
         currentDatetime = dt.datetime.now().strftime("%d%m%Y_%H%M%S")  # Find Current Datetime
         errorFileName = 'PerformanceScores.xlsx'  # The file name to store the Performance Scores
@@ -318,10 +325,10 @@ class MachineLearningImageClassification:
 
         workbookFilePath = workbookDirPath + errorFileName
 
-        inputData_TrainVal = X_TrainVal  # store X_TrainVal to a new variable
-        outputData_TrainVal = y_TrainVal  # store y_TrainVal to a new variable
-        inputData_Test = X_Test  # store X_Test to a new variable
-        outputData_Test = y_Test  # store y_Test to a new variable
+        inputData_TrainVal = trainValLoader  # the images are streamed in batches (never all in memory)
+        outputData_TrainVal = trainValLoader.labels
+        inputData_Test = testLoader
+        outputData_Test = testLoader.labels
 
         inputData_TrainVal_Shape = inputData_TrainVal.shape  # take the shape of inputTrainVal
         outputData_TrainVal_Shape = outputData_TrainVal.shape  # take the shape of outputTrainVal
@@ -415,9 +422,7 @@ class MachineLearningImageClassification:
                         MLR_KEY_ACTIVATION_FUNCTION]
 
                     model = self._MLR_dictMethods[_methodKey_][MLR_KEY_METHOD](inputData_TrainVal,
-                                                                               outputData_TrainVal,
                                                                                inputData_Test,
-                                                                               outputData_Test,
                                                                                epochs,
                                                                                exportDeepLearningTunersPath,
                                                                                activationFunctionList
@@ -437,8 +442,9 @@ class MachineLearningImageClassification:
             if model is not None:  # Needs to find a way to keep track the input size <=======
                 # if model is scikit learn model
                 if model not in _MLR_NO_TUNING_LIST:
-                    predTrain = model.predict(inputData_TrainVal)  # make predictions (train)
-                    predTest = model.predict(inputData_Test)  # make predictions (test)
+                    # make predictions (in the order of the labels)
+                    predTrain = model.predict(inputData_TrainVal.toTfDataset(shuffle=False))  # (train)
+                    predTest = model.predict(inputData_Test.toTfDataset(shuffle=False))  # (test)
                     realTrain = outputData_TrainVal.copy()
                     realTest = outputData_Test.copy()
                     realTrain = np.array(realTrain).T
@@ -1,16 +1,18 @@
 import os
+import threading
+import concurrent.futures
 import datetime as dt
 
 import joblib
 import numpy as np
-import openpyxl as op
 
 import pandas as pd
 import matplotlib.pyplot as plt
 
 import lib.core.file_manipulation as file_manip
-
-from sklearn.metrics import mean_absolute_error, mean_squared_error, max_error
+import lib.core.workbookSink as wbSink
+import lib.core.regressionMetrics as regMetrics
+import lib.core.lazyImport as lazyImport
 
 from sklearn.linear_model import (
     LinearRegression,
@@ -48,12 +50,10 @@ from sklearn.model_selection import (
     # cross_val_score
 )
 
-from statsmodels.tsa.arima.model import ARIMA
-
-from pmdarima import auto_arima
-
-import tensorflow.keras as keras
-import keras_tuner as kt
+# The heavy backends are imported when a method which needs them is first used
+pmdarima = lazyImport.LazyModule('pmdarima')
+keras = lazyImport.LazyModule('tensorflow.keras')
+kt = lazyImport.LazyModule('keras_tuner')
 
 PATH_DEFAULT_EXPORT_DATA = os.path.normpath(file_manip.PATH_DOCUMENTS + '/MachineLearningRegression')
 DEBUG_MESSAGES = True
@@ -249,6 +249,7 @@ DMLR_ACTIVATION_FUNCTIONS = [
     # 'exponential'
 ]
 DMLR_EPOCHS = 500
+DMLR_PREDICT_BATCH_SIZE = 1024  # the (fixed) batch size of the keras predictions
 
 
 #                                          #
@@ -264,6 +265,8 @@ class MachineLearningRegression:
         self._MLR_KEY_STEP = 'step'
         self._MLR_KEY_STATE = 'state'
 
+        self._MLR_numberOfJobs = -1  # the cores used by GridSearchCV (-1 = all the cores)
+
         #########################################
         # ***** MACHINE LEARNING DEFAULTS ***** #
         #                                       #
@@ -870,6 +873,18 @@ class MachineLearningRegression:
         for _method_ in _MLR_3RD_DIM_DEEP_METHODS:
             self._MLR_dictMethods[_method_][MLR_KEY_3RD_DIM_SIZE] = dimSize
 
+    def setNumberOfJobs(self, numberOfJobs: int):
+        self._MLR_numberOfJobs = numberOfJobs
+
+    def getNumberOfJobs(self):
+        return self._MLR_numberOfJobs
+
+    def setMethodState(self, methodKey: str, state: bool):
+        self._MLR_dictMethods[methodKey][self._MLR_KEY_STATE] = state
+
+    def getMethodState(self, methodKey: str):
+        return self._MLR_dictMethods[methodKey][self._MLR_KEY_STATE]
+
     # ****** LINEAR_REGRESSION ***** #
     def setLinearRegression_state(self, state: bool):
         self._MLR_dictMethods[MLR_REG_LINEAR_REGRESSION][self._MLR_KEY_STATE] = state
@@ -1109,9 +1124,165 @@ class MachineLearningRegression:
     # ************************ #
     # ***** MAIN EXECUTE ***** #
     # ************************ #
+    def _fitMethod(self, methodKey, numberOfJobs, inputData_TrainVal, outputData_TrainVal, inputData_Test,
+                   outputData_Test, exportTrainedModelsPath, exportDeepLearningTunersPath, currentDatetime):
+        """
+        Train (and export) a method.
+        :param methodKey: the method to be trained
+        :param numberOfJobs: the cores used by the GridSearchCV of the method
+        :return: model, modelExportPath (None if the method has not been exported)
+        """
+        model = None  # a parameter to store the model
+        modelExportPath = None  # the path of the exported model
+
+        if methodKey in _MLR_NO_TUNING_LIST:  # if method cannot be tuning (e.g. LinearRegression)
+            if self._MLR_dictMethods[methodKey][self._MLR_KEY_STATE]:
+                print(
+                    file_manip.getCurrentDatetimeForConsole() + "::Training " + methodKey + "...")  # console message
+                model = self._MLR_dictMethods[methodKey][MLR_KEY_METHOD]
+                model.fit(inputData_TrainVal,
+                          outputData_TrainVal)  # model.fit()
+                print(file_manip.getCurrentDatetimeForConsole() + "::...COMPLETED!")  # console message
+                # Export model
+                modelExportPath = os.path.normpath(exportTrainedModelsPath + methodKey + '_' +
+                                                   currentDatetime + H5_SUFFIX)
+                joblib.dump(model, modelExportPath)
+                print(file_manip.getCurrentDatetimeForConsole() + "::Model exported at: ", modelExportPath)
+                self._MLR_dictMethods[methodKey][MLR_KEY_TRAINED_MODEL] = model
+
+        elif methodKey in _MLR_TUNING_NON_DEEP_METHODS:  # elif method is not a tf.keras
+            if self._MLR_dictMethods[methodKey][self._MLR_KEY_STATE]:
+                print(
+                    file_manip.getCurrentDatetimeForConsole() + "::Training " + methodKey + "..")  # console message
+                # run Grid Search CV
+                model = GridSearchCV(self._MLR_dictMethods[methodKey][MLR_KEY_METHOD],
+                                     self._MLR_dictMethods[methodKey][MLR_KEY_PARAM_GRID],
+                                     n_jobs=numberOfJobs)
+                model.fit(inputData_TrainVal,
+                          outputData_TrainVal)  # model.fit()
+                print(file_manip.getCurrentDatetimeForConsole() + "::...COMPLETED!")  # console message
+                self._MLR_dictMethods[methodKey][MLR_KEY_TRAINED_MODEL] = model.best_estimator_
+
+                # Export model
+                modelExportPath = os.path.normpath(exportTrainedModelsPath + methodKey + '_' +
+                                                   currentDatetime + H5_SUFFIX)
+                joblib.dump(model, modelExportPath)
+                print(file_manip.getCurrentDatetimeForConsole() + "::Model exported at: ", modelExportPath)
+                print(file_manip.getCurrentDatetimeForConsole() + "::Best Estimator = ", model.best_estimator_)
+                print(file_manip.getCurrentDatetimeForConsole() + "::Best Score = ", model.best_score_)
+
+        elif methodKey in _MLR_OTHER_METHODS:
+            if self._MLR_dictMethods[methodKey][self._MLR_KEY_STATE]:
+                print(
+                    file_manip.getCurrentDatetimeForConsole() + "::Training " + methodKey + "..")  # console message
+                if self._MLR_dictMethods[methodKey][MLR_KEY_METHOD] is None:
+                    if methodKey == MLR_REG_ARIMA:
+                        for i in range(outputData_TrainVal.T.shape[0]):
+                            model = pmdarima.auto_arima(outputData_TrainVal.T[i], trace=True,
+                                                        suppress_warnings=True)
+                            model_fit = model.fit(outputData_TrainVal.T[i])
+                            residuals = pd.DataFrame(model_fit.resid())
+                            residuals.plot(title="Residuals")
+                            plt.savefig('fig.png')
+
+                print(file_manip.getCurrentDatetimeForConsole() + "::...COMPLETED!")
+                self._MLR_dictMethods[methodKey][MLR_KEY_TRAINED_MODEL] = model
+
+        elif methodKey in _MLR_TUNING_DEEP_METHODS:  # elif method is keras
+            if self._MLR_dictMethods[methodKey][self._MLR_KEY_STATE]:
+                print(
+                    file_manip.getCurrentDatetimeForConsole() + "::Training " + methodKey + "..")  # console message
+
+                epochs = self._MLR_dictMethods[methodKey][MLR_KEY_PARAM_GRID][MLR_KEY_NUMBER_OF_EPOCHS]
+                # epochs = 500
+                activationFunctionList = self._MLR_dictMethods[methodKey][MLR_KEY_PARAM_GRID][
+                    MLR_KEY_ACTIVATION_FUNCTION]
+
+                model = self._MLR_dictMethods[methodKey][MLR_KEY_METHOD](inputData_TrainVal,
+                                                                           outputData_TrainVal,
+                                                                           inputData_Test,
+                                                                           outputData_Test,
+                                                                           epochs,
+                                                                           exportDeepLearningTunersPath,
+                                                                           activationFunctionList
+                                                                           )
+                print(file_manip.getCurrentDatetimeForConsole() + "::...COMPLETED!")  # console message
+                # Export model
+                modelExportPath = os.path.normpath(exportTrainedModelsPath + methodKey + '_' +
+                                                   currentDatetime + H5_SUFFIX)
+                print(file_manip.getCurrentDatetimeForConsole() + "::Model exported at: ", modelExportPath)
+                self._MLR_dictMethods[methodKey][MLR_KEY_TRAINED_MODEL] = model
+                self._MLR_dictMethods[methodKey][MLR_KEY_TRAINED_MODEL].save(modelExportPath)
+
+
+        return model, modelExportPath
+
+    def _fitMethods(self, inputData_TrainVal, outputData_TrainVal, inputData_Test, outputData_Test,
+                    exportTrainedModelsPath, exportDeepLearningTunersPath, currentDatetime,
+                    progressFunc=None, isCancelledFunc=None):
+        """
+        Train the methods in two lanes. The scikit-learn methods are independent, so they run concurrently in a
+        thread pool and share the core budget (setNumberOfJobs) with their GridSearchCV. The deep learning
+        methods (and Arima, which uses pyplot) run one after the other in their own lane (a core is kept for this
+        lane only if one of them is enabled).
+        :return: a dictionary {methodKey: (model, modelExportPath)} (the cancelled methods are not in it)
+        """
+        numberOfCores = self._MLR_numberOfJobs if self._MLR_numberOfJobs > 0 else (os.cpu_count() or 1)
+        sklearnMethods = [_methodKey_ for _methodKey_ in self._MLR_dictMethods.keys()
+                          if _methodKey_ in _MLR_NO_TUNING_LIST + _MLR_TUNING_NON_DEEP_METHODS and
+                          self._MLR_dictMethods[_methodKey_][self._MLR_KEY_STATE]]
+        serialMethods = [_methodKey_ for _methodKey_ in self._MLR_dictMethods.keys()
+                         if _methodKey_ in _MLR_OTHER_METHODS + _MLR_TUNING_DEEP_METHODS and
+                         self._MLR_dictMethods[_methodKey_][self._MLR_KEY_STATE]]
+        if serialMethods.__len__() > 0 and numberOfCores > 1:
+            numberOfCores -= 1  # keep a core for the deep learning lane
+        numberOfParallelMethods = max(1, min(numberOfCores, sklearnMethods.__len__()))
+        numberOfJobsPerMethod = max(1, numberOfCores // numberOfParallelMethods)
+
+        methodsSize = sklearnMethods.__len__() + serialMethods.__len__()
+        methodCounter = [0]  # a list to be changed inside fitTask
+        progressLock = threading.Lock()
+
+        def fitTask(methodKey, numberOfJobs):
+            # Check if the user cancelled the execution (the methods which haven't started are skipped)
+            if isCancelledFunc is not None and isCancelledFunc():
+                return None
+            with progressLock:
+                if progressFunc is not None:
+                    progressFunc('Train ' + methodKey, methodCounter[0], methodsSize)
+                methodCounter[0] += 1
+            return self._fitMethod(methodKey, numberOfJobs, inputData_TrainVal, outputData_TrainVal,
+                                   inputData_Test, outputData_Test, exportTrainedModelsPath,
+                                   exportDeepLearningTunersPath, currentDatetime)
+
+        dictFutures = {}
+        with concurrent.futures.ThreadPoolExecutor(max_workers=1) as serialExecutor, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=numberOfParallelMethods) as sklearnExecutor:
+            for _methodKey_ in serialMethods:  # a single worker runs them in order
+                dictFutures[_methodKey_] = serialExecutor.submit(fitTask, _methodKey_, numberOfJobsPerMethod)
+            for _methodKey_ in sklearnMethods:
+                dictFutures[_methodKey_] = sklearnExecutor.submit(fitTask, _methodKey_, numberOfJobsPerMethod)
+
+        dictTrainedModels = {}
+        for _methodKey_ in self._MLR_dictMethods.keys():  # deterministic order (the order of the methods)
+            if _methodKey_ in dictFutures.keys():
+                result = dictFutures[_methodKey_].result()  # raise the errors of the methods
+                if result is not None:
+                    dictTrainedModels[_methodKey_] = result
+
+        if isCancelledFunc is not None and isCancelledFunc():
+            print(file_manip.getCurrentDatetimeForConsole() + "::Training Cancelled!")
+        return dictTrainedModels
+
     def fit(self, X_TrainVal: np.ndarray, y_TrainVal: np.ndarray,
             X_Test: np.ndarray, y_Test: np.ndarray, exportFolder=PATH_DEFAULT_EXPORT_DATA,
-            validationPercentage: float = 0.25):
+            validationPercentage: float = 0.25, progressFunc=None, isCancelledFunc=None):
+        """
+        Train all the enabled methods and export the models and the performance scores.
+        :param progressFunc: a function (stage, current, total) called before each method (or None)
+        :param isCancelledFunc: a function which returns True to skip the methods which haven't started (or None)
+        :return: listStr_ModelPaths, exportBaseDir, workbookDirPath
+        """
         # Set variables
         currentDatetime = dt.datetime.now().strftime("%d%m%Y_%H%M%S")  # Find Current Datetime
         errorFileName = 'PerformanceScores.xlsx'  # The file name to store the Performance Scores
@@ -1127,6 +1298,7 @@ class MachineLearningRegression:
                                            currentDatetime) + '/'
 
         workbookFilePath = workbookDirPath + errorFileName
+        workbookSink = wbSink.WorkbookSink(workbookFilePath)  # collect the performance scores of the methods
 
         inputData_TrainVal = X_TrainVal  # store X_TrainVal to a new variable
         outputData_TrainVal = y_TrainVal  # store y_TrainVal to a new variable
@@ -1168,97 +1340,23 @@ class MachineLearningRegression:
             print("Validation_Indexes_Length = ", valIdxs.__len__())
         # ****************************************************************** #
 
-        for _methodKey_ in self._MLR_dictMethods.keys():  # for each method
-            model = None  # a parameter to store the model
+        # Train the enabled methods (independent methods run concurrently, see _fitMethods)
+        dictTrainedModels = self._fitMethods(inputData_TrainVal, outputData_TrainVal, inputData_Test, outputData_Test,
+                                             exportTrainedModelsPath, exportDeepLearningTunersPath, currentDatetime,
+                                             progressFunc=progressFunc, isCancelledFunc=isCancelledFunc)
+
+        for _methodKey_ in self._MLR_dictMethods.keys():  # export the results in the order of the methods
+            if _methodKey_ not in dictTrainedModels.keys():  # not trained (cancelled)
+                continue
+            model, modelExportPath = dictTrainedModels[_methodKey_]
+            if modelExportPath is not None:
+                listStr_ModelPaths.append(modelExportPath)
             modelName = _methodKey_  # store the methodKey to modelName
             realTrain = None  # a parameter to store the real expanded y_Train values
             realTest = None  # a parameter to store the real expanded y_Test values
             predTrain = None  # a parameter to store the predicted y_Train values
             predTest = None  # a parameter to store the predicted y_Test values
 
-            if _methodKey_ in _MLR_NO_TUNING_LIST:  # if method cannot be tuning (e.g. LinearRegression)
-                if self._MLR_dictMethods[_methodKey_][self._MLR_KEY_STATE]:
-                    print(
-                        file_manip.getCurrentDatetimeForConsole() + "::Training " + _methodKey_ + "...")  # console message
-                    model = self._MLR_dictMethods[_methodKey_][MLR_KEY_METHOD]
-                    model.fit(inputData_TrainVal,
-                              outputData_TrainVal)  # model.fit()
-                    print(file_manip.getCurrentDatetimeForConsole() + "::...COMPLETED!")  # console message
-                    # Export model
-                    modelExportPath = os.path.normpath(exportTrainedModelsPath + modelName + '_' +
-                                                       currentDatetime + H5_SUFFIX)
-                    listStr_ModelPaths.append(modelExportPath)
-                    joblib.dump(model, modelExportPath)
-                    print(file_manip.getCurrentDatetimeForConsole() + "::Model exported at: ", modelExportPath)
-                    self._MLR_dictMethods[_methodKey_][MLR_KEY_TRAINED_MODEL] = model
-
-            elif _methodKey_ in _MLR_TUNING_NON_DEEP_METHODS:  # elif method is not a tf.keras
-                if self._MLR_dictMethods[_methodKey_][self._MLR_KEY_STATE]:
-                    print(
-                        file_manip.getCurrentDatetimeForConsole() + "::Training " + _methodKey_ + "..")  # console message
-                    # run Grid Search CV
-                    model = GridSearchCV(self._MLR_dictMethods[_methodKey_][MLR_KEY_METHOD],
-                                         self._MLR_dictMethods[_methodKey_][MLR_KEY_PARAM_GRID],
-                                         n_jobs=-1)
-                    model.fit(inputData_TrainVal,
-                              outputData_TrainVal)  # model.fit()
-                    print(file_manip.getCurrentDatetimeForConsole() + "::...COMPLETED!")  # console message
-                    self._MLR_dictMethods[_methodKey_][MLR_KEY_TRAINED_MODEL] = model.best_estimator_
-
-                    # Export model
-                    modelExportPath = os.path.normpath(exportTrainedModelsPath + modelName + '_' +
-                                                       currentDatetime + H5_SUFFIX)
-                    listStr_ModelPaths.append(modelExportPath)
-                    joblib.dump(model, modelExportPath)
-                    print(file_manip.getCurrentDatetimeForConsole() + "::Model exported at: ", modelExportPath)
-                    print(file_manip.getCurrentDatetimeForConsole() + "::Best Estimator = ", model.best_estimator_)
-                    print(file_manip.getCurrentDatetimeForConsole() + "::Best Score = ", model.best_score_)
-
-            elif _methodKey_ in _MLR_OTHER_METHODS:
-                print(
-                    file_manip.getCurrentDatetimeForConsole() + "::Training " + _methodKey_ + "..")  # console message
-                if self._MLR_dictMethods[_methodKey_][MLR_KEY_METHOD] is None:
-                    if _methodKey_ == MLR_REG_ARIMA:
-                        for i in range(outputData_TrainVal.T.shape[0]):
-                            model = auto_arima(outputData_TrainVal.T[i], trace=True, suppress_warnings=True)
-                            model_fit = model.fit(outputData_TrainVal.T[i])
-                            residuals = pd.DataFrame(model_fit.resid())
-                            residuals.plot(title="Residuals")
-                            plt.savefig('fig.png')
-
-                print(file_manip.getCurrentDatetimeForConsole() + "::...COMPLETED!")
-                self._MLR_dictMethods[_methodKey_][MLR_KEY_TRAINED_MODEL] = model
-
-            elif _methodKey_ in _MLR_TUNING_DEEP_METHODS:  # elif method is keras
-                if self._MLR_dictMethods[_methodKey_][self._MLR_KEY_STATE]:
-                    print(
-                        file_manip.getCurrentDatetimeForConsole() + "::Training " + _methodKey_ + "..")  # console message
-
-                    epochs = self._MLR_dictMethods[_methodKey_][MLR_KEY_PARAM_GRID][MLR_KEY_NUMBER_OF_EPOCHS]
-                    # epochs = 500
-                    activationFunctionList = self._MLR_dictMethods[_methodKey_][MLR_KEY_PARAM_GRID][
-                        MLR_KEY_ACTIVATION_FUNCTION]
-
-                    model = self._MLR_dictMethods[_methodKey_][MLR_KEY_METHOD](inputData_TrainVal,
-                                                                               outputData_TrainVal,
-                                                                               inputData_Test,
-                                                                               outputData_Test,
-                                                                               epochs,
-                                                                               exportDeepLearningTunersPath,
-                                                                               activationFunctionList
-                                                                               )
-                    print(file_manip.getCurrentDatetimeForConsole() + "::...COMPLETED!")  # console message
-                    # Export model
-                    modelExportPath = os.path.normpath(exportTrainedModelsPath + modelName + '_' +
-                                                       currentDatetime + H5_SUFFIX)
-                    listStr_ModelPaths.append(modelExportPath)
-                    print(file_manip.getCurrentDatetimeForConsole() + "::Model exported at: ", modelExportPath)
-                    self._MLR_dictMethods[_methodKey_][MLR_KEY_TRAINED_MODEL] = model
-                    self._MLR_dictMethods[_methodKey_][MLR_KEY_TRAINED_MODEL].save(modelExportPath)
-
-            else:
-                pass
-
             if model is not None:
                 # if model is scikit learn model
                 if model not in _MLR_NO_TUNING_LIST:
@@ -1279,36 +1377,15 @@ class MachineLearningRegression:
                 else:
                     pass
 
-                # pre-allocating results array for raw predicted values
-                # PerObservationPoint
-                errorMAE_Train = np.zeros(outputData_TrainVal_Shape[1])
-                errorMSE_Train = np.zeros(outputData_TrainVal_Shape[1])
-                errorMaxError_Train = np.zeros(outputData_TrainVal_Shape[1])
-                errorMAE_Test = np.zeros(outputData_Test_Shape[1])
-                errorMSE_Test = np.zeros(outputData_Test_Shape[1])
-                errorMaxError_Test = np.zeros(outputData_Test_Shape[1])
-
-                # print(outputData_TrainVal_Shape[1])
-                for _index_ in range(0, outputData_TrainVal_Shape[1]):
-                    # normalized first
-                    errorMAE_Train[_index_] = \
-                        mean_absolute_error(realTrain[_index_],
-                                            predTrain[_index_])
-                    errorMSE_Train[_index_] = \
-                        mean_squared_error(realTrain[_index_],
-                                           predTrain[_index_])
-                    errorMaxError_Train[_index_] = \
-                        max_error(realTrain[_index_],
-                                  predTrain[_index_])
-                    errorMAE_Test[_index_] = \
-                        mean_absolute_error(realTest[_index_],
-                                            predTest[_index_])
-                    errorMSE_Test[_index_] = \
-                        mean_squared_error(realTest[_index_],
-                                           predTest[_index_])
-                    errorMaxError_Test[_index_] = \
-                        max_error(realTest[_index_],
-                                  predTest[_index_])
+                # Calculate the errors of all the outputs (PerObservationPoint) in a single pass
+                errorsTrain = regMetrics.columnErrors(realTrain.T, predTrain.T)
+                errorsTest = regMetrics.columnErrors(realTest.T, predTest.T)
+                errorMAE_Train = errorsTrain[regMetrics.RM_MAE]
+                errorMSE_Train = errorsTrain[regMetrics.RM_MSE]
+                errorMaxError_Train = errorsTrain[regMetrics.RM_MAX]
+                errorMAE_Test = errorsTest[regMetrics.RM_MAE]
+                errorMSE_Test = errorsTest[regMetrics.RM_MSE]
+                errorMaxError_Test = errorsTest[regMetrics.RM_MAX]
 
                 # Create the list with errors
                 new_row = [modelName]
@@ -1322,12 +1399,8 @@ class MachineLearningRegression:
                 scoresList = [item for sublist in scoresList for item in sublist]  # map sublist to fat list
                 new_row = new_row + scoresList
 
-                # Confirm file exists.
-                # If not, create it, add headers, then append new data
-                try:
-                    wb = op.load_workbook(workbookFilePath)  # load the xlsx file
-                    ws = wb.worksheets[0]  # select first worksheet
-                except FileNotFoundError:
+                # Add the headers to the workbook (with the first row)
+                if not workbookSink.hasHeaders():
                     headers_row = ['Technique']
                     for i in range(0, outputData_TrainVal_Shape[1]):
                         headers_row.append('MAE-Tr-P' + str(i + 1))
@@ -1341,13 +1414,12 @@ class MachineLearningRegression:
                         headers_row.append('MSE-Te-P' + str(i + 1))
                     for i in range(0, outputData_TrainVal_Shape[1]):
                         headers_row.append('maxError-Te-P' + str(i + 1))
-                    wb = op.Workbook()
-                    ws = wb.active
-                    ws.append(headers_row)
-                    wb.save(workbookFilePath)
+                    workbookSink.setHeaders(headers_row)
+
+                workbookSink.append(new_row)
 
-                ws.append(new_row)
-                wb.save(workbookFilePath)
+        if workbookSink.rows().__len__() > 0:
+            workbookSink.save()  # write the workbook once (all the methods)
 
         print(file_manip.getCurrentDatetimeForConsole() + "::Training Finished Successfully!")
         return listStr_ModelPaths, exportBaseDir, workbookDirPath
@@ -1355,15 +1427,68 @@ class MachineLearningRegression:
     def openModel(self, modelPath):
         pass
 
-    def predict(self, x, y):
-        dictModelPredictions = {}
+    def _predictMethod(self, methodKey, x):
+        """
+        Run the trained model of a method on x.
+        :param methodKey: the method
+        :param x: the input array
+        :return: the predictions (numpy array)
+        """
+        model = self._MLR_dictMethods[methodKey][MLR_KEY_TRAINED_MODEL]
+        if methodKey in _MLR_TUNING_DEEP_METHODS:
+            # Pad the rows to a multiple of the batch size, so every batch has the same shape and keras
+            # reuses its compiled (tf.function) predict step instead of tracing the last batch again
+            x = np.asarray(x)
+            numOfRows = x.shape[0]
+            padSize = -numOfRows % DMLR_PREDICT_BATCH_SIZE
+            if padSize > 0:
+                x = np.concatenate([x, np.zeros((padSize,) + x.shape[1:], dtype=x.dtype)])
+            return np.array(model.predict(x, batch_size=DMLR_PREDICT_BATCH_SIZE, verbose=0))[:numOfRows]
+        return np.array(model.predict(x))
+
+    def predictModels(self, x):
+        """
+        Run each enabled model once on x.
+        :param x: the input array
+        :return: a dictionary {methodKey: predictions}
+        """
+        dictPredictions = {}
         for _methodKey_ in self._MLR_dictMethods.keys():
             if self._MLR_dictMethods[_methodKey_][self._MLR_KEY_STATE]:
                 print(_methodKey_ + ' predicts...')
+                dictPredictions[_methodKey_] = self._predictMethod(_methodKey_, x)
+        return dictPredictions
+
+    def predictBatch(self, dictX: dict):
+        """
+        Run each enabled model once on all the arrays of dictX (e.g. the arrays of all the events). The
+        arrays are concatenated, so the models run one large prediction instead of one per array, and the
+        predictions are split back by the offsets of the arrays.
+        :param dictX: a dictionary {key (e.g. the event): x} (the arrays must have the same columns)
+        :return: a dictionary {key: {methodKey: predictions}}
+        """
+        keys = [key for key in dictX.keys()]
+        arrays = [np.asarray(dictX[key]) for key in keys]
+        dictPredictions = {key: {} for key in keys}
+        if keys.__len__() == 0:
+            return dictPredictions
+        offsets = np.cumsum([arr.shape[0] for arr in arrays])[:-1]  # the first row of each array (but the 1st)
+        x = arrays[0] if arrays.__len__() == 1 else np.concatenate(arrays)
+        if x.shape[0] == 0:  # nothing to predict (run the models as without batching)
+            return {key: self.predictModels(dictX[key]) for key in keys}
+
+        dictModelPredictions = self.predictModels(x)
+        for _methodKey_ in dictModelPredictions.keys():
+            for key, pred in zip(keys, np.split(dictModelPredictions[_methodKey_], offsets)):
+                dictPredictions[key][_methodKey_] = pred
+        return dictPredictions
 
-                dictModelPredictions[_methodKey_] = {}
-                dictModelPredictions[_methodKey_]['real'] = y
-                dictModelPredictions[_methodKey_]['pred'] = np.array(
-                    self._MLR_dictMethods[_methodKey_][MLR_KEY_TRAINED_MODEL].predict(x))
+    def predict(self, x, y):
+        dictModelPredictions = {}
+        dictPredictions = self.predictModels(x)
+        for _methodKey_ in dictPredictions.keys():
+            dictModelPredictions[_methodKey_] = {}
+            dictModelPredictions[_methodKey_]['real'] = y
+            dictModelPredictions[_methodKey_]['pred'] = dictPredictions[_methodKey_]
 
         return dictModelPredictions
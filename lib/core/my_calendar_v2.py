@@ -19,8 +19,11 @@ Let's say we need to export it to excel:
 """
 
 import datetime as dt
+import functools
 import warnings
 
+import numpy as np
+
 # Create lists that corresponds to date, time strings
 # Create list for months
 # One digit months
@@ -83,6 +86,13 @@ M_YY_D = 'myyd'  # e.g. 12/21/1
 YY_M_D = 'yymd'  # e.g. 21/12/1
 YY_D_M = 'yydm'  # e.g. 21/1/12
 
+list_date_formats = [DD_MM_YYYY, DD_YYYY_MM, MM_DD_YYYY, MM_YYYY_DD, YYYY_MM_DD, YYYY_DD_MM,
+                     D_M_YYYY, D_YYYY_M, M_D_YYYY, M_YYYY_D, YYYY_M_D, YYYY_D_M,
+                     DD_MM_YY, DD_YY_MM, MM_DD_YY, MM_YY_DD, YY_MM_DD, YY_DD_MM,
+                     D_M_YY, D_YY_M, M_D_YY, M_YY_D, YY_M_D, YY_D_M]
+
+DATE_CACHE_SIZE = 4096  # the number of date strings which are remembered by the date parser
+
 # Date Formats
 SINGLE = 'single'  # Single date formats (e.g. dmyy)
 DOUBLE = 'double'  # Double date formats (e.g. ddmmyyyy)
@@ -153,8 +163,7 @@ def write_csv(csv_path: str, list_write: [], delimiter=del_comma):
 
     with open(csv_path, 'w', newline='') as csvfile:  # Open the path to write the file
         csv_writer = csv.writer(csvfile, delimiter=delimiter, quotechar='|', quoting=csv.QUOTE_MINIMAL)
-        for row in list_write:  # For each row
-            csv_writer.writerow(row)  # Write row to file
+        csv_writer.writerows(list_write)  # Write all the rows to file
 
 
 # ------------------------------------------- #
@@ -451,12 +460,11 @@ def set_date_format(day: str, month: str, year: str, date_format=DD_MM_YYYY, dat
 def change_date_format_in_list(list_event: [], date_index, date_format_from: str, date_format_to: str,
                                date_delimiter_from=del_slash, date_delimiter_to=del_slash, century=21):
     list_date_new = []  # list for new dates
-    for event in list_event:  # parsing all events in list
-        day, month, year = date_break_to_day_month_year(date=event[date_index], date_format=date_format_from,
-                                                        date_delimiter=date_delimiter_from, century=century)
-
-        date_tmp = set_date_format(day=day, month=month, year=year,
-                                   date_format=date_format_to, date_delimiter=date_delimiter_to)
+    list_dates = change_date_format_of_list([event[date_index] for event in list_event],
+                                            date_format_from=date_format_from, date_format_to=date_format_to,
+                                            date_delimiter_from=date_delimiter_from,
+                                            date_delimiter_to=date_delimiter_to, century=century)
+    for event, date_tmp in zip(list_event, list_dates):  # parsing all events in list
         event[date_index] = date_tmp
         list_date_new.append(event)
 
@@ -472,6 +480,91 @@ def change_date_format_from_string(str_date: str, date_format_from: str, date_fo
     return new_date
 
 
+@functools.lru_cache(maxsize=DATE_CACHE_SIZE)
+def _date_to_int_day_month_year(date: str, date_format: str, date_delimiter: str, century: int):
+    day, month, year = date_break_to_day_month_year(date=date, date_format=date_format,
+                                                    date_delimiter=date_delimiter, century=century)
+    return int(day), int(month), int(year)
+
+
+def dates_to_datetime64(list_dates: [], date_format: str, date_delimiter=del_slash, century=21):
+    """
+    Parse a column of date strings (each different string is parsed once).
+    :param list_dates: the date strings
+    :param date_format: the date format of the strings (one of list_date_formats)
+    :param date_delimiter: the delimiter of the strings
+    :param century: the current century (for the two digit years)
+    :return: a numpy array of datetime64[D]
+    """
+    if date_format not in list_date_formats:
+        raise ValueError('Unknown date format: ' + str(date_format))
+    dict_unique_dates = {}  # {date: index}
+    inverse = np.array([dict_unique_dates.setdefault(date, len(dict_unique_dates)) for date in list_dates],
+                       dtype=np.int64)
+    try:
+        days_months_years = np.array([_date_to_int_day_month_year(date, date_format, date_delimiter, century)
+                                      for date in dict_unique_dates.keys()], dtype=np.int64).reshape(-1, 3)
+    except (ValueError, AttributeError) as e:
+        raise ValueError('The dates are not in ' + date_format + ' format: ' + str(e))
+    days, months, years = days_months_years[:, 0], days_months_years[:, 1], days_months_years[:, 2]
+
+    array_months = ((years - 1970) * 12 + months - 1).astype('datetime64[M]')
+    unique_dates = array_months.astype('datetime64[D]') + (days - 1)
+    invalid_dates = (months < 1) | (months > 12) | (days < 1) | (unique_dates.astype('datetime64[M]') != array_months)
+    if np.any(invalid_dates):
+        raise ValueError('Invalid date: ' + list(dict_unique_dates.keys())[int(np.argmax(invalid_dates))])
+    return unique_dates[inverse]
+
+
+def datetime64_to_dates(array_dates, date_format=DD_MM_YYYY, date_delimiter=del_slash):
+    """
+    Create the date strings of an array of dates (each different date is formatted once).
+    :param array_dates: the dates (datetime64 values)
+    :param date_format: the date format of the strings (one of list_date_formats)
+    :param date_delimiter: the delimiter of the strings
+    :return: a list of date strings
+    """
+    if date_format not in list_date_formats:
+        raise ValueError('Unknown date format: ' + str(date_format))
+    array_dates = np.asarray(array_dates, dtype='datetime64[D]')
+    unique_dates, inverse = np.unique(array_dates, return_inverse=True)
+    array_months = unique_dates.astype('datetime64[M]')
+    years = unique_dates.astype('datetime64[Y]').astype(np.int64) + 1970
+    months = array_months.astype(np.int64) % 12 + 1
+    days = (unique_dates - array_months.astype('datetime64[D]')).astype(np.int64) + 1
+    unique_strings = np.array([set_date_format(day=str(day), month=str(month), year=str(year),
+                                               date_format=date_format, date_delimiter=date_delimiter)
+                               for day, month, year in zip(days.tolist(), months.tolist(), years.tolist())],
+                              dtype=object)
+    return unique_strings[inverse.reshape(-1)].tolist()
+
+
+def create_list_dates(list_of_years: [], date_format=DD_MM_YYYY, date_delimiter=del_slash):
+    """
+    Create the dates of the calendar years.
+    :param list_of_years: the years (a repeated year is added once)
+    :param date_format: the date format of the strings
+    :param date_delimiter: the delimiter of the strings
+    :return: a list of date strings (in order of the years and the days)
+    """
+    array_dates = np.concatenate([np.arange(np.datetime64('%04d-01-01' % int(year)),
+                                            np.datetime64('%04d-01-01' % (int(year) + 1)), dtype='datetime64[D]')
+                                  for year in list_of_years])
+    list_dates = datetime64_to_dates(array_dates, date_format=date_format, date_delimiter=date_delimiter)
+    return list(dict.fromkeys(list_dates))  # a date exists once (as the keys of a dictionary)
+
+
+def change_date_format_of_list(list_dates: [], date_format_from: str, date_format_to: str,
+                               date_delimiter_from=del_slash, date_delimiter_to=del_slash, century=21):
+    """
+    Change the format of a column of date strings.
+    :return: a list of date strings
+    """
+    return datetime64_to_dates(dates_to_datetime64(list_dates, date_format=date_format_from,
+                                                   date_delimiter=date_delimiter_from, century=century),
+                               date_format=date_format_to, date_delimiter=date_delimiter_to)
+
+
 # ------------------------------------- #
 # ---------- 3) GENERAL USED ---------- #
 # ------------------------------------- #
@@ -578,83 +671,290 @@ def create_string_list_date_range(list_input: [], del_input=del_slash, del_outpu
 
 
 def merge_values_in_date_range_list(list_input: [], date_index: int, date_range_list: [], merge_type=merge_mean,
-                                    del_input=del_slash, del_output=del_slash, del_use=False):
-    import statistics
-
-    def raw_data(in_row):
-        tmp_in_raw_data = []
-        for raw_index in range(0, len(in_row)):
-            if raw_index != date_index:
-                tmp_in_raw_data.append(in_row[raw_index])
-        return tmp_in_raw_data
-
+                                    del_input=del_slash, del_output=del_slash, del_use=False, date_format=None,
+                                    date_delimiter=del_slash, century=21):
+    """
+    Merge the values of the rows of each date range (the ranges include the start and the end date).
+    :param list_input: the rows (a date column and value columns)
+    :param date_index: the index of the date column
+    :param date_range_list: a list of date ranges [[start_date, end_date], ...]
+    :param merge_type: merge_min, merge_max, merge_mean (rounded to 1 decimal) or merge_median
+    :param date_format: the date format of the rows and the ranges (None = the dates are compared as strings,
+                        which is correct only for the YYYY_MM_DD format)
+    :param date_delimiter: the date delimiter of the rows and the ranges
+    :param century: the current century (for the two digit years)
+    :return: a list [[str_date_range, merged_values], ...] (the merged values are empty if no row is in the range)
+    """
     merged_list = []  # Create an empty list
-    tmp_zero_list = []  # create a list with size of data_length - 1 (-1 due to one column is the date column)
-    tmp_list_of_empty_lists = []  # create a list with size of data_length - 1 (-1 due to one column is the date column)
-    for _ in range(len(list_input[0]) - 1):  # append the values
-        tmp_zero_list.append(0.0)
-        tmp_list_of_empty_lists.append([])
+    if len(date_range_list) == 0 or merge_type not in [merge_min, merge_max, merge_mean, merge_median]:
+        return merged_list
+
+    # Convert the dates to ordinals (the row dates and the range dates together)
+    list_dates = [row[date_index] for row in list_input]
+    list_range_dates = [date for date_range in date_range_list for date in date_range[:2]]
+    if date_format is None:
+        ordinals = np.unique(np.array(list_dates + list_range_dates, dtype=str), return_inverse=True)[1].reshape(-1)
+    else:
+        ordinals = dates_to_datetime64(list_dates + list_range_dates, date_format=date_format,
+                                       date_delimiter=date_delimiter, century=century).astype(np.int64)
+    row_ordinals = ordinals[:len(list_dates)]
+    range_ordinals = ordinals[len(list_dates):].reshape(-1, 2)
+
+    # Sort the rows once and find the rows of each range
+    row_sort = np.argsort(row_ordinals, kind='stable')
+    row_ordinals = row_ordinals[row_sort]
+    values = np.empty((len(list_input), max(len(list_input[0]) - 1, 0) if list_input else 0), dtype=object)
+    for row_index, row in enumerate(list_input):
+        values[row_index, :] = [row[index] for index in range(len(row)) if index != date_index]
+    values = values[row_sort]
+    range_starts = np.searchsorted(row_ordinals, range_ordinals[:, 0], side='left')
+    range_ends = np.maximum(np.searchsorted(row_ordinals, range_ordinals[:, 1], side='right'), range_starts)
+    range_sizes = range_ends - range_starts
+
+    # Segmented reductions (reduceat over the pairs [start, end) with a dummy row at the end)
+    if merge_type in [merge_min, merge_max, merge_mean]:
+        if merge_type == merge_mean:
+            reduce_values = values.astype(float)
+            reduce_func = np.add
+        else:
+            reduce_values = values
+            reduce_func = np.minimum if merge_type == merge_min else np.maximum
+        reduce_values = np.concatenate([reduce_values, reduce_values[:1] if len(reduce_values) > 0 else
+                                        np.zeros((1, values.shape[1]), dtype=reduce_values.dtype)])
+        reduce_indexes = np.stack([range_starts, range_ends], axis=1).reshape(-1)
+        merged_values = reduce_func.reduceat(reduce_values, reduce_indexes, axis=0)[::2]
+        if merge_type == merge_mean:
+            merged_values = merged_values / np.maximum(range_sizes, 1)[:, None]
+    else:
+        merged_values = [None] * len(date_range_list)
+        for range_index in np.flatnonzero(range_sizes > 0):
+            range_values = values[range_starts[range_index]:range_ends[range_index]]
+            sorted_values = np.take_along_axis(range_values,
+                                               np.argsort(range_values.astype(float), axis=0, kind='stable'), axis=0)
+            middle = range_sizes[range_index] // 2
+            if range_sizes[range_index] % 2 == 1:
+                merged_values[range_index] = sorted_values[middle].tolist()
+            else:
+                merged_values[range_index] = [(low + high) / 2 for low, high in
+                                              zip(sorted_values[middle - 1].tolist(), sorted_values[middle].tolist())]
 
-    for date_range in date_range_list:  # for each date range
+    for range_index, date_range in enumerate(date_range_list):  # for each date range
         start_date = date_range[0]  # set the start date
         end_date = date_range[1]  # set the end date
         str_date_range = start_date + "_" + end_date  # create a sting with date range
         if del_use:  # if use del then create a sting with date range using the del_input and del_output
             str_date_range = start_date.replace(del_input, del_output) + "_" + end_date.replace(del_input, del_output)
 
-        if merge_type == merge_min:  # if merge type is min
-            tmp_data_min = []  # temporary data list to store the min values
-            for row in list_input:  # for row in list_input
-                if start_date <= row[date_index] <= end_date:  # if date in date range
-                    if start_date == row[date_index]:  # if start date equals to row_date
-                        tmp_data_min = raw_data(in_row=row)  # create the temporary list
-                    else:  # else
-                        tmp_raw_data = raw_data(in_row=row)  # create a temporary list to store row date
-                        for index in range(0, len(tmp_raw_data)):  # for index in range
-                            if tmp_raw_data[index] < tmp_data_min[index]:  # check if the new value is minimum
-                                tmp_data_min[index] = tmp_raw_data[index]  # set the value
-            merged_list.append([str_date_range, tmp_data_min])
-
-        elif merge_type == merge_max:  # if merge type is max
-            tmp_data_max = []  # temporary data list to store the max values
-            for row in list_input:  # for row in list_input
-                if start_date <= row[date_index] <= end_date:  # if date in date range
-                    if start_date == row[date_index]:  # if start date equals to row_date
-                        tmp_data_max = raw_data(in_row=row)  # create the temporary list
-                    else:  # else
-                        tmp_raw_data = raw_data(in_row=row)  # create a temporary list to store row date
-                        for index in range(0, len(tmp_raw_data)):  # for index in range
-                            if tmp_raw_data[index] > tmp_data_max[index]:  # check if the new value is minimum
-                                tmp_data_max[index] = tmp_raw_data[index]  # set the value
-            merged_list.append([str_date_range, tmp_data_max])
-
-        elif merge_type == merge_mean:  # if merge type is mean
-            tmp_data_mean = tmp_zero_list.copy()  # temporary data list to calculate the mean values
-            mean_counter = 0
-            for row in list_input:  # for row in list_input
-                if start_date <= row[date_index] <= end_date:  # if date in date range
-                    mean_counter += 1
-                    tmp_raw_data = raw_data(in_row=row)  # create a temporary list to store row date
-                    for index in range(0, len(tmp_raw_data)):  # for index in range
-                        tmp_data_mean[index] += tmp_raw_data[index]  # add the values
-                    # print(start_date, row[date_index], end_date, tmp_data_mean)
-            tmp_out_mean = [round(x / mean_counter, 1) for x in tmp_data_mean]
-            merged_list.append([str_date_range, tmp_out_mean])
-
-        elif merge_type == merge_median:  # if merge type is median
-            tmp_data_median = tmp_list_of_empty_lists.copy()  # temporary data list to calculate the median values
-            for row in list_input:  # for row in list_input
-                if start_date <= row[date_index] <= end_date:  # if date in date range
-                    tmp_raw_data = raw_data(in_row=row)  # create a temporary list to store row date
-                    for index in range(0, len(tmp_raw_data)):  # for index in range
-                        tmp_data_median[index].append(tmp_raw_data[index])  # add the values
-            for index in range(0, len(tmp_data_median)):
-                tmp_data_median[index] = statistics.median(tmp_data_median[index])
-            merged_list.append([str_date_range, tmp_data_median])
+        if range_sizes[range_index] == 0:  # no rows in the range
+            merged_list.append([str_date_range, []])
+        elif merge_type == merge_mean:
+            merged_list.append([str_date_range, [round(x, 1) for x in merged_values[range_index].tolist()]])
+        elif merge_type == merge_median:
+            merged_list.append([str_date_range, merged_values[range_index]])
+        else:
+            merged_list.append([str_date_range, list(merged_values[range_index])])
 
     return merged_list
 
 
+# Cell types of the calendar store
+CELL_EMPTY = 0  # the event doesn't exist in the row
+CELL_VALUE = 1  # the event has a single value (e.g. add_list_key_event_to_calendar without headers)
+CELL_HEADERS = 2  # the event has a value for each header
+
+
+class CalendarStore:
+    """
+    A columnar store for the calendar values. The rows are the dates (or the date-time pairs if the calendar
+    has time) and the values are stored in numpy arrays, with dictionaries for the keys:
+        values[row, event, header] -> the value of a header of an event
+        single_values[row, event] -> the value of an event without headers
+        cell_type[row, event] -> CELL_EMPTY, CELL_VALUE or CELL_HEADERS
+        cell_order[row, event] -> the insertion order of the event in the row (the order of the dict keys)
+        header_exists[row, event, header] -> True if the header has been set to the event of the row
+    The arrays of the events and the headers grow (doubling their capacity) when new keys are added.
+    """
+    def __init__(self, list_dates: [], list_times=None):
+        self.list_dates = list(list_dates)  # the dates in calendar order
+        self.dict_date_index = {date: index for index, date in enumerate(self.list_dates)}
+        self.list_times = None if list_times is None else list(list_times)  # the times of each date (or None)
+        self.dict_time_index = {} if list_times is None else {time: index for index, time in enumerate(list_times)}
+        self.int_times = 1 if list_times is None else len(list_times)  # the rows of each date
+        self.int_rows = len(self.list_dates) * self.int_times
+
+        self.list_events = []
+        self.dict_event_index = {}
+        self.list_headers = []
+        self.dict_header_index = {}
+        self._order_counter = 0  # the next insertion order
+
+        self.values = np.empty((self.int_rows, 0, 0), dtype=object)
+        self.single_values = np.empty((self.int_rows, 0), dtype=object)
+        self.cell_type = np.zeros((self.int_rows, 0), dtype=np.int8)
+        self.cell_order = np.zeros((self.int_rows, 0), dtype=np.int64)
+        self.header_exists = np.zeros((self.int_rows, 0, 0), dtype=bool)
+
+    # ---------------- #
+    # ----- Keys ----- #
+    # ---------------- #
+    def _reserve(self, int_events: int, int_headers: int):
+        """
+        Grow the arrays (if needed) to store int_events events and int_headers headers.
+        :return: Nothing
+        """
+        cap_events = self.cell_type.shape[1]
+        cap_headers = self.values.shape[2]
+        new_cap_events = cap_events if int_events <= cap_events else max(int_events, 2 * cap_events)
+        new_cap_headers = cap_headers if int_headers <= cap_headers else max(int_headers, 2 * cap_headers)
+        if new_cap_events == cap_events and new_cap_headers == cap_headers:
+            return
+
+        values = np.empty((self.int_rows, new_cap_events, new_cap_headers), dtype=object)
+        values[:, :cap_events, :cap_headers] = self.values
+        header_exists = np.zeros((self.int_rows, new_cap_events, new_cap_headers), dtype=bool)
+        header_exists[:, :cap_events, :cap_headers] = self.header_exists
+        single_values = np.empty((self.int_rows, new_cap_events), dtype=object)
+        single_values[:, :cap_events] = self.single_values
+        cell_type = np.zeros((self.int_rows, new_cap_events), dtype=np.int8)
+        cell_type[:, :cap_events] = self.cell_type
+        cell_order = np.zeros((self.int_rows, new_cap_events), dtype=np.int64)
+        cell_order[:, :cap_events] = self.cell_order
+
+        self.values = values
+        self.header_exists = header_exists
+        self.single_values = single_values
+        self.cell_type = cell_type
+        self.cell_order = cell_order
+
+    def add_event(self, event):
+        """
+        :param event: the event name
+        :return: the index of the event (it is added if it doesn't exist)
+        """
+        if event not in self.dict_event_index:
+            self._reserve(len(self.list_events) + 1, len(self.list_headers))
+            self.dict_event_index[event] = len(self.list_events)
+            self.list_events.append(event)
+        return self.dict_event_index[event]
+
+    def add_header(self, header):
+        """
+        :param header: the header name
+        :return: the index of the header (it is added if it doesn't exist)
+        """
+        if header not in self.dict_header_index:
+            self._reserve(len(self.list_events), len(self.list_headers) + 1)
+            self.dict_header_index[header] = len(self.list_headers)
+            self.list_headers.append(header)
+        return self.dict_header_index[header]
+
+    def row_index(self, date, time=None):
+        """
+        :param date: the date (KeyError if it is not in the calendar)
+        :param time: the time (only if the calendar has time)
+        :return: the row of the date (time)
+        """
+        if self.list_times is None:
+            return self.dict_date_index[date]
+        return self.dict_date_index[date] * self.int_times + self.dict_time_index[time]
+
+    # ------------------ #
+    # ----- Values ----- #
+    # ------------------ #
+    def _insert_cells(self, rows, events, int_type):
+        """
+        Set the type of the cells and give an insertion order to the cells which didn't exist. The cells must
+        be unique and in insertion order.
+        :return: Nothing
+        """
+        rows, events = np.broadcast_arrays(np.asarray(rows, dtype=np.int64), np.asarray(events, dtype=np.int64))
+        new_cells = self.cell_type[rows, events] == CELL_EMPTY
+        int_new_cells = int(np.count_nonzero(new_cells))
+        self.cell_order[rows[new_cells], events[new_cells]] = np.arange(self._order_counter,
+                                                                        self._order_counter + int_new_cells)
+        self._order_counter += int_new_cells
+        self.cell_type[rows, events] = int_type
+
+    def set_single_values(self, rows, event: int, value):
+        """
+        Set a single value to the event of the rows (as dict[date][event] = value).
+        :return: Nothing
+        """
+        self._insert_cells(rows, event, CELL_VALUE)
+        self.single_values[rows, event] = value
+        self.header_exists[rows, event, :] = False
+
+    def set_empty_headers(self, rows, event: int):
+        """
+        Set an empty dictionary to the event of the rows (as dict[date][event] = {}).
+        :return: Nothing
+        """
+        self._insert_cells(rows, event, CELL_HEADERS)
+        self.single_values[rows, event] = None
+        self.header_exists[rows, event, :] = False
+
+    def ensure_headers(self, rows, events):
+        """
+        Create an empty dictionary to the cells which don't have headers (the cells must be unique and in
+        insertion order).
+        :return: Nothing
+        """
+        rows, events = np.broadcast_arrays(np.asarray(rows, dtype=np.int64), np.asarray(events, dtype=np.int64))
+        no_headers = self.cell_type[rows, events] != CELL_HEADERS
+        if np.any(no_headers):
+            rows, events = rows[no_headers], events[no_headers]
+            self._insert_cells(rows, events, CELL_HEADERS)
+            self.single_values[rows, events] = None
+            self.header_exists[rows, events, :] = False
+
+    def set_header_values(self, rows, events, header: int, values):
+        """
+        Set the values of a header (as dict[date][event][header] = value). The cells must have headers.
+        :return: Nothing
+        """
+        self.values[rows, events, header] = values
+        self.header_exists[rows, events, header] = True
+
+    def row_events(self, row: int):
+        """
+        :param row: the row
+        :return: the indexes of the events of the row in insertion order
+        """
+        int_events = len(self.list_events)
+        events = np.flatnonzero(self.cell_type[row, :int_events])
+        return events[np.argsort(self.cell_order[row, events], kind='stable')]
+
+    def cell_headers(self, row: int, event: int):
+        """
+        :return: the indexes of the headers of a cell
+        """
+        return np.flatnonzero(self.header_exists[row, event, :len(self.list_headers)])
+
+    def cell_value(self, row: int, event: int):
+        """
+        :return: the value of a cell (a single value or a dictionary {header: value})
+        """
+        if self.cell_type[row, event] == CELL_VALUE:
+            return self.single_values[row, event]
+        headers = self.cell_headers(row, event)
+        return dict(zip([self.list_headers[header] for header in headers], self.values[row, event, headers].tolist()))
+
+    def row_to_dict(self, row: int):
+        """
+        :return: the dictionary {event: value} of a row
+        """
+        return {self.list_events[event]: self.cell_value(row, event) for event in self.row_events(row)}
+
+    def date_to_dict(self, date_index: int):
+        """
+        :return: the dictionary of a date ({event: value} or {time: {event: value}} if the calendar has time)
+        """
+        if self.list_times is None:
+            return self.row_to_dict(date_index)
+        return {time: self.row_to_dict(date_index * self.int_times + time_index)
+                for time_index, time in enumerate(self.list_times)}
+
+
 class MyCalendar:
     def __init__(self, list_of_years: [] = None, is_time: bool = False, date_format=DD_MM_YYYY,
                  date_delimiter=del_slash, time_format=HH_MM, time_delimiter=del_colon,
@@ -678,11 +978,19 @@ class MyCalendar:
         self.list_timestamp = None  # set the list timestamp
         self.int_list_size = 0  # set the list size to 0
 
-        self.dict_calendar = EMPTY_DICT.copy()  # create the calendar
+        self.store = None  # the calendar values (CalendarStore)
         self.create()
         self.event_names = []
         self.header_names = []
 
+    @property
+    def dict_calendar(self):
+        """
+        The calendar as nested dictionaries (Dict{Date: {Event: value}} or Dict{Date: {Time: {Event: value}}}).
+        The values are stored in self.store, so the dictionaries are created in each call.
+        """
+        return {date: self.store.date_to_dict(date_index) for date_index, date in enumerate(self.store.list_dates)}
+
     def change_hour_number_in_a_cal_list_to_time(self, list_event: [], time_index):
         """
         In a given list change the time format to calendar time format
@@ -703,32 +1011,18 @@ class MyCalendar:
 
     def change_date_format_in_a_cal_list(self, list_event: [], date_index, date_format_from: str,
                                          date_delimiter_from=del_slash, century=21):
-        list_date_new = []  # list for new dates
-        for event in list_event:  # parsing all events in list
-            day, month, year = date_break_to_day_month_year(date=event[date_index], date_format=date_format_from,
-                                                            date_delimiter=date_delimiter_from, century=century)
-
-            date_tmp = set_date_format(day=day, month=month, year=year,
-                                       date_format=self.date_format, date_delimiter=self.date_delimiter)
-            event[date_index] = date_tmp
-            list_date_new.append(event)
-
-        return list_date_new
+        return change_date_format_in_list(list_event, date_index, date_format_from=date_format_from,
+                                          date_format_to=self.date_format, date_delimiter_from=date_delimiter_from,
+                                          date_delimiter_to=self.date_delimiter, century=century)
 
     def print(self, print_number=None):
-        if print_number is None:
-            for date_keys in self.dict_calendar.keys():
-                print(date_keys, self.dict_calendar[date_keys])
-        else:
-            break_index = 0
-            for date_keys in self.dict_calendar.keys():
-                if break_index == print_number:
-                    break
-                print(date_keys, self.dict_calendar[date_keys])
-                break_index += 1
+        for date_index, date_keys in enumerate(self.store.list_dates):
+            if print_number is not None and date_index == print_number:
+                break
+            print(date_keys, self.store.date_to_dict(date_index))
 
     def print_date(self):
-        for date_keys in self.dict_calendar.keys():
+        for date_keys in self.store.list_dates:
             print(date_keys)
 
     def create(self):
@@ -746,246 +1040,179 @@ class MyCalendar:
         self.list_timestamp = list_timestamp
         self.int_list_size = int_list_size
 
-        for year_index in range(len(self.list_of_years)):
-            if self.list_of_year_is_leap[year_index]:
-                for month in range(0, 12):
-                    for day in range(0, list_int_month_days_leap[month]):
-                        date_tmp = set_date_format(day=list_str_id_days_dd[day],
-                                                   month=list_str_id_months_mm[month],
-                                                   year=str(self.list_of_years[year_index]),
-                                                   date_format=self.date_format,
-                                                   date_delimiter=self.date_delimiter)
-                        self.dict_calendar[date_tmp] = EMPTY_DICT.copy()
-                        if self.is_time:
-                            for timestamp in self.list_timestamp:
-                                self.dict_calendar[date_tmp][timestamp] = EMPTY_DICT.copy()
-            else:
-                for month in range(0, 12):
-                    for day in range(0, list_int_month_days_not_leap[month]):
-                        date_tmp = set_date_format(day=list_str_id_days_dd[day],
-                                                   month=list_str_id_months_mm[month],
-                                                   year=str(self.list_of_years[year_index]),
-                                                   date_format=self.date_format,
-                                                   date_delimiter=self.date_delimiter)
-                        self.dict_calendar[date_tmp] = EMPTY_DICT.copy()
-                        if self.is_time:
-                            for timestamp in self.list_timestamp:
-                                self.dict_calendar[date_tmp][timestamp] = EMPTY_DICT.copy()
+        list_dates = create_list_dates(self.list_of_years, date_format=self.date_format,
+                                       date_delimiter=self.date_delimiter)
+        self.store = CalendarStore(list_dates, self.list_timestamp if self.is_time else None)
 
     def add_list_key_event_to_calendar(self, list_key_event: [], list_of_headers=None):
-        for date in self.dict_calendar.keys():
-            if self.is_time:
-                for time in self.dict_calendar[date].keys():
-                    if list_of_headers is None:
-                        for event in list_key_event:
-                            self.dict_calendar[date][time][event] = NaN
-                    else:
-                        for event in list_key_event:
-                            self.dict_calendar[date][time][event] = {}
-                            for header in list_of_headers:
-                                self.dict_calendar[date][time][event][header] = NaN
+        rows = np.arange(self.store.int_rows)  # all the dates (times)
+        for event in list_key_event:
+            event_index = self.store.add_event(event)
+            if list_of_headers is None:
+                self.store.set_single_values(rows, event_index, NaN)
             else:
-                if list_of_headers is None:
-                    for event in list_key_event:
-                        self.dict_calendar[date][event] = NaN
-                else:
-                    for event in list_key_event:
-                        self.dict_calendar[date][event] = {}
-                        for header in list_of_headers:
-                            self.dict_calendar[date][event][header] = NaN
+                self.store.set_empty_headers(rows, event_index)
+                for header in list_of_headers:
+                    self.store.set_header_values(rows, event_index, self.store.add_header(header), NaN)
 
     def add_events_to_calendar(self, list_of_events: [], date_index, time_index, first_row_header: bool,
                                list_of_headers=None, no_data_value=NaN, event_index=None, input_event_name=None,
-                               add_events_in_this_list=None):
+                               add_events_in_this_list=None, date_format_from=None, date_delimiter_from=del_slash,
+                               century=21):
+        """
+        Add the rows of a table to the calendar.
+        :param date_format_from: the date format of the table (None if it is the calendar date format)
+        :param date_delimiter_from: the date delimiter of the table
+        :param century: the current century (for the two digit years of the table)
+        """
         self.event_names = []
         self.header_names = []
         start_index = 0
         if first_row_header:
             start_index = 1
-            header_size = len(list_of_events[0])
+            list_of_headers = list_of_events[0]
+        header_size = len(list_of_headers)
+        list_rows = list_of_events[start_index:]
+        if len(list_rows) == 0 or (not self.is_time and not first_row_header):
+            return
+
+        # Find the event of each row
+        if first_row_header:
+            list_row_events = [row[event_index] for row in list_rows]
+            if not self.is_time or add_events_in_this_list is None:
+                self.event_names = list(dict.fromkeys(list_row_events))
         else:
-            header_size = len(list_of_headers)
-
-        for i in range(start_index, len(list_of_events)):
-            date = list_of_events[i][date_index]
-            if self.is_time:
-                time = list_of_events[i][time_index]
-                if first_row_header:
-                    event_name = list_of_events[i][event_index]
-                    if event_name not in self.event_names:
-                        self.event_names.append(event_name)
-                    for j in range(0, header_size):
-                        header_name = list_of_events[0][j]
-                        if header_name not in self.header_names:
-                            self.header_names.append(header_name)
-                        if event_name not in self.dict_calendar[date].keys():
-                            self.dict_calendar[date][time_index][event_name] = {}
-                        if list_of_events[i][j] is '':
-                            self.dict_calendar[date][time_index][event_name][header_name] = no_data_value
-                        else:
-                            self.dict_calendar[date][time_index][event_name][header_name] = list_of_events[i][j]
-                else:
-                    event_name = input_event_name
-                    for j in range(0, header_size):
-                        header_name = list_of_headers[j]
-                        if add_events_in_this_list is not None:
-                            if header_name in add_events_in_this_list:
-                                if header_name not in self.header_names:
-                                    self.header_names.append(header_name)
-                                if event_name not in self.dict_calendar[date][time].keys():
-                                    self.dict_calendar[date][time][event_name] = {}
-                                if list_of_events[i][j] is '':
-                                    self.dict_calendar[date][time][event_name][header_name] = no_data_value
-                                else:
-                                    self.dict_calendar[date][time][event_name][header_name] = list_of_events[i][j]
-                        else:
-                            if header_name not in self.header_names:
-                                self.header_names.append(header_name)
-                            if event_name not in self.dict_calendar[date][time].keys():
-                                self.dict_calendar[date][time][event_name] = {}
-                            if list_of_events[i][j] is '':
-                                self.dict_calendar[date][time][event_name][header_name] = no_data_value
-                            else:
-                                self.dict_calendar[date][time][event_name][header_name] = list_of_events[i][j]
+            list_row_events = [input_event_name] * len(list_rows)
 
-            else:
-                # print(i, date, list_of_events[i][event_index], list_of_events[i])
-                if first_row_header:
-                    event_name = list_of_events[i][event_index]
-                    if event_name not in self.event_names:
-                        self.event_names.append(event_name)
-                    for j in range(0, header_size):
-                        header_name = list_of_events[0][j]
-                        if add_events_in_this_list is not None:
-                            if header_name in add_events_in_this_list:
-                                if header_name not in self.header_names:
-                                    self.header_names.append(header_name)
-                                if event_name not in self.dict_calendar[date].keys():
-                                    self.dict_calendar[date][event_name] = {}
-                                if list_of_events[i][j] is '':
-                                    self.dict_calendar[date][event_name][header_name] = no_data_value
-                                else:
-                                    self.dict_calendar[date][event_name][header_name] = list_of_events[i][j]
-                        else:
-                            if header_name in self.header_names and event_name in self.dict_calendar[date].keys():
-                                if header_name not in self.header_names:
-                                    self.header_names.append(header_name)
-                                if event_name not in self.dict_calendar[date].keys():
-                                    self.dict_calendar[date][event_name] = {}
-                                if list_of_events[i][j] is '':
-                                    self.dict_calendar[date][event_name][header_name] = no_data_value
-                                else:
-                                    self.dict_calendar[date][event_name][header_name] = list_of_events[i][j]
-                else:
-                    pass
+        # Find the columns which are added to the calendar
+        if add_events_in_this_list is not None:
+            list_columns = [j for j in range(header_size) if list_of_headers[j] in add_events_in_this_list]
+        elif self.is_time:
+            list_columns = list(range(header_size))
+        else:
+            list_columns = []  # (no headers are added without add_events_in_this_list)
+        self.header_names = list(dict.fromkeys([list_of_headers[j] for j in list_columns]))
+        if len(list_columns) == 0:
+            return
+
+        # Find the cells (row, event) of the calendar
+        list_row_dates = [row[date_index] for row in list_rows]
+        if date_format_from is not None:
+            list_row_dates = change_date_format_of_list(list_row_dates, date_format_from=date_format_from,
+                                                        date_format_to=self.date_format,
+                                                        date_delimiter_from=date_delimiter_from,
+                                                        date_delimiter_to=self.date_delimiter, century=century)
+        if self.is_time:
+            rows = np.array([self.store.row_index(date, row[time_index])
+                             for date, row in zip(list_row_dates, list_rows)], dtype=np.int64)
+        else:
+            rows = np.array([self.store.row_index(date) for date in list_row_dates], dtype=np.int64)
+        dict_event_index = {event: self.store.add_event(event) for event in dict.fromkeys(list_row_events)}
+        events = np.array([dict_event_index[event] for event in list_row_events], dtype=np.int64)
+
+        # The first appearance of a cell sets its order and the last appearance its values
+        cells = rows * (len(self.store.list_events) + 1) + events
+        _, first_appearance = np.unique(cells, return_index=True)
+        first_appearance = np.sort(first_appearance)
+        _, last_appearance = np.unique(cells[::-1], return_index=True)
+        last_appearance = len(cells) - 1 - last_appearance
+        self.store.ensure_headers(rows[first_appearance], events[first_appearance])
+
+        for j in list_columns:
+            header_index = self.store.add_header(list_of_headers[j])
+            column_values = np.empty(len(list_rows), dtype=object)
+            column_values[:] = [row[j] for row in list_rows]
+            column_values[column_values == ''] = no_data_value
+            self.store.set_header_values(rows[last_appearance], events[last_appearance], header_index,
+                                         column_values[last_appearance])
 
     def fill_calendar_with_missing_keys(self, no_data_value=NaN):
-        for date in self.dict_calendar.keys():
-            if self.is_time:
-                for time in self.dict_calendar[date].keys():
-                    for event in self.event_names:
-                        if event not in self.dict_calendar[date][time].keys():
-                            self.dict_calendar[date][time][event] = {}
-                            for header in self.header_names:
-                                self.dict_calendar[date][event][time][header] = no_data_value
-                        else:
-                            for header in self.header_names:
-                                if header not in self.dict_calendar[date][time][event].keys():
-                                    self.dict_calendar[date][time][event][header] = no_data_value
-            else:
-                for event in self.event_names:
-                    if event not in self.dict_calendar[date].keys():
-                        self.dict_calendar[date][event] = {}
-                        for header in self.header_names:
-                            self.dict_calendar[date][event][header] = no_data_value
-                    else:
-                        for header in self.header_names:
-                            if header not in self.dict_calendar[date][event].keys():
-                                self.dict_calendar[date][event][header] = no_data_value
+        rows = np.arange(self.store.int_rows)  # all the dates (times)
+        for event in self.event_names:
+            event_index = self.store.add_event(event)
+            self.store.ensure_headers(rows, event_index)
+            for header in self.header_names:
+                header_index = self.store.add_header(header)
+                missing_rows = rows[~self.store.header_exists[rows, event_index, header_index]]
+                self.store.set_header_values(missing_rows, event_index, header_index, no_data_value)
 
     def dict_to_list(self, date_range=None):
         header_list_tmp = []
+        set_header_tmp = set()  # the headers of header_list_tmp (for fast search)
         output_list = []
         append_header = True
         is_data_in_range = False
         can_append = True
 
-        for date in self.dict_calendar.keys():  # for each date
-            if self.is_time:  # If time exists
-                for time in self.dict_calendar[date].keys():  # for each time
-                    if type(self.dict_calendar[date][time]) is dict:  # if is dict
-                        for event in self.dict_calendar[date][time].keys():  # for each event
-                            if type(self.dict_calendar[date][time][event]) is dict:  # if its dict
-                                tmp_list = []
-                                for header in self.dict_calendar[date][time][event].keys():  # for each header
-                                    if header not in header_list_tmp:  # if header not in list
-                                        header_list_tmp.append(header)  # append it
-                                    if date_range is None:
-                                        tmp_list.append(self.dict_calendar[date][time][event][header])
-                                    else:
-                                        if date_range[0] == date or is_data_in_range:
-                                            is_data_in_range = True
-                                            tmp_list.append(self.dict_calendar[date][time][event][header])
-                                            if date_range[1] == date:
-                                                is_data_in_range = False
-                                                can_append = False
-                                if append_header:
-                                    output_list.append(header_list_tmp)
-                                    append_header = False
-                                if tmp_list and can_append:
-                                    output_list.append(tmp_list)
-                            else:
-                                tmp_list = []
-                                for event_name in self.dict_calendar[date][time]:
-                                    if event_name not in header_list_tmp:
-                                        header_list_tmp.append(event_name)
-                                    if date_range is None:
-                                        tmp_list.append(self.dict_calendar[date][time][event_name])
-                                    else:
-                                        if date_range[0] == date or is_data_in_range:
-                                            is_data_in_range = True
-                                            tmp_list.append(self.dict_calendar[date][time][event_name])
-                                            if date_range[1] == date:
-                                                is_data_in_range = False
-                                                can_append = False
-                                if append_header:
-                                    output_list.append(header_list_tmp)
-                                    append_header = False
-                                if tmp_list and can_append:
-                                    output_list.append(tmp_list)
-                    else:
-                        pass
+        store = self.store
+        int_headers = len(store.list_headers)
+
+        # The cells (row, event) in calendar order (the events of each row in insertion order)
+        cell_rows, cell_events = np.nonzero(store.cell_type[:, :len(store.list_events)])
+        cell_sort = np.lexsort((store.cell_order[cell_rows, cell_events], cell_rows))
+        cell_rows, cell_events = cell_rows[cell_sort], cell_events[cell_sort]
+        row_starts = np.searchsorted(cell_rows, np.arange(store.int_rows + 1))  # the first cell of each row
+        cell_is_dict = store.cell_type[cell_rows, cell_events] == CELL_HEADERS
+
+        # The header values of the cells, read together for the cells with the same headers
+        list_cell_values = [None] * len(cell_rows)
+        cell_pattern = np.full(len(cell_rows), -1, dtype=np.int64)
+        list_pattern_names = []
+        dict_cells = np.flatnonzero(cell_is_dict)
+        if dict_cells.size > 0:
+            header_masks = store.header_exists[cell_rows[dict_cells], cell_events[dict_cells], :int_headers]
+            dict_patterns = {}  # {packed header mask: pattern}
+            cell_pattern[dict_cells] = [dict_patterns.setdefault(key, len(dict_patterns))
+                                        for key in map(bytes, np.packbits(header_masks, axis=1))]
+            pattern_first_cell = np.unique(cell_pattern[dict_cells], return_index=True)[1]
+            for pattern in range(len(dict_patterns)):
+                cells = dict_cells[cell_pattern[dict_cells] == pattern]
+                headers = np.flatnonzero(header_masks[pattern_first_cell[pattern]])
+                list_pattern_names.append([store.list_headers[header] for header in headers])
+                pattern_values = store.values[cell_rows[cells][:, None], cell_events[cells][:, None], headers[None, :]]
+                for cell, values in zip(cells.tolist(), pattern_values.tolist()):
+                    list_cell_values[cell] = values
+        set_pattern_tmp = set()
+
+        cell_rows = cell_rows.tolist()
+        cell_pattern = cell_pattern.tolist()
+        for cell in range(len(cell_rows)):  # for each date (time) and event
+            row = cell_rows[cell]
+            date = store.list_dates[row // store.int_times]
+            is_dict = cell_pattern[cell] >= 0
+            if is_dict:  # the values of the headers
+                list_values = list_cell_values[cell]
+                if cell_pattern[cell] not in set_pattern_tmp:
+                    set_pattern_tmp.add(cell_pattern[cell])
+                    list_names = list_pattern_names[cell_pattern[cell]]
+                else:
+                    list_names = []
+            else:  # the values of all the events of the row
+                row_events = cell_events[row_starts[row]:row_starts[row + 1]]
+                list_names = [store.list_events[event_name] for event_name in row_events]
+                list_values = [store.cell_value(row, event_name) for event_name in row_events]
+
+            for name in list_names:
+                if name not in set_header_tmp:  # if header not in list
+                    set_header_tmp.add(name)
+                    header_list_tmp.append(name)  # append it
+
+            if date_range is None or (is_dict and not self.is_time):
+                tmp_list = list_values
             else:
-                if type(self.dict_calendar[date]) is dict:
-                    for event in self.dict_calendar[date].keys():
-                        if type(self.dict_calendar[date][event]) is dict:
-                            tmp_list = []
-                            for header in self.dict_calendar[date][event].keys():
-                                if header not in header_list_tmp:
-                                    header_list_tmp.append(header)
-                                tmp_list.append(self.dict_calendar[date][event][header])
-                            if append_header:
-                                output_list.append(header_list_tmp)
-                                append_header = False
-                            output_list.append(tmp_list)
-                        else:
-                            tmp_list = []
-                            for event_name in self.dict_calendar[date]:
-                                if event_name not in header_list_tmp:
-                                    header_list_tmp.append(event_name)
-                                if date_range is None:
-                                    tmp_list.append(self.dict_calendar[date][event_name])
-                                else:
-                                    if date_range[0] == date or is_data_in_range:
-                                        is_data_in_range = True
-                                        tmp_list.append(self.dict_calendar[date][event_name])
-                                        if date_range[1] == date:
-                                            is_data_in_range = False
-
-                            if append_header:
-                                output_list.append(header_list_tmp)
-                                append_header = False
-                            output_list.append(tmp_list)
-                    else:
-                        pass
+                tmp_list = []
+                for value in list_values:
+                    if date_range[0] == date or is_data_in_range:
+                        is_data_in_range = True
+                        tmp_list.append(value)
+                        if date_range[1] == date:
+                            is_data_in_range = False
+                            if self.is_time:
+                                can_append = False
+
+            if append_header:
+                output_list.append(header_list_tmp)
+                append_header = False
+            if not self.is_time or (tmp_list and can_append):
+                output_list.append(tmp_list)
         return output_list
@@ -0,0 +1,51 @@
+import numpy as np
+
+# *************************************************************************************************** #
+
+
+class PredictionCache:
+    """
+    Run each trained model once over the whole array of an event and store the predictions. The predictions
+    of the subsets of the array (e.g. the train-validation and the test rows) are served by row index,
+    instead of running the models again.
+    """
+    def __init__(self, mlrRegression):
+        """
+        :param mlrRegression: the (fitted) MachineLearningRegression
+        """
+        self._mlrRegression = mlrRegression
+        self._dictPredictions = {}  # {key: {modelName: predictions}}
+
+    def __contains__(self, key):
+        return key in self._dictPredictions
+
+    def clear(self):
+        self._dictPredictions = {}
+
+    def predictEvents(self, dictX: dict):
+        """
+        Run the models on the arrays which haven't been predicted (one batched prediction per model).
+        :param dictX: a dictionary {key (e.g. the event): x}
+        :return: Nothing
+        """
+        dictNewX = {key: dictX[key] for key in dictX.keys() if key not in self._dictPredictions}
+        if dictNewX.__len__() > 0:
+            self._dictPredictions.update(self._mlrRegression.predictBatch(dictNewX))
+
+    def predict(self, key, x, y, rowIndexes=None):
+        """
+        Get the predictions of the models (the same as MachineLearningRegression.predict).
+        :param key: the key of the array (the models run only the first time the key is used)
+        :param x: the whole input array of the key
+        :param y: the real values (of the selected rows)
+        :param rowIndexes: the rows of x which are predicted (None = all the rows)
+        :return: a dictionary {modelName: {'real': y, 'pred': predictions}}
+        """
+        self.predictEvents({key: x})
+        dictModelPredictions = {}
+        for _modelName_ in self._dictPredictions[key].keys():
+            y_Pred = self._dictPredictions[key][_modelName_]
+            if rowIndexes is not None:
+                y_Pred = y_Pred[np.asarray(rowIndexes, dtype=np.int64)]
+            dictModelPredictions[_modelName_] = {'real': y, 'pred': y_Pred}
+        return dictModelPredictions
@@ -1,13 +1,12 @@
 import os
 import lib.core.file_manipulation as file_manip
-import tkinter as tk
 
 NEW_PROJECT_DEFAULT_FOLDER = file_manip.PATH_HOME
 DOCUMENTS_FOLDER = file_manip.PATH_DOCUMENTS
 PROJECT_FOLDER = os.path.normpath(os.path.realpath(__file__) + '/../../../')
 
-INT_SCREEN_WIDTH = tk.Tk().winfo_screenwidth()  # get the screen width
-INT_SCREEN_HEIGHT = tk.Tk().winfo_screenheight()  # get the screen height
+INT_DEFAULT_SCREEN_WIDTH = 1920  # the screen width if there is no screen (e.g. headless)
+INT_DEFAULT_SCREEN_HEIGHT = 1080  # the screen height if there is no screen (e.g. headless)
 INT_WIN_WIDTH = 1024  # this variable is only for the if __name__ == "__main__"
 INT_WIN_HEIGHT = 512  # this variable is only for the if __name__ == "__main__"
 
@@ -16,6 +15,31 @@ INT_BUTTON_MIN_WIDTH = 50  # Minimum Button Width
 INT_BUTTON_MIN_HEIGHT = 50  # Minimum Button Width
 INT_ADD_REMOVE_BUTTON_SIZE = 48
 
+
+def getScreenSize():
+    """
+    Get the size of the primary screen from Qt. Qt is imported only when this function is called, so the
+    core library can be imported without a display.
+    :return: (width, height) of the primary screen, or the default size if there is no QApplication/screen
+    """
+    try:
+        from PySide2.QtGui import QGuiApplication
+    except ImportError:
+        return INT_DEFAULT_SCREEN_WIDTH, INT_DEFAULT_SCREEN_HEIGHT
+    if QGuiApplication.instance() is None or QGuiApplication.primaryScreen() is None:
+        return INT_DEFAULT_SCREEN_WIDTH, INT_DEFAULT_SCREEN_HEIGHT
+    screenSize = QGuiApplication.primaryScreen().size()
+    return screenSize.width(), screenSize.height()
+
+
+def getScreenWidth():
+    return getScreenSize()[0]
+
+
+def getScreenHeight():
+    return getScreenSize()[1]
+
+
 ICON_ADD = PROJECT_FOLDER + "/icon/add_cross_128x128.png"
 ICON_REMOVE = PROJECT_FOLDER + "/icon/remove_line_128x128.png"
 ICON_ADD_FILLED = PROJECT_FOLDER + "/icon/add_cross_128x128_filled.png"
@@ -89,8 +113,17 @@ MLF_DEFAULT_METHOD = MLPF_METHOD_SEQUENTIAL_REGRESSION
 MLF_DEFAULT_METHOD_INDEX = 1
 MLF_DEFAULT_FILTER_INDEX = 1
 MLF_DEFAULT_MULTIFILE_TRAINING_PROCESSING = MLPF_MULTIFILE_TRAINING_PROCESSING_LINEAR
+MLF_DEFAULT_MULTIFILE_WORKERS = 0  # the worker processes of the Parallel Training-Testing (0 = auto)
+MLF_DEFAULT_FIGURE_WORKERS = 2  # the processes which render the figures (0 = render in the main loop)
+MLF_DEFAULT_PLOT_EVENTS = []  # plot only these events (empty = all the events)
+MLF_DEFAULT_PLOT_MODELS = []  # plot only these models (empty = all the models)
 MLF_DEFAULT_TEST_PERCENTAGE_DISTRIBUTION = MLPF_PERCENTAGE_DISTRIBUTION_FROM_END
 MLF_DEFAULT_HOLDOUT_PERCENTAGE_DISTRIBUTION = MLPF_PERCENTAGE_DISTRIBUTION_RANDOM_FROM_START
 
+MLF_READ_CHUNKED_FILE_SIZE_GB = 0.5  # CSV files larger than this size are read in chunks
+MLF_READ_CHUNK_SIZE = 100000  # the number of rows of each chunk
+MLF_TABLE_CACHE_MAX_SIZE_GB = 5.0  # the maximum size of the cache of the read table files
+MLF_RESULTS_CHECKPOINT_ROWS = 100  # the error rows between two checkpoints of the workbooks (0 = no checkpoints)
+
 MLF_DEFAULT_INPUT_LAYER_IMAGE_WIDTH_RESOLUTION = 150
 MLF_DEFAULT_INPUT_LAYER_IMAGE_HEIGHT_RESOLUTION = 150
@@ -0,0 +1,219 @@
+"""
+Run the regression pipeline without the GUI (e.g. on compute servers), using a JSON or YAML configuration:
+
+    python -m lib.core.regressionBatch config_1.json [config_2.yaml ...]
+
+The configuration mirrors the machine learning parameters of the regression widget:
+
+    {
+        "parameters": {"test-percentage": 0.25, "ml-method": "Sequential Regression", ...},
+        "methods": ["LinearRegression", "RandomForestRegressor"],
+        "signal-compare": ["Pearson Correlation", "Dynamic Time Warping"],
+        "dtw-window": {"type": "sakoechiba", "size": 10},
+        "number-of-jobs": -1,
+        "files": [
+            {"full-path": "/data/file.csv", "primary-event": "Event",
+             "input-list": ["Input_1", "Input_2"], "output-list": ["Output_1"]}
+        ]
+    }
+
+The "parameters" keys are the RP_DKEY_MLP_* keys (the missing keys take the default values), "methods" are the
+MLR_REG_* methods and "signal-compare" the SC_* methods. The optional "dtw-window" is the window of Dynamic Time
+Warping ("type": "none", "sakoechiba" or "itakura", "size": the Sakoe-Chiba window size in samples). The
+"primary-event" of a file is optional (without it the whole file is one event, the same as in the regression
+widget). Each configuration is a separate run.
+"""
+import os
+import sys
+import json
+import signal
+import argparse
+import threading
+
+from lib.core.project_flags import *
+import lib.core.machineLearningRegression as mlr
+import lib.core.signalCompare as signComp
+import lib.core.regressionPipeline as regPipe
+
+# *************************************************************************************************** #
+
+RB_CKEY_PARAMETERS = 'parameters'
+RB_CKEY_METHODS = 'methods'
+RB_CKEY_SIGNAL_COMPARE = 'signal-compare'
+RB_CKEY_NUMBER_OF_JOBS = 'number-of-jobs'
+RB_CKEY_DTW_WINDOW = 'dtw-window'
+RB_CKEY_DTW_WINDOW_TYPE = 'type'
+RB_CKEY_DTW_WINDOW_SIZE = 'size'
+RB_CKEY_FILES = 'files'
+
+RB_EXIT_FINISHED = 0
+RB_EXIT_CANCELLED = 1
+RB_EXIT_CONFIG_ERROR = 2
+
+_RB_YAML_SUFFIXES = ['.yaml', '.yml']
+
+
+def readConfig(configPath: str):
+    """
+    Read a JSON or YAML (.yaml/.yml, needs PyYAML) configuration file.
+    :param configPath: the path of the configuration
+    :return: the configuration dictionary
+    """
+    with open(configPath, 'r') as f:
+        if os.path.splitext(configPath)[1].lower() in _RB_YAML_SUFFIXES:
+            import yaml  # optional dependency (only for YAML configurations)
+            config = yaml.safe_load(f)
+        else:
+            config = json.load(f)
+    if not isinstance(config, dict):
+        raise ValueError(configPath + ': the configuration must be a dictionary')
+    return config
+
+
+def createParameters(config: dict):
+    """
+    :param config: the configuration dictionary
+    :return: the machine learning parameters (the defaults updated with the configuration parameters)
+    """
+    dictParameters = regPipe.getDefaultParameters()
+    for key, value in config.get(RB_CKEY_PARAMETERS, {}).items():
+        if key not in dictParameters.keys():
+            raise ValueError('Unknown parameter: ' + str(key))
+        dictParameters[key] = value
+
+    if dictParameters[regPipe.RP_DKEY_MLP_ML_METHOD] not in MLPF_METHOD_LIST_REGRESSION:
+        raise ValueError('Unknown ml-method: ' + str(dictParameters[regPipe.RP_DKEY_MLP_ML_METHOD]))
+    for key in [regPipe.RP_DKEY_MLP_TEST_PERCENTAGE_DISTRIBUTION, regPipe.RP_DKEY_MLP_HOLDOUT_PERCENTAGE_DISTRIBUTION]:
+        if dictParameters[key] not in MLPF_PERCENTAGE_DISTRIBUTION_LIST:
+            raise ValueError('Unknown ' + key + ': ' + str(dictParameters[key]))
+    if dictParameters[regPipe.RP_DKEY_MLP_MULTIFILE_TRAINING_PROCESSING] not in MLPF_MULTIFILE_TRAINING_PROCESSING_LIST:
+        raise ValueError('Unknown ' + regPipe.RP_DKEY_MLP_MULTIFILE_TRAINING_PROCESSING + ': ' +
+                         str(dictParameters[regPipe.RP_DKEY_MLP_MULTIFILE_TRAINING_PROCESSING]))
+    return dictParameters
+
+
+def createFiles(config: dict):
+    """
+    :param config: the configuration dictionary
+    :return: a dictionary {fileName: fileInfo} (the same as the table files of the regression widget)
+    """
+    dictFiles = {}
+    for fileConfig in config.get(RB_CKEY_FILES, []):
+        fullPath = fileConfig[regPipe.RP_DKEY_FULLPATH]
+        if not os.path.exists(fullPath):
+            raise ValueError('File not found: ' + fullPath)
+        fileName = fileConfig.get(regPipe.RP_DKEY_FILE_NAME, os.path.basename(fullPath))
+        columns = file_manip.getColumnNames(fullPath)
+        fileInfo = {regPipe.RP_DKEY_FILE_NAME: fileName,
+                    regPipe.RP_DKEY_FULLPATH: fullPath,
+                    regPipe.RP_DKEY_COLUMNS: columns,
+                    regPipe.RP_DKEY_INPUT_LIST: list(fileConfig.get(regPipe.RP_DKEY_INPUT_LIST, [])),
+                    regPipe.RP_DKEY_OUTPUT_LIST: list(fileConfig.get(regPipe.RP_DKEY_OUTPUT_LIST, [])),
+                    regPipe.RP_DKEY_PRIMARY_EVENT_COLUMN: fileConfig.get(regPipe.RP_DKEY_PRIMARY_EVENT_COLUMN)
+                    }
+        listCheckColumns = fileInfo[regPipe.RP_DKEY_INPUT_LIST] + fileInfo[regPipe.RP_DKEY_OUTPUT_LIST]
+        if fileInfo[regPipe.RP_DKEY_PRIMARY_EVENT_COLUMN] is not None:  # the primary event is optional
+            listCheckColumns.append(fileInfo[regPipe.RP_DKEY_PRIMARY_EVENT_COLUMN])
+        for column in listCheckColumns:
+            if column not in columns:
+                raise ValueError(fileName + ': unknown column ' + str(column))
+        if fileInfo[regPipe.RP_DKEY_INPUT_LIST].__len__() == 0 or fileInfo[regPipe.RP_DKEY_OUTPUT_LIST].__len__() == 0:
+            raise ValueError(fileName + ': the input and output lists must not be empty')
+        if fileName in dictFiles.keys():
+            raise ValueError('Duplicate file name: ' + fileName)
+        dictFiles[fileName] = fileInfo
+    if dictFiles.keys().__len__() == 0:
+        raise ValueError('There are no files in the configuration')
+    return dictFiles
+
+
+def createPipeline(config: dict):
+    """
+    Create the regression pipeline of a configuration (the enabled regression and signal compare methods).
+    :param config: the configuration dictionary
+    :return: the RegressionPipeline
+    """
+    mlrRegression = mlr.MachineLearningRegression()
+    mlrRegression.setMLR_dict()
+    methods = config.get(RB_CKEY_METHODS, [])
+    if methods.__len__() == 0:
+        raise ValueError('There are no regression methods in the configuration')
+    for _method_ in methods:
+        if _method_ not in mlr.MLR_REG_METHODS:
+            raise ValueError('Unknown regression method: ' + str(_method_))
+        mlrRegression.setMethodState(_method_, True)
+    mlrRegression.setNumberOfJobs(config.get(RB_CKEY_NUMBER_OF_JOBS, -1))
+
+    signCompMethods = signComp.SignalCompare()
+    signCompMethods.setSC_dict()
+    for _method_ in config.get(RB_CKEY_SIGNAL_COMPARE, []):
+        if _method_ not in signComp.SC_METHODS_LIST:
+            raise ValueError('Unknown signal compare method: ' + str(_method_))
+        signCompMethods.setMethodState(_method_, True)
+    if RB_CKEY_DTW_WINDOW in config.keys():
+        dtwWindow = config[RB_CKEY_DTW_WINDOW]
+        if not isinstance(dtwWindow, dict):
+            raise ValueError(RB_CKEY_DTW_WINDOW + ' must be a dictionary')
+        for key in dtwWindow.keys():
+            if key not in [RB_CKEY_DTW_WINDOW_TYPE, RB_CKEY_DTW_WINDOW_SIZE]:
+                raise ValueError('Unknown ' + RB_CKEY_DTW_WINDOW + ' key: ' + str(key))
+        # setDynamicTimeWarping_window raises ValueError for an unknown type or an invalid size
+        signCompMethods.setDynamicTimeWarping_window(
+            dtwWindow.get(RB_CKEY_DTW_WINDOW_TYPE, signComp.SC_DTW_WINDOW_NONE), dtwWindow.get(RB_CKEY_DTW_WINDOW_SIZE))
+
+    return regPipe.RegressionPipeline(dictParameters=createParameters(config),
+                                      mlrRegression=mlrRegression,
+                                      signCompMethods=signCompMethods)
+
+
+def printProgress(stage: str, current: int, total: int):
+    print(file_manip.getCurrentDatetimeForConsole() + "::Progress: " + stage + ' (' + str(current) + ' / ' +
+          str(total) + ')')
+
+
+def runConfig(configPath: str, cancelEvent=None):
+    """
+    Run the regression pipeline of a configuration file.
+    :param configPath: the path of the configuration (JSON or YAML)
+    :param cancelEvent: a threading.Event which stops the execution when it is set (or None)
+    :return: RB_EXIT_FINISHED, RB_EXIT_CANCELLED or RB_EXIT_CONFIG_ERROR
+    """
+    print(file_manip.getCurrentDatetimeForConsole() + "::Configuration: " + configPath)
+    try:
+        config = readConfig(configPath)
+        dictFiles = createFiles(config)
+        pipeline = createPipeline(config)
+    except (OSError, ValueError, KeyError) as e:
+        print(file_manip.getCurrentDatetimeForConsole() + "::Configuration Error: " + str(e), file=sys.stderr)
+        return RB_EXIT_CONFIG_ERROR
+
+    isCancelledFunc = cancelEvent.is_set if cancelEvent is not None else None
+    finished = pipeline.execute(dictFiles, progressFunc=printProgress, isCancelledFunc=isCancelledFunc)
+    return RB_EXIT_FINISHED if finished else RB_EXIT_CANCELLED
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Run the machine learning regression pipeline without the GUI.')
+    parser.add_argument('configs', nargs='+', help='the JSON/YAML configuration files (one run per file)')
+    args = parser.parse_args(argv)
+
+    # SIGINT/SIGTERM stop the execution at the next check (the results of the finished events are saved)
+    cancelEvent = threading.Event()
+
+    def cancel(signalNumber, frame):
+        print(file_manip.getCurrentDatetimeForConsole() + "::Cancel requested (signal " + str(signalNumber) + ")")
+        cancelEvent.set()
+
+    signal.signal(signal.SIGINT, cancel)
+    signal.signal(signal.SIGTERM, cancel)
+
+    exitCode = RB_EXIT_FINISHED
+    for configPath in args.configs:
+        if cancelEvent.is_set():
+            return RB_EXIT_CANCELLED
+        exitCode = max(exitCode, runConfig(configPath, cancelEvent))
+    return exitCode
+
+
+if __name__ == "__main__":
+    sys.exit(main())
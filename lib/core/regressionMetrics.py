@@ -0,0 +1,109 @@
+import numpy as np
+
+# *************************************************************************************************** #
+
+RM_MAX = 'MAX'  # the maximum absolute error (same as sklearn max_error)
+RM_MIN = 'MIN'  # the minimum absolute error
+RM_MSE = 'MSE'  # the mean squared error
+RM_RMSE = 'RMSE'  # the root mean squared error
+RM_MAE = 'MAE'  # the mean absolute error
+RM_METRICS = [RM_MAX, RM_MIN, RM_MSE, RM_RMSE, RM_MAE]
+
+RM_SPACE_NORM = 'NORM'  # the errors of the normalized values
+RM_SPACE_DENORM = 'DENORM'  # the errors of the denormalized values
+RM_SPACES = [RM_SPACE_NORM, RM_SPACE_DENORM]
+
+RM_FIELD_SPLIT = 'split'
+RM_FIELD_SPACE = 'space'
+RM_FIELD_OUTPUT = 'output'
+
+RM_DTYPE = np.dtype([(RM_FIELD_SPLIT, 'U32'), (RM_FIELD_SPACE, 'U8'), (RM_FIELD_OUTPUT, np.int64)] +
+                    [(_metric_, np.float64) for _metric_ in RM_METRICS])
+
+
+def _asColumns(arr):
+    """
+    Convert the values to a 2D float64 array (samples x outputs).
+    :param arr: list of rows or array
+    :return: a 2D numpy array
+    """
+    arr = np.asarray(arr, dtype=np.float64)  # the errors are computed in double precision
+    if arr.ndim == 1:  # a single output
+        arr = arr.reshape(-1, 1)
+    return arr
+
+
+def columnErrors(yReal, yPred):
+    """
+    Calculate the errors of each output (column) in a single pass.
+    :param yReal: the real values (samples x outputs)
+    :param yPred: the predicted values (same size as yReal)
+    :return: a dictionary {metric: array with a value per output}
+    """
+    yReal = _asColumns(yReal)
+    yPred = _asColumns(yPred).reshape(yReal.shape)  # e.g. (samples,) predictions of a single output
+    absErrors = np.abs(yReal - yPred)
+    mse = np.mean(np.square(absErrors), axis=0)
+    return {
+        RM_MAX: absErrors.max(axis=0),
+        RM_MIN: absErrors.min(axis=0),
+        RM_MSE: mse,
+        RM_RMSE: np.sqrt(mse),
+        RM_MAE: absErrors.mean(axis=0)
+    }
+
+
+def calculateMetrics(dictSplits: dict, denormScale=None):
+    """
+    Calculate the errors of all the outputs and all the splits, for the normalized and the denormalized values.
+    The denormalized values are value * denormScale, so their errors are the normalized errors scaled by
+    |denormScale| (and denormScale^2 for MSE).
+    :param dictSplits: a dictionary {split name: (yReal, yPred)} with the normalized values
+    :param denormScale: the denormalization value of each output (None = 1.0, the same as the normalized)
+    :return: a structured array (RM_DTYPE) with a row per split, space and output (in this order)
+    """
+    rows = []
+    for split in dictSplits.keys():
+        yReal, yPred = dictSplits[split]
+        normErrors = columnErrors(yReal, yPred)
+        numOfOutputs = normErrors[RM_MAX].__len__()
+        scale = np.ones(numOfOutputs) if denormScale is None else np.abs(np.asarray(denormScale, dtype=np.float64))
+
+        splitRows = np.zeros(2 * numOfOutputs, dtype=RM_DTYPE)
+        splitRows[RM_FIELD_SPLIT] = split
+        splitRows[RM_FIELD_SPACE][:numOfOutputs] = RM_SPACE_NORM
+        splitRows[RM_FIELD_SPACE][numOfOutputs:] = RM_SPACE_DENORM
+        splitRows[RM_FIELD_OUTPUT] = np.tile(np.arange(numOfOutputs), 2)
+        for _metric_ in RM_METRICS:
+            metricScale = np.square(scale) if _metric_ == RM_MSE else scale
+            splitRows[_metric_][:numOfOutputs] = normErrors[_metric_]
+            splitRows[_metric_][numOfOutputs:] = normErrors[_metric_] * metricScale
+        rows.append(splitRows)
+
+    if rows.__len__() == 0:
+        return np.zeros(0, dtype=RM_DTYPE)
+    return np.concatenate(rows)
+
+
+def selectMetrics(metrics: np.ndarray, split: str, space: str):
+    """
+    :param metrics: the structured array of calculateMetrics
+    :param split: the split name
+    :param space: RM_SPACE_NORM or RM_SPACE_DENORM
+    :return: the rows of the split and space (sorted by output)
+    """
+    rows = metrics[(metrics[RM_FIELD_SPLIT] == split) & (metrics[RM_FIELD_SPACE] == space)]
+    return rows[np.argsort(rows[RM_FIELD_OUTPUT], kind='stable')]
+
+
+def metricsRow(metrics: np.ndarray, split: str, output: int):
+    """
+    Create the workbook values of an output ([MAX_NORM, MAX_DENORM, MIN_NORM, MIN_DENORM, ..., MAE_DENORM]).
+    :param metrics: the structured array of calculateMetrics
+    :param split: the split name
+    :param output: the output index
+    :return: a list of floats
+    """
+    rows = metrics[(metrics[RM_FIELD_SPLIT] == split) & (metrics[RM_FIELD_OUTPUT] == output)]
+    dictRows = {row[RM_FIELD_SPACE]: row for row in rows}
+    return [float(dictRows[_space_][_metric_]) for _metric_ in RM_METRICS for _space_ in RM_SPACES]
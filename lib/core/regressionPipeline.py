@@ -0,0 +1,1101 @@
+import os
+import concurrent.futures
+import multiprocessing
+import queue
+
+import numpy as np
+import pandas as pd
+
+from lib.core.project_flags import *
+import lib.core.machineLearningRegression as mlr
+import lib.core.signalCompare as signComp
+import lib.core.slidingWindow as slideWin
+import lib.core.eventPartition as eventPart
+import lib.core.tableCache as tableCache
+import lib.core.workbookSink as wbSink
+import lib.core.figureRenderer as figRender
+import lib.core.regressionMetrics as regMetrics
+import lib.core.predictionCache as predCache
+
+# *************************************************************************************************** #
+
+# DICTIONARY FILE PARAMETERS
+RP_DKEY_FILE_NAME = 'name'
+RP_DKEY_FULLPATH = 'full-path'
+RP_DKEY_COLUMNS = 'columns'
+RP_DKEY_INPUT_LIST = 'input-list'
+RP_DKEY_OUTPUT_LIST = 'output-list'
+RP_DKEY_PRIMARY_EVENT_COLUMN = 'primary-event'
+
+# DICTIONARY MACHINE LEARNING PARAMETERS
+RP_DKEY_MLP_TEST_PERCENTAGE = 'test-percentage'
+RP_DKEY_MLP_TEST_PERCENTAGE_DISTRIBUTION = 'test-percentage-distribution'
+RP_DKEY_MLP_HOLDOUT_PERCENTAGE = 'holdout-percentage'
+RP_DKEY_MLP_HOLDOUT_PERCENTAGE_DISTRIBUTION = 'holdout-percentage-distribution'
+RP_DKEY_MLP_EXPORT_FOLDER = 'export-folder'
+RP_DKEY_MLP_EXPER_NUMBER = 'experiment-number'
+RP_DKEY_MLP_ML_METHOD = 'ml-method'
+RP_DKEY_MLP_METHOD_INDEX = 'ml-method-index'
+RP_DKEY_MLP_FILTER_INDEX = 'ml-filter-index'
+RP_DKEY_MLP_MULTIFILE_TRAINING_PROCESSING = 'multifile-training-processing'
+RP_DKEY_MLP_MULTIFILE_WORKERS = 'multifile-workers'
+RP_DKEY_MLP_FIGURE_WORKERS = 'figure-workers'
+RP_DKEY_MLP_PLOT_EVENTS = 'plot-events'
+RP_DKEY_MLP_PLOT_MODELS = 'plot-models'
+
+# The environment variables which set the threads of the numerical libraries (numpy/sklearn/tensorflow)
+_RP_THREAD_ENV_VARIABLES = ['OMP_NUM_THREADS', 'MKL_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'NUMEXPR_NUM_THREADS',
+                            'TF_NUM_INTRAOP_THREADS', 'TF_NUM_INTEROP_THREADS']
+
+# The names of the sets in the errors (metrics) array
+_RP_SPLIT_TRAIN_VAL_TEST = 'TrainValTest'
+_RP_SPLIT_TRAIN_VAL = 'TrainVal'
+_RP_SPLIT_TEST = 'Test'
+
+# Map the regression methods to the sliding window methods of the core
+_RP_SLIDING_WINDOW_METHODS = {
+    MLPF_METHOD_SEQUENTIAL_REGRESSION: slideWin.SW_SEQUENTIAL,
+    MLPF_METHOD_AVERAGE_REGRESSION: slideWin.SW_AVERAGE,
+    MLPF_METHOD_SEQUENTIAL_AVERAGE_REGRESSION: slideWin.SW_SEQUENTIAL_AVERAGE
+}
+
+
+def getDefaultParameters():
+    """
+    :return: a dictionary with the default machine learning parameters (RP_DKEY_MLP_* keys)
+    """
+    return {
+        RP_DKEY_MLP_EXPER_NUMBER: MLF_DEFAULT_EXPERIMENT_VALUE,
+        RP_DKEY_MLP_TEST_PERCENTAGE: MLF_DEFAULT_TEST_PERCENTAGE,
+        RP_DKEY_MLP_TEST_PERCENTAGE_DISTRIBUTION: MLF_DEFAULT_TEST_PERCENTAGE_DISTRIBUTION,
+        RP_DKEY_MLP_HOLDOUT_PERCENTAGE: MLF_DEFAULT_HOLDOUT_PERCENTAGE,
+        RP_DKEY_MLP_HOLDOUT_PERCENTAGE_DISTRIBUTION: MLF_DEFAULT_HOLDOUT_PERCENTAGE_DISTRIBUTION,
+        RP_DKEY_MLP_EXPORT_FOLDER: MLF_DEFAULT_EXPORT_FOLDER_PATH,
+        RP_DKEY_MLP_ML_METHOD: MLF_DEFAULT_METHOD,
+        RP_DKEY_MLP_METHOD_INDEX: MLF_DEFAULT_METHOD_INDEX,
+        RP_DKEY_MLP_FILTER_INDEX: MLF_DEFAULT_FILTER_INDEX,
+        RP_DKEY_MLP_MULTIFILE_TRAINING_PROCESSING: MLF_DEFAULT_MULTIFILE_TRAINING_PROCESSING,
+        RP_DKEY_MLP_MULTIFILE_WORKERS: MLF_DEFAULT_MULTIFILE_WORKERS,
+        RP_DKEY_MLP_FIGURE_WORKERS: MLF_DEFAULT_FIGURE_WORKERS,
+        RP_DKEY_MLP_PLOT_EVENTS: list(MLF_DEFAULT_PLOT_EVENTS),
+        RP_DKEY_MLP_PLOT_MODELS: list(MLF_DEFAULT_PLOT_MODELS)
+    }
+
+
+def _executeFileInProcess(pipeline, fileName: str, fileInfo: dict, exportPrimaryDir: str, progressQueue,
+                          cancelEvent):
+    """
+    Run the pipeline of a file in a worker process (Parallel Training-Testing).
+    :param pipeline: the RegressionPipeline (a pickled copy of the main process pipeline)
+    :param fileName: the name of the file
+    :param fileInfo: the dictionary of the file (RP_DKEY_* keys)
+    :param exportPrimaryDir: the export folder of the file (unique for each file)
+    :param progressQueue: a managed queue to send the progress to the main process
+    :param cancelEvent: a managed event which is set when the user cancels the execution
+    :return: True if finished, False if cancelled
+    """
+    def progressFunc(stage, current, total):
+        progressQueue.put((fileName + ': ' + stage, current, total))
+
+    pipeline.setNumberOfFigureWorkers(0)  # the files already run in parallel, so render in the worker
+    return pipeline.executeFile(fileName, fileInfo, exportPrimaryDir=exportPrimaryDir,
+                                progressFunc=progressFunc, isCancelledFunc=cancelEvent.is_set)
+
+
+class RegressionPipeline:
+    """
+    The regression pipeline (read, window, split, fit, evaluate and export) of the table files. It doesn't
+    depend on Qt, so it can be run from the GUI (in a worker thread), in worker processes or headless.
+    """
+    def __init__(self, dictParameters: dict, mlrRegression=None, signCompMethods=None):
+        """
+        :param dictParameters: the machine learning parameters (RP_DKEY_MLP_* keys)
+        :param mlrRegression: a MachineLearningRegression with the enabled methods (None for a new one)
+        :param signCompMethods: a SignalCompare with the enabled methods (None for a new one)
+        """
+        self.dictParameters = dictParameters
+
+        if mlrRegression is None:
+            mlrRegression = mlr.MachineLearningRegression()
+            mlrRegression.setMLR_dict()
+        self.mlrRegression = mlrRegression
+
+        if signCompMethods is None:
+            signCompMethods = signComp.SignalCompare()
+            signCompMethods.setSC_dict()
+        self.signCompMethods = signCompMethods
+
+        self._numOfFigureWorkers = dictParameters.get(RP_DKEY_MLP_FIGURE_WORKERS, MLF_DEFAULT_FIGURE_WORKERS)
+
+    # --------------------------- #
+    # ----- Reuse Functions ----- #
+    # --------------------------- #
+    @staticmethod
+    def isCancelled(isCancelledFunc=None):
+        if isCancelledFunc is not None and isCancelledFunc():
+            print(file_manip.getCurrentDatetimeForConsole() + "::Execution Cancelled!")
+            return True
+        return False
+
+    @staticmethod
+    def progress(progressFunc, stage: str, current: int, total: int):
+        if progressFunc is not None:
+            progressFunc(stage, current, total)
+
+    def getExportPrimaryDir(self, fileName: str):
+        # Set a path for exporting the input-output data (exportFolder/fileName/datetime)
+        currentFileName = os.path.splitext(fileName)[0]
+        currentDatetime = file_manip.getCurrentDatetimeForPath()  # Find Current Datetime
+        return self.dictParameters[RP_DKEY_MLP_EXPORT_FOLDER] + '/' + currentFileName + '/' + currentDatetime
+
+    def setNumberOfFigureWorkers(self, numOfWorkers: int):
+        self._numOfFigureWorkers = numOfWorkers
+
+    def getNumberOfFigureWorkers(self):
+        return self._numOfFigureWorkers
+
+    def isPlotEnabled(self, event, modelName: str):
+        # An empty (or None) list means plot all the events/models
+        plotEvents = self.dictParameters.get(RP_DKEY_MLP_PLOT_EVENTS, MLF_DEFAULT_PLOT_EVENTS)
+        plotModels = self.dictParameters.get(RP_DKEY_MLP_PLOT_MODELS, MLF_DEFAULT_PLOT_MODELS)
+        if plotEvents and str(event) not in [str(_event_) for _event_ in plotEvents]:
+            return False
+        if plotModels and modelName not in plotModels:
+            return False
+        return True
+
+    def getNumberOfWorkers(self, numOfFiles: int):
+        # 0 (or no value) means one worker per file (up to the number of cores)
+        numOfWorkers = self.dictParameters.get(RP_DKEY_MLP_MULTIFILE_WORKERS, MLF_DEFAULT_MULTIFILE_WORKERS)
+        if not numOfWorkers or numOfWorkers < 1:
+            numOfWorkers = os.cpu_count() or 1
+        return max(1, min(numOfWorkers, numOfFiles))
+
+    def readFileData(self, fileInfo: dict):
+        # Shorten the file path and the primary event column
+        filePath = fileInfo[RP_DKEY_FULLPATH]
+        primaryEvent = fileInfo[RP_DKEY_PRIMARY_EVENT_COLUMN]
+        # find the file suffix (extension) and take is as lowercase without the comma
+        suffix = file_manip.getTableFileSuffix(filePath)
+        # create a list to store all the needed columns (we don't need columns we will not use - RAM saving)
+        fileDataUseColumns = []
+        # Check if user selected primary event column
+        if primaryEvent is not None:
+            fileDataUseColumns.append(primaryEvent)  # add it to list
+        # append to list (if not already) the values from input column list
+        [fileDataUseColumns.append(col) for col in fileInfo[RP_DKEY_INPUT_LIST]
+         if col not in fileDataUseColumns]
+        # append to list (if not already) the values from output column list
+        [fileDataUseColumns.append(col) for col in fileInfo[RP_DKEY_OUTPUT_LIST]
+         if col not in fileDataUseColumns]
+        # the input/output columns are parsed directly as floats (the primary event column is left as is)
+        fileDataDtypes = {col: np.float64 for col in fileDataUseColumns if col != primaryEvent}
+
+        # Large files with a primary event column are read in chunks and the rows are stored per event
+        # (so only one chunk of the file is parsed at a time)
+        readByEvent = primaryEvent is not None and suffix == 'csv' and \
+            file_manip.getFileSize(filePath, file_manip.SIZE_GB) > MLF_READ_CHUNKED_FILE_SIZE_GB
+
+        # Check if the file has been read before with the same columns (the cache is next to the exported data)
+        fileCache = tableCache.TableCache(
+            cacheDir=self.dictParameters[RP_DKEY_MLP_EXPORT_FOLDER] + '/' + tableCache.TC_DEFAULT_DIR_NAME,
+            maxSizeGB=MLF_TABLE_CACHE_MAX_SIZE_GB)
+        fileCacheKey = fileCache.getKey(filePath, useColumns=fileDataUseColumns, dtypes=fileDataDtypes,
+                                        readMode=('by-event' if readByEvent else '') +
+                                                 ('|fill-per-event' if primaryEvent is not None else ''))
+        fileData = fileCache.load(fileCacheKey)
+        if fileData is not None:
+            print("Load " + suffix + " file from cache.")  # info message
+            return fileData  # return the cached fileData (already filled)
+
+        print("Read " + suffix + " file.")  # info message
+
+        # Read only the needed columns
+        if readByEvent:
+            fileData = file_manip.readTableFileByEvent(filePath,
+                                                       eventColumn=primaryEvent,
+                                                       useColumns=fileDataUseColumns,
+                                                       dtypes=fileDataDtypes,
+                                                       chunkSize=MLF_READ_CHUNK_SIZE)
+        else:
+            fileData = file_manip.readTableFile(filePath,
+                                                useColumns=fileDataUseColumns,
+                                                dtypes=fileDataDtypes)
+
+        # print(fileData)
+
+        if fileData is not None:  # if file has been read successfully
+            if primaryEvent is not None:
+                # fill na values using ffill/bfill within each event (the rows of the other events aren't used,
+                # so the result doesn't depend on the row order of the events, i.e. on the read path)
+                fillColumns = [col for col in fileData.columns if col != primaryEvent]
+                eventKeys = fileData[primaryEvent]
+                fileData[fillColumns] = fileData[fillColumns].groupby(eventKeys, sort=False, dropna=False).ffill()
+                fileData[fillColumns] = fileData[fillColumns].groupby(eventKeys, sort=False, dropna=False).bfill()
+            else:
+                fileData.ffill(inplace=True)  # fill na values using ffill
+                fileData.bfill(inplace=True)  # fill na values using bfill
+            fileCache.store(fileCacheKey, fileData, sourcePath=filePath)  # store it for the next executions
+        return fileData  # return the fileData
+
+    # Create the Train-Validation-Test Arrays
+    def setTrainValTestArrays(self, dictDataInput: {}, dictDataOutput: {}, inputHeaders: [], outputHeaders: []):
+        def getTrainValTest(inputArr, outputArr):
+            datasetSize = inputArr.__len__()
+            testPercentage = self.dictParameters[RP_DKEY_MLP_TEST_PERCENTAGE]
+            X_train_val_ = []
+            y_train_val_ = []
+            X_test_ = []
+            y_test_ = []
+            trainIdxs = []
+            testIdxs = []
+            testTrainIndex = None
+
+            if self.dictParameters[RP_DKEY_MLP_TEST_PERCENTAGE_DISTRIBUTION] == MLPF_PERCENTAGE_DISTRIBUTION_RANDOM_FROM_START:
+                permIndexes = np.random.permutation(datasetSize).tolist()
+                trainIdxs = permIndexes[int(testPercentage * datasetSize):]
+                testIdxs = permIndexes[:int(testPercentage * datasetSize)]
+
+                X_train_val_ = np.array(inputArr)[trainIdxs]
+                y_train_val_ = np.array(outputArr)[trainIdxs]
+                X_test_ = np.array(inputArr)[testIdxs]
+                y_test_ = np.array(outputArr)[testIdxs]
+
+            elif self.dictParameters[RP_DKEY_MLP_TEST_PERCENTAGE_DISTRIBUTION] == MLPF_PERCENTAGE_DISTRIBUTION_RANDOM_FROM_MIDDLE:
+                permIndexes = np.random.permutation(datasetSize).tolist()
+                midIndex = datasetSize / 2
+                sliceSize = testPercentage * datasetSize
+                startIndex = int(midIndex - sliceSize / 2)
+                endIndex = int(midIndex - sliceSize / 2)
+
+                trainIdxs = permIndexes[:startIndex] + permIndexes[-endIndex:]
+                testIdxs = permIndexes[startIndex:-endIndex]
+
+                X_train_val_ = np.array(inputArr)[trainIdxs]
+                y_train_val_ = np.array(outputArr)[trainIdxs]
+                X_test_ = np.array(inputArr)[testIdxs]
+                y_test_ = np.array(outputArr)[testIdxs]
+
+            elif self.dictParameters[RP_DKEY_MLP_TEST_PERCENTAGE_DISTRIBUTION] == MLPF_PERCENTAGE_DISTRIBUTION_RANDOM_FROM_END:
+                permIndexes = np.random.permutation(datasetSize).tolist()
+                trainIdxs = permIndexes[:-int(testPercentage * datasetSize)]
+                testIdxs = permIndexes[-int(testPercentage * datasetSize):]
+
+                X_train_val_ = np.array(inputArr)[trainIdxs]
+                y_train_val_ = np.array(outputArr)[trainIdxs]
+                X_test_ = np.array(inputArr)[testIdxs]
+                y_test_ = np.array(outputArr)[testIdxs]
+
+            elif self.dictParameters[RP_DKEY_MLP_TEST_PERCENTAGE_DISTRIBUTION] == MLPF_PERCENTAGE_DISTRIBUTION_FROM_START:
+                datasetIndexes = list(range(datasetSize))
+                trainIdxs = datasetIndexes[int(testPercentage * datasetSize):]
+                testIdxs = datasetIndexes[:int(testPercentage * datasetSize)]
+                testTrainIndex = [testPercentage * datasetSize]
+
+                X_train_val_ = np.array(inputArr)[trainIdxs]
+                y_train_val_ = np.array(outputArr)[trainIdxs]
+                X_test_ = np.array(inputArr)[testIdxs]
+                y_test_ = np.array(outputArr)[testIdxs]
+
+            elif self.dictParameters[RP_DKEY_MLP_TEST_PERCENTAGE_DISTRIBUTION] == MLPF_PERCENTAGE_DISTRIBUTION_FROM_MIDDLE:
+                datasetIndexes = list(range(datasetSize))
+                midIndex = datasetSize / 2
+                sliceSize = testPercentage * datasetSize
+                startIndex = int(midIndex - sliceSize / 2)
+                endIndex = int(midIndex - sliceSize / 2)
+                testTrainIndex = [startIndex, endIndex]
+
+                trainIdxs = datasetIndexes[:startIndex] + datasetIndexes[-endIndex:]
+                testIdxs = datasetIndexes[startIndex:-endIndex]
+
+                X_train_val_ = np.array(inputArr)[trainIdxs]
+                y_train_val_ = np.array(outputArr)[trainIdxs]
+                X_test_ = np.array(inputArr)[testIdxs]
+                y_test_ = np.array(outputArr)[testIdxs]
+
+            elif self.dictParameters[RP_DKEY_MLP_TEST_PERCENTAGE_DISTRIBUTION] == MLPF_PERCENTAGE_DISTRIBUTION_FROM_END:
+                datasetIndexes = np.array(list(range(datasetSize)))
+                trainIdxs = datasetIndexes[:-int(testPercentage * datasetSize)]
+                testIdxs = datasetIndexes[-int(testPercentage * datasetSize):]
+                testTrainIndex = [datasetSize - (testPercentage * datasetSize)]
+
+                X_train_val_ = np.array(inputArr)[trainIdxs]
+                y_train_val_ = np.array(outputArr)[trainIdxs]
+                X_test_ = np.array(inputArr)[testIdxs]
+                y_test_ = np.array(outputArr)[testIdxs]
+
+            return X_train_val_, y_train_val_, X_test_, y_test_, testTrainIndex, trainIdxs, testIdxs
+
+        X_full = {}  # Create an input dict to store the values of train_val + test lists
+        y_full = {}  # Create an output dict to store the values of train_val + test lists
+        X_train_val = {}  # Create an input dict to store the values of train_val lists
+        y_train_val = {}  # Create an output dict to store the values of train_val lists
+        X_test = {}  # Create an input dict to store the values of test lists
+        y_test = {}  # Create an output dict to store the values of test lists
+        X_windows = {}  # Create an input dict to store the (unfiltered) windows of train_val + test lists
+        dict_train_val_rows = {}  # the rows of X_windows which are in the train_val lists
+        dict_test_rows = {}  # the rows of X_windows which are in the test lists
+        # Shorten the name of methodIndex
+        methodIndex = self.dictParameters[RP_DKEY_MLP_METHOD_INDEX]
+        filterIndex = self.dictParameters[RP_DKEY_MLP_FILTER_INDEX]
+        dict_test_train_index = {}
+
+        inputHeaderColumnsForML = []
+        outputHeaderColumnsForML = []
+
+        print('Data will be filtered with FILTER_VALUE = ', filterIndex)
+
+        # Find the sliding window method of the selected regression method (None if not supported)
+        windowMethod = _RP_SLIDING_WINDOW_METHODS.get(self.dictParameters[RP_DKEY_MLP_ML_METHOD])
+        if windowMethod is not None:
+            for _event_ in dictDataInput.keys():
+                # Create the windows of the event (contiguous float32 arrays)
+                tmp_event_arr_input, tmp_event_arr_output = slideWin.createWindows(method=windowMethod,
+                                                                                   arrInput=dictDataInput[_event_],
+                                                                                   arrOutput=dictDataOutput[_event_],
+                                                                                   windowSize=methodIndex)
+
+                # *************************** #
+                # ***** FILTER THE DATA ***** #
+                # *************************** #
+                X_train_val[_event_], y_train_val[_event_], X_test[_event_], y_test[
+                    _event_], dict_test_train_index[_event_], dict_train_val_rows[_event_], dict_test_rows[
+                    _event_] = getTrainValTest(
+                    tmp_event_arr_input,
+                    tmp_event_arr_output)
+                X_windows[_event_] = tmp_event_arr_input
+                if methodIndex <= 1:  # the filter doesn't change the windows, so use the same array
+                    X_full[_event_] = tmp_event_arr_input
+                else:
+                    X_full[_event_] = slideWin.movingAverageFilter(tmp_event_arr_input, methodIndex)
+                y_full[_event_] = slideWin.movingAverageFilter(tmp_event_arr_output, filterIndex)
+
+            inputHeaderColumnsForML, outputHeaderColumnsForML = slideWin.createWindowHeaders(
+                method=windowMethod,
+                inputHeaders=inputHeaders,
+                outputHeaders=outputHeaders,
+                windowSize=methodIndex)
+
+        return X_train_val, y_train_val, X_test, y_test, X_full, y_full, \
+               inputHeaderColumnsForML, outputHeaderColumnsForML, dict_test_train_index, \
+               X_windows, dict_train_val_rows, dict_test_rows
+
+    @staticmethod
+    def getArrayFromDictList(inputDictList: dict):
+        tmpOutput = []
+        for key in inputDictList.keys():
+            for value in inputDictList[key]:
+                tmpOutput.append(value)
+        return np.array(tmpOutput)
+
+    @staticmethod
+    def plotAbsoluteErrors(y_Real_denorm: np.ndarray, y_Pred_denorm: np.ndarray, path_toSavePlot: str,
+                           trainTestSplit=None, title='Figure: Absolute Errors', figureQueue=None):
+        print(file_manip.getCurrentDatetimeForConsole() +
+              "::Plot Denormalized Absolute Error Figure")
+        DY_RealPred_abs_denorm = np.abs(y_Real_denorm - y_Pred_denorm)
+        y_max = DY_RealPred_abs_denorm.max()
+        yLabel = 'Absolute Error'
+        xLabel = ''
+        if figureQueue is None:  # render the figure in the calling process
+            figRender.saveAbsoluteErrorsFigure(absErrors=DY_RealPred_abs_denorm,
+                                               exportPath=path_toSavePlot,
+                                               y_max=y_max,
+                                               trainTestSplit=trainTestSplit,
+                                               title=title,
+                                               yLabel=yLabel, xLabel=xLabel)
+            return
+        figureQueue.submit(figRender.FR_FIGURE_ABSOLUTE_ERRORS,
+                           absErrors=DY_RealPred_abs_denorm,
+                           exportPath=path_toSavePlot,
+                           y_max=y_max,
+                           trainTestSplit=trainTestSplit,
+                           title=title,
+                           yLabel=yLabel, xLabel=xLabel)
+
+    def exportSignalCompareSummary(self, workbookPath: str, listLabels: [], listReal: [], listPred: [],
+                                   columnLabels: []):
+        """
+        Compare the real and predicted signals of all the (event, model) pairs at once and write one workbook.
+        :param workbookPath: the path of the summary workbook
+        :param listLabels: a list with the [event, model] of each pair
+        :param listReal: a list with the (time x columns) real arrays of each pair
+        :param listPred: a list with the (time x columns) predicted arrays of each pair
+        :param columnLabels: the output columns
+        :return: Nothing
+        """
+        seriesLengths = np.array([_real_.shape[0] for _real_ in listReal], dtype=np.int64)
+        arrReal = np.full((listReal.__len__(), columnLabels.__len__(), seriesLengths.max()), np.nan)
+        arrPred = np.full(arrReal.shape, np.nan)
+        for _index_ in range(listReal.__len__()):  # (pairs x columns x time), NaN padded
+            arrReal[_index_, :, :seriesLengths[_index_]] = listReal[_index_].T
+            arrPred[_index_, :, :seriesLengths[_index_]] = listPred[_index_].T
+
+        df_summary = self.signCompMethods.signComp_batch_(arrReal, arrPred, seriesLengths=seriesLengths,
+                                                          rowLabels=listLabels,
+                                                          rowLabelHeaders=['Event', 'Technique'],
+                                                          columnLabels=columnLabels,
+                                                          numOfJobs=self.mlrRegression.getNumberOfJobs())
+        summarySink = wbSink.WorkbookSink(workbookPath, headers=df_summary.columns.tolist())
+        for _row_ in df_summary.itertuples(index=False):
+            summarySink.append(list(_row_))
+        summarySink.save()
+
+    # ************************ #
+    # ***** MAIN EXECUTE ***** #
+    # ************************ #
+    def execute(self, dictFiles: dict, progressFunc=None, isCancelledFunc=None):
+        """
+        Run the main pipeline (read, train, predict, plot and export) for all the files. The files are executed
+        one after the other or in worker processes (RP_DKEY_MLP_MULTIFILE_TRAINING_PROCESSING).
+        :param dictFiles: a dictionary {fileName: fileInfo} (fileInfo with RP_DKEY_* keys)
+        :param progressFunc: a function (stage, current, total) to report the progress (or None)
+        :param isCancelledFunc: a function which returns True if the execution must stop (or None)
+        :return: True if finished, False if cancelled
+        """
+        if dictFiles.keys().__len__() > 0:  # if there is at least a file (safety if)
+            if self.dictParameters.get(RP_DKEY_MLP_MULTIFILE_TRAINING_PROCESSING) == \
+                    MLPF_MULTIFILE_TRAINING_PROCESSING_PARALLEL and dictFiles.keys().__len__() > 1:
+                finished = self.executeParallel(dictFiles, progressFunc, isCancelledFunc)
+            else:
+                finished = self.executeLinear(dictFiles, progressFunc, isCancelledFunc)
+            if not finished:
+                return False
+
+        self.progress(progressFunc, 'Finished', 1, 1)
+        print(file_manip.getCurrentDatetimeForConsole() + "::Execution Finished Successfully!!!")
+        return True
+
+    def executeLinear(self, dictFiles: dict, progressFunc=None, isCancelledFunc=None):
+        fileCounter = 0
+        fileSize = dictFiles.keys().__len__()
+        for fileName in dictFiles.keys():
+            if self.isCancelled(isCancelledFunc):
+                return False
+            self.progress(progressFunc, 'Read ' + fileName, fileCounter, fileSize)
+            fileCounter += 1
+            if not self.executeFile(fileName, dictFiles[fileName],
+                                    progressFunc=progressFunc, isCancelledFunc=isCancelledFunc):
+                return False
+        return True
+
+    def executeParallel(self, dictFiles: dict, progressFunc=None, isCancelledFunc=None):
+        # Split the cores to the workers, so the workers don't oversubscribe the cpu with threads
+        numOfWorkers = self.getNumberOfWorkers(dictFiles.keys().__len__())
+        numOfThreads = max(1, (os.cpu_count() or 1) // numOfWorkers)
+        print(file_manip.getCurrentDatetimeForConsole() + "::Parallel Training-Testing with " +
+              str(numOfWorkers) + " workers (" + str(numOfThreads) + " threads per worker)")
+
+        # Create an isolated export folder for each file (files with the same name don't share a folder)
+        dictExportDirs = {}
+        for fileName in dictFiles.keys():
+            exportPrimaryDir = file_manip.checkAndRenameExistPath_retPath(self.getExportPrimaryDir(fileName))
+            file_manip.checkAndCreateFolders(exportPrimaryDir)
+            dictExportDirs[fileName] = exportPrimaryDir
+
+        # The workers are spawned (not forked) with the thread limits in their environment, so the limits
+        # are used when numpy/sklearn/tensorflow are imported in the worker
+        mpContext = multiprocessing.get_context('spawn')
+        manager = mpContext.Manager()
+        progressQueue = manager.Queue()
+        cancelEvent = manager.Event()
+        prevEnvironment = {envVar: os.environ.get(envVar) for envVar in _RP_THREAD_ENV_VARIABLES}
+        prevNumberOfJobs = self.mlrRegression.getNumberOfJobs()
+        finished = True
+        try:
+            for envVar in _RP_THREAD_ENV_VARIABLES:
+                os.environ[envVar] = str(numOfThreads)
+            self.mlrRegression.setNumberOfJobs(numOfThreads)  # the pickled copies use the thread limit
+
+            with concurrent.futures.ProcessPoolExecutor(max_workers=numOfWorkers, mp_context=mpContext) as executor:
+                pending = {executor.submit(_executeFileInProcess, self, fileName, dictFiles[fileName],
+                                           dictExportDirs[fileName], progressQueue, cancelEvent)
+                           for fileName in dictFiles.keys()}
+                fileCounter = 0
+                while pending:
+                    done, pending = concurrent.futures.wait(pending, timeout=0.5)
+                    # Send the progress of the workers
+                    try:
+                        while True:
+                            self.progress(progressFunc, *progressQueue.get_nowait())
+                    except queue.Empty:
+                        pass
+                    for future in done:
+                        try:
+                            if not future.cancelled() and not future.result():  # raise the errors of the workers
+                                finished = False
+                        except BaseException:
+                            # Stop the other workers at their next check (and the files which haven't started),
+                            # so the error is raised without waiting for the rest of the files
+                            cancelEvent.set()
+                            for pendingFuture in pending:
+                                pendingFuture.cancel()
+                            raise
+                        fileCounter += 1
+                        self.progress(progressFunc, 'Finished files', fileCounter, dictFiles.keys().__len__())
+                    # Check if the user cancelled the execution (the running workers stop at their next check)
+                    if not cancelEvent.is_set() and self.isCancelled(isCancelledFunc):
+                        cancelEvent.set()
+                        finished = False
+                        for future in pending:
+                            future.cancel()
+        finally:
+            for envVar in _RP_THREAD_ENV_VARIABLES:
+                if prevEnvironment[envVar] is None:
+                    os.environ.pop(envVar, None)
+                else:
+                    os.environ[envVar] = prevEnvironment[envVar]
+            self.mlrRegression.setNumberOfJobs(prevNumberOfJobs)
+            manager.shutdown()
+        return finished
+
+    def executeFile(self, fileName: str, fileInfo: dict, exportPrimaryDir=None, progressFunc=None,
+                    isCancelledFunc=None):
+        """
+        Run the main pipeline for a file.
+        :param fileName: the name of the file
+        :param fileInfo: the dictionary of the file (RP_DKEY_* keys)
+        :param exportPrimaryDir: the export folder of the file (None for exportFolder/fileName/datetime)
+        :param progressFunc: a function (stage, current, total) to report the progress (or None)
+        :param isCancelledFunc: a function which returns True if the execution must stop (or None)
+        :return: True if finished, False if cancelled
+        """
+        # FUNCTION FLAGS
+        _FF_KEY_DATA = 'Data'
+        _FF_KEY_COLUMN_PRIMARY_EVENT_DATA = 'Column Primary Event Data'
+        _FF_KEY_PRIMARY_EVENT_UNIQUE_VALUES = 'Primary Event Unique Values'
+        _FF_KEY_INPUT_COLUMNS = 'Input Columns'
+        _FF_KEY_OUTPUT_COLUMNS = 'Output Columns'
+        _FF_KEY_INPUT_COLUMNS_FOR_ML = 'Input Columns Machine Learning'
+        _FF_KEY_OUTPUT_COLUMNS_FOR_ML = 'Output Columns Machine Learning'
+        _FF_KEY_OUT_COL_HEADER_REAL = 'Output Header Real'
+        _FF_KEY_OUT_COL_HEADER_PRED = 'Output Header Predicted'
+        _FF_KEY_INP_COL_DENORM_VAL = 'Denormalize Input Values'
+        _FF_KEY_OUT_COL_DENORM_VAL = 'Denormalize Output Values'
+        _FF_KEY_TRAIN_VAL_ARRAY = 'Training Validation Array'
+        _FF_KEY_TEST_ARRAY = 'Test Array'
+        _FF_KEY_FULL_ARRAY = 'Full Array'
+        _FF_KEY_INPUT = 'Input Array'
+        _FF_KEY_OUTPUT = 'Output Array'
+        _FF_KEY_TRAIN_TEST_SPLIT_INDEX = 'Train-Test Split Index'
+        _FF_KEY_WINDOWS_ARRAY = 'Windows Array'
+        _FF_KEY_TRAIN_VAL_ROWS = 'Training Validation Rows'
+        _FF_KEY_TEST_ROWS = 'Test Rows'
+        dict_fileData = {}
+
+        # Create a tmp variable primaryEvent for code simplicity
+        primaryEvent = fileInfo[RP_DKEY_PRIMARY_EVENT_COLUMN]
+        dict_fileData[fileName] = {}  # Create a dictionary for file Data
+        # read the data and store them in dictionary
+        dict_fileData[fileName][_FF_KEY_DATA] = self.readFileData(fileInfo)
+
+        # Set the input/output columns
+        dict_fileData[fileName][_FF_KEY_INPUT_COLUMNS] = fileInfo[RP_DKEY_INPUT_LIST]
+        dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS] = fileInfo[RP_DKEY_OUTPUT_LIST]
+
+        # Set the normalize/denormalize values
+        dict_fileData[fileName][_FF_KEY_INP_COL_DENORM_VAL] = {}
+        for _value_ in dict_fileData[fileName][_FF_KEY_INPUT_COLUMNS]:
+            tmp_col_max_value = dict_fileData[fileName][_FF_KEY_DATA][_value_].max()
+            dict_fileData[fileName][_FF_KEY_INP_COL_DENORM_VAL][_value_] = tmp_col_max_value
+        dict_fileData[fileName][_FF_KEY_OUT_COL_DENORM_VAL] = {}
+        for _value_ in dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS]:
+            tmp_col_max_value = dict_fileData[fileName][_FF_KEY_DATA][_value_].max()
+            dict_fileData[fileName][_FF_KEY_OUT_COL_DENORM_VAL][_value_] = tmp_col_max_value
+
+        # Set a path for exporting the input-output data
+        currentFileName = os.path.splitext(fileName)[0]
+        if exportPrimaryDir is None:
+            exportPrimaryDir = self.getExportPrimaryDir(fileName)
+        exportDataFolder = os.path.normpath(exportPrimaryDir + '/Data')
+        file_manip.checkAndCreateFolders(exportDataFolder)  # check if path exists and if not create it
+        # Export the input values
+        file_manip.exportDictionaryNonList(dictForExport=dict_fileData[fileName][_FF_KEY_INP_COL_DENORM_VAL],
+                                           exportPath=os.path.normpath(
+                                               exportDataFolder + '/InputColumnsDenormValues.csv'),
+                                           headerLine=['InputColumn, DenormValue'])
+        # Export the output values
+        file_manip.exportDictionaryNonList(dictForExport=dict_fileData[fileName][_FF_KEY_OUT_COL_DENORM_VAL],
+                                           exportPath=os.path.normpath(
+                                               exportDataFolder + '/OutputColumnsDenormValues.csv'),
+                                           headerLine=['OutputColumn, DenormValue'])
+
+        # Set the PRIMARY_EVENT_DATA as a dict
+        dict_fileData[fileName][_FF_KEY_COLUMN_PRIMARY_EVENT_DATA] = {_FF_KEY_INPUT: {}, _FF_KEY_OUTPUT: {}}
+        # Group the rows by the primary event only once (a single event if the user didn't pick a column)
+        if primaryEvent is not None:
+            eventPartition = eventPart.EventPartition(
+                eventValues=dict_fileData[fileName][_FF_KEY_DATA][primaryEvent].to_numpy())
+        else:
+            eventPartition = eventPart.EventPartition(
+                numOfRows=dict_fileData[fileName][_FF_KEY_DATA].shape[0],
+                defaultEvent=_FF_KEY_DATA)
+        # add the unique event values in the dictionary with key PRIMARY_EVENT_UNIQUE_VALUES
+        dict_fileData[fileName][_FF_KEY_PRIMARY_EVENT_UNIQUE_VALUES] = eventPartition.events()
+
+        tmp_input_columns = dict_fileData[fileName][_FF_KEY_INPUT_COLUMNS]
+        tmp_output_columns = dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS]
+        # Create the normalized arrays (sorted by event) and store a view of the rows for each event key.
+        # The rows are sorted once (the sorted array is the only copy) and then normalized in place (if the rows
+        # are already grouped, to_numpy copies them, so the file data (or the memory-mapped cache) isn't changed)
+        tmp_arr_input = eventPartition.sortArray(
+            dict_fileData[fileName][_FF_KEY_DATA][tmp_input_columns].to_numpy(dtype=np.float64,
+                                                                              copy=eventPartition.isGrouped()))
+        tmp_arr_input /= np.array([dict_fileData[fileName][_FF_KEY_INP_COL_DENORM_VAL][key]
+                                   for key in tmp_input_columns], dtype=np.float64)
+        tmp_arr_output = eventPartition.sortArray(
+            dict_fileData[fileName][_FF_KEY_DATA][tmp_output_columns].to_numpy(dtype=np.float64,
+                                                                               copy=eventPartition.isGrouped()))
+        tmp_arr_output /= np.array([dict_fileData[fileName][_FF_KEY_OUT_COL_DENORM_VAL][key]
+                                    for key in tmp_output_columns], dtype=np.float64)
+        for _event_ in eventPartition.events():
+            dict_fileData[fileName][_FF_KEY_COLUMN_PRIMARY_EVENT_DATA][_FF_KEY_INPUT][_event_] = \
+                tmp_arr_input[eventPartition.eventSlice(_event_)]
+            dict_fileData[fileName][_FF_KEY_COLUMN_PRIMARY_EVENT_DATA][_FF_KEY_OUTPUT][_event_] = \
+                tmp_arr_output[eventPartition.eventSlice(_event_)]
+
+        dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ARRAY] = {}
+        dict_fileData[fileName][_FF_KEY_TEST_ARRAY] = {}
+        dict_fileData[fileName][_FF_KEY_FULL_ARRAY] = {}
+        dict_fileData[fileName][_FF_KEY_INPUT_COLUMNS_FOR_ML] = []
+        dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS_FOR_ML] = []
+        dict_fileData[fileName][_FF_KEY_TRAIN_TEST_SPLIT_INDEX] = {}
+        dict_fileData[fileName][_FF_KEY_WINDOWS_ARRAY] = {}
+        dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ROWS] = {}
+        dict_fileData[fileName][_FF_KEY_TEST_ROWS] = {}
+
+        self.progress(progressFunc, 'Create the Train-Validation-Test arrays', 0, 1)
+        (dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ARRAY][_FF_KEY_INPUT],
+         dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ARRAY][_FF_KEY_OUTPUT],
+         dict_fileData[fileName][_FF_KEY_TEST_ARRAY][_FF_KEY_INPUT],
+         dict_fileData[fileName][_FF_KEY_TEST_ARRAY][_FF_KEY_OUTPUT],
+         dict_fileData[fileName][_FF_KEY_FULL_ARRAY][_FF_KEY_INPUT],
+         dict_fileData[fileName][_FF_KEY_FULL_ARRAY][_FF_KEY_OUTPUT],
+         dict_fileData[fileName][_FF_KEY_INPUT_COLUMNS_FOR_ML],
+         dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS_FOR_ML],
+         dict_fileData[fileName][_FF_KEY_TRAIN_TEST_SPLIT_INDEX],
+         dict_fileData[fileName][_FF_KEY_WINDOWS_ARRAY],
+         dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ROWS],
+         dict_fileData[fileName][_FF_KEY_TEST_ROWS]) = \
+            self.setTrainValTestArrays(
+                dictDataInput=dict_fileData[fileName][_FF_KEY_COLUMN_PRIMARY_EVENT_DATA][_FF_KEY_INPUT],
+                dictDataOutput=dict_fileData[fileName][_FF_KEY_COLUMN_PRIMARY_EVENT_DATA][_FF_KEY_OUTPUT],
+                inputHeaders=dict_fileData[fileName][_FF_KEY_INPUT_COLUMNS],
+                outputHeaders=dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS])
+
+        tmp_input_header_arr = ['Event']
+        tmp_input_header_arr.extend(dict_fileData[fileName][_FF_KEY_INPUT_COLUMNS_FOR_ML])
+        tmp_output_header_arr = ['Event']
+        tmp_output_header_arr.extend(dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS_FOR_ML])
+
+        print(file_manip.getCurrentDatetimeForConsole() + "::Export INPUT training array...")
+        file_manip.exportDictionaryList(
+            dictForExport=dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ARRAY][_FF_KEY_INPUT],
+            exportPath=os.path.normpath(
+                exportDataFolder + '/InputTrainingValidation.csv'),
+            headerLine=tmp_input_header_arr)
+
+        print(file_manip.getCurrentDatetimeForConsole() + "::Export OUTPUT training array...")
+        file_manip.exportDictionaryList(
+            dictForExport=dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ARRAY][_FF_KEY_OUTPUT],
+            exportPath=os.path.normpath(
+                exportDataFolder + '/OutputTrainingValidation.csv'),
+            headerLine=tmp_output_header_arr)
+
+        print(file_manip.getCurrentDatetimeForConsole() + "::Export INPUT testing array...")
+        file_manip.exportDictionaryList(
+            dictForExport=dict_fileData[fileName][_FF_KEY_TEST_ARRAY][_FF_KEY_INPUT],
+            exportPath=os.path.normpath(
+                exportDataFolder + '/InputTest.csv'),
+            headerLine=tmp_input_header_arr)
+
+        print(file_manip.getCurrentDatetimeForConsole() + "::Export OUTPUT testing array...")
+        file_manip.exportDictionaryList(
+            dictForExport=dict_fileData[fileName][_FF_KEY_TEST_ARRAY][_FF_KEY_OUTPUT],
+            exportPath=os.path.normpath(
+                exportDataFolder + '/OutputTest.csv'),
+            headerLine=tmp_output_header_arr)
+
+        # Set the output headers Real/Pred which will be used later in the exported results
+        dict_fileData[fileName][_FF_KEY_OUT_COL_HEADER_REAL] = []
+        [dict_fileData[fileName][_FF_KEY_OUT_COL_HEADER_REAL].append(col + "_Real")
+         for col in dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS_FOR_ML]]
+        dict_fileData[fileName][_FF_KEY_OUT_COL_HEADER_PRED] = []
+        [dict_fileData[fileName][_FF_KEY_OUT_COL_HEADER_PRED].append(col + "_Pred")
+         for col in dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS_FOR_ML]]
+
+        # print(dict_fileData[fileName])
+
+        headerCorrelation = ['Method']
+        for column_name in dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS_FOR_ML]:
+            headerCorrelation.append(column_name)
+        dirExportPlot = 'ExportPlots'
+
+        # 02 - Run Machine Learning Process
+        print(file_manip.getCurrentDatetimeForConsole() + "::Start Machine Learning Process")
+        # ******** THIS CODE MAY BE EDITED WITH THREADING ****
+        X_TrainVal = self.getArrayFromDictList(
+            dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ARRAY][_FF_KEY_INPUT])
+        y_TrainVal = self.getArrayFromDictList(
+            dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ARRAY][_FF_KEY_OUTPUT])
+        X_Test = self.getArrayFromDictList(
+            dict_fileData[fileName][_FF_KEY_TEST_ARRAY][_FF_KEY_INPUT])
+        y_Test = self.getArrayFromDictList(
+            dict_fileData[fileName][_FF_KEY_TEST_ARRAY][_FF_KEY_OUTPUT])
+        listStr_ModelPaths, exportBaseDirPath, workbookDirPath = \
+            self.mlrRegression.fit(X_TrainVal=X_TrainVal,
+                                    y_TrainVal=y_TrainVal,
+                                    X_Test=X_Test,
+                                    y_Test=y_Test,
+                                    exportFolder=exportPrimaryDir,
+                                    progressFunc=progressFunc,
+                                    isCancelledFunc=isCancelledFunc)
+        if self.isCancelled(isCancelledFunc):
+            return False
+        # Create a workbook for storing the Errors for each unique event
+        workbookPath_ErrorsForTrainValTest = workbookDirPath + '/' + currentFileName + '_ErrorsForTrainValTest.xlsx'
+        workbookPath_ErrorsForTrainVal = workbookDirPath + '/' + currentFileName + '_ErrorsForTrainVal.xlsx'
+        workbookPath_ErrorsForTest = workbookDirPath + '/' + currentFileName + '_ErrorsForTest.xlsx'
+        workbookPath_SignalCompare = workbookDirPath + '/' + currentFileName + '_SignalCompare.xlsx'
+        # Create the header row
+        headers_row = ['Event', 'Technique']
+        headers_errors = ['_MAX_NORM', '_MAX_DENORM',
+                          '_MIN_NORM', '_MIN_DENORM',
+                          '_MSE_NORM', '_MSE_DENORM',
+                          '_RMSE_NORM', '_RMSE_DENORM',
+                          '_MAE_NORM', '_MAE_DENORM']
+        for _header_ in dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS_FOR_ML]:
+            for _headerError_ in headers_errors:
+                headers_row.append(_header_ + _headerError_)
+        # The rows are collected in memory and each workbook is written once (after the last event)
+        wbSink_ErrorsForTrainValTest = wbSink.WorkbookSink(workbookPath_ErrorsForTrainValTest, headers=headers_row,
+                                                           checkpointRows=MLF_RESULTS_CHECKPOINT_ROWS)
+        wbSink_ErrorsForTrainVal = wbSink.WorkbookSink(workbookPath_ErrorsForTrainVal, headers=headers_row,
+                                                       checkpointRows=MLF_RESULTS_CHECKPOINT_ROWS)
+        wbSink_ErrorsForTest = wbSink.WorkbookSink(workbookPath_ErrorsForTest, headers=headers_row,
+                                                   checkpointRows=MLF_RESULTS_CHECKPOINT_ROWS)
+        workbookSinks = [wbSink_ErrorsForTrainValTest, wbSink_ErrorsForTrainVal, wbSink_ErrorsForTest]
+        # The figures are rendered in other processes (the events loop doesn't wait for them)
+        figureQueue = figRender.FigureRenderQueue(numOfWorkers=self._numOfFigureWorkers)
+        completed = False  # the workbooks and the figure queue are closed on any exit (cancel or error too)
+        try:
+            # The signals of each (event, model) are compared together after the events loop (one summary table)
+            list_signCompLabels = []
+            list_signCompReal = []
+            list_signCompPred = []
+            # The predictions of all the events are computed once per model (one batched prediction over the
+            # windows arrays of all the events) and the TrainVal/Test predictions are sliced from them
+            self.progress(progressFunc, 'Predict ' + currentFileName + ' events', 0, 1)
+            predictionCache = predCache.PredictionCache(self.mlrRegression)
+            dictWindows = dict_fileData[fileName][_FF_KEY_WINDOWS_ARRAY]
+            dictFull = dict_fileData[fileName][_FF_KEY_FULL_ARRAY][_FF_KEY_INPUT]
+            predictionCache.predictEvents({(_event_, _FF_KEY_WINDOWS_ARRAY): dictWindows[_event_]
+                                           for _event_ in dictWindows.keys()})
+            predictionCache.predictEvents({(_event_, _FF_KEY_FULL_ARRAY): dictFull[_event_]
+                                           for _event_ in dictFull.keys()
+                                           if dictFull[_event_] is not dictWindows[_event_]})
+
+            # for each uniqueEvent
+            uniqueEventCounter = 0
+            uniqueEventSize = dict_fileData[fileName][_FF_KEY_PRIMARY_EVENT_UNIQUE_VALUES].__len__()
+            for _uniqueEvent_ in dict_fileData[fileName][_FF_KEY_PRIMARY_EVENT_UNIQUE_VALUES]:
+                if self.isCancelled(isCancelledFunc):
+                    return False
+                self.progress(progressFunc, 'Evaluate ' + currentFileName + ' events',
+                              uniqueEventCounter, uniqueEventSize)
+                print('\n' + file_manip.getCurrentDatetimeForConsole() + '::(' + str(uniqueEventCounter + 1) +
+                      ' / ' + str(uniqueEventSize) + ') Event: ', _uniqueEvent_)
+                uniqueEventCounter += 1
+                # Shorten the variable name of trainTestSplitIndex
+                trainTestSplitIndex = dict_fileData[fileName][_FF_KEY_TRAIN_TEST_SPLIT_INDEX][_uniqueEvent_]
+
+                # ---------------------------------------------------------------------------- #
+
+                # Store the INPUT and OUTPUT of current event to shortened named variables
+                df_x_TrainValTest = dict_fileData[fileName][_FF_KEY_FULL_ARRAY][_FF_KEY_INPUT][_uniqueEvent_]
+                df_y_TrainValTest = dict_fileData[fileName][_FF_KEY_FULL_ARRAY][_FF_KEY_OUTPUT][_uniqueEvent_]
+
+                df_y_TrainVal = dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ARRAY][_FF_KEY_OUTPUT][_uniqueEvent_]
+                df_y_Test = dict_fileData[fileName][_FF_KEY_TEST_ARRAY][_FF_KEY_OUTPUT][_uniqueEvent_]
+
+                x_Windows = dict_fileData[fileName][_FF_KEY_WINDOWS_ARRAY][_uniqueEvent_]
+                rows_TrainVal = dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ROWS][_uniqueEvent_]
+                rows_Test = dict_fileData[fileName][_FF_KEY_TEST_ROWS][_uniqueEvent_]
+
+                # get the predictions of all models on TrainVal and Test (rows of the unfiltered windows)
+                windowsKey = (_uniqueEvent_, _FF_KEY_WINDOWS_ARRAY)
+                dict_Y_TrainVal = predictionCache.predict(windowsKey, x_Windows, df_y_TrainVal, rows_TrainVal)
+                dict_Y_Test = predictionCache.predict(windowsKey, x_Windows, df_y_Test, rows_Test)
+
+                # get the predictions of all models on TrainValTest (the filtered windows, unless they are the same)
+                if df_x_TrainValTest is x_Windows:
+                    dict_Y_TrainValTest = predictionCache.predict(windowsKey, x_Windows, df_y_TrainValTest)
+                else:
+                    dict_Y_TrainValTest = predictionCache.predict((_uniqueEvent_, _FF_KEY_FULL_ARRAY),
+                                                                  df_x_TrainValTest, df_y_TrainValTest)
+
+                # cor_CSV = [headerCorrelation]  # create a CSV list and add the header row
+                for _modelName_ in dict_Y_TrainValTest:  # for each modelName in dict_Y
+                    if self.isCancelled(isCancelledFunc):
+                        return False
+                    # Create an append row (for workbook) and add the uniqueEvent and modelName
+                    tmpAppendRow_TrainValTest = [_uniqueEvent_, _modelName_]
+                    tmpAppendRow_TrainVal = [_uniqueEvent_, _modelName_]
+                    tmpAppendRow_Test = [_uniqueEvent_, _modelName_]
+                    # Create an append row (for cor_CSV) and add the modelName
+                    # tmpCorRow_CSV = [_modelName_]
+
+                    # Store the normalized values (real, predicted) to shortened variables
+                    df_Y_realNorm_TrainValTest = pd.DataFrame(
+                        dict_Y_TrainValTest[_modelName_]['real'],
+                        columns=dict_fileData[fileName][
+                            _FF_KEY_OUT_COL_HEADER_REAL])
+                    df_Y_predNorm_TrainValTest = pd.DataFrame(
+                        dict_Y_TrainValTest[_modelName_]['pred'],
+                        columns=dict_fileData[fileName][
+                            _FF_KEY_OUT_COL_HEADER_PRED])
+
+                    df_Y_realNorm_TrainVal = pd.DataFrame(
+                        dict_Y_TrainVal[_modelName_]['real'],
+                        columns=dict_fileData[fileName][
+                            _FF_KEY_OUT_COL_HEADER_REAL])
+                    df_Y_predNorm_TrainVal = pd.DataFrame(
+                        dict_Y_TrainVal[_modelName_]['pred'],
+                        columns=dict_fileData[fileName][
+                            _FF_KEY_OUT_COL_HEADER_PRED])
+
+                    df_Y_realNorm_Test = pd.DataFrame(
+                        dict_Y_Test[_modelName_]['real'],
+                        columns=dict_fileData[fileName][
+                            _FF_KEY_OUT_COL_HEADER_REAL])
+                    df_Y_predNorm_Test = pd.DataFrame(
+                        dict_Y_Test[_modelName_]['pred'],
+                        columns=dict_fileData[fileName][
+                            _FF_KEY_OUT_COL_HEADER_PRED])
+
+                    # Copy the normalized values to denormalized variables
+                    df_Y_realDenorm_TrainValTest = df_Y_realNorm_TrainValTest.copy()
+                    df_Y_predDenorm_TrainValTest = df_Y_predNorm_TrainValTest.copy()
+
+                    df_Y_realDenorm_TrainVal = df_Y_realNorm_TrainVal.copy()
+                    df_Y_predDenorm_TrainVal = df_Y_predNorm_TrainVal.copy()
+
+                    df_Y_realDenorm_Test = df_Y_realNorm_Test.copy()
+                    df_Y_predDenorm_Test = df_Y_predNorm_Test.copy()
+
+                    # Create the paths for exporting data
+                    # Main Directory
+                    o_dir_Model = os.path.normpath(exportBaseDirPath + '/' + dirExportPlot + '/' +
+                                                   _uniqueEvent_ + '/' + _modelName_) + '/'
+                    file_manip.checkAndCreateFolders(o_dir_Model)
+                    # Directory to Export the Signal Comparison
+                    o_dir_SignalCompare = os.path.normpath(o_dir_Model + 'SignalCompare') + '/'
+                    file_manip.checkAndCreateFolders(o_dir_SignalCompare)
+                    # Directory to Export the Real and Predicted Plots
+                    o_dir_RealPredictPlots = os.path.normpath(o_dir_Model + 'RealPredictPlots') + '/'
+                    file_manip.checkAndCreateFolders(o_dir_RealPredictPlots)
+                    # Directory to Export the Real and Predicted CSV normalized/denormalized values
+                    o_dir_RealPredictCSV = os.path.normpath(o_dir_Model + 'RealPredictCSV') + '/'
+                    file_manip.checkAndCreateFolders(o_dir_RealPredictCSV)
+                    # Check if the user wants the figures of this event/model
+                    plotFigures = self.isPlotEnabled(_uniqueEvent_, _modelName_)
+
+                    # Find the denormalize value (multiply index) of each output column
+                    list_mulInd = []
+                    for currColumn_real in dict_fileData[fileName][_FF_KEY_OUT_COL_HEADER_REAL]:
+                        mul_ind = 1.0  # set multiply index to 1
+                        for _oColumn_ in dict_fileData[fileName][_FF_KEY_OUT_COL_DENORM_VAL]:
+                            if currColumn_real.__contains__(_oColumn_):
+                                mul_ind = dict_fileData[fileName][_FF_KEY_OUT_COL_DENORM_VAL][_oColumn_]
+                        list_mulInd.append(mul_ind)
+
+                    # Calculate the Errors of all the output columns and sets (normalized/denormalized) at once
+                    print(file_manip.getCurrentDatetimeForConsole() + "::Calculate the Errors")
+                    modelMetrics = regMetrics.calculateMetrics({
+                        _RP_SPLIT_TRAIN_VAL_TEST: (df_Y_realNorm_TrainValTest.to_numpy(),
+                                                   df_Y_predNorm_TrainValTest.to_numpy()),
+                        _RP_SPLIT_TRAIN_VAL: (df_Y_realNorm_TrainVal.to_numpy(), df_Y_predNorm_TrainVal.to_numpy()),
+                        _RP_SPLIT_TEST: (df_Y_realNorm_Test.to_numpy(), df_Y_predNorm_Test.to_numpy())
+                    }, denormScale=list_mulInd)
+
+                    for _index_ in range(0, dict_fileData[fileName][_FF_KEY_OUT_COL_HEADER_REAL].__len__()):
+                        mul_ind = list_mulInd[_index_]  # the multiply index of the column
+                        # get current row
+                        currColumn_real = dict_fileData[fileName][_FF_KEY_OUT_COL_HEADER_REAL][_index_]
+                        currColumn_pred = dict_fileData[fileName][_FF_KEY_OUT_COL_HEADER_PRED][_index_]
+                        currColumn = dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS_FOR_ML][_index_]
+
+                        df_Y_realDenorm_TrainValTest[currColumn_real] *= mul_ind
+                        df_Y_predDenorm_TrainValTest[currColumn_pred] *= mul_ind
+
+                        df_Y_realDenorm_TrainVal[currColumn_real] *= mul_ind
+                        df_Y_predDenorm_TrainVal[currColumn_pred] *= mul_ind
+
+                        df_Y_realDenorm_Test[currColumn_real] *= mul_ind
+                        df_Y_predDenorm_Test[currColumn_pred] *= mul_ind
+
+                        if plotFigures:
+                            print(file_manip.getCurrentDatetimeForConsole() +
+                                  "::Plot normalized figure for column: " + currColumn)
+                            y_max = df_Y_realNorm_TrainValTest[currColumn_real].max()
+                            if df_Y_predNorm_TrainValTest[currColumn_pred].max() > y_max:
+                                y_max = df_Y_predNorm_TrainValTest[currColumn_pred].max()
+                            exportFigPath = o_dir_RealPredictPlots + 'Normalized_' + _uniqueEvent_ + '_' + \
+                                currColumn + '.png'
+                            figTitle = _uniqueEvent_ + ': ' + currColumn
+                            figureQueue.submit(figRender.FR_FIGURE_REAL_PREDICTED,
+                                               y_Real=df_Y_realNorm_TrainValTest[currColumn_real].to_numpy(),
+                                               y_Pred=df_Y_predNorm_TrainValTest[currColumn_pred].to_numpy(),
+                                               exportPath=exportFigPath,
+                                               # y_max=y_max,
+                                               trainTestSplit=trainTestSplitIndex,
+                                               title=figTitle,
+                                               yLabel=currColumn + ' (x' + str(mul_ind) + ')',
+                                               xLabel='',
+                                               realLabel=currColumn_real, predLabel=currColumn_pred)
+
+                            print(file_manip.getCurrentDatetimeForConsole() +
+                                  "::Plot normalized figure for column: " + currColumn)
+                            exportFigPath = o_dir_RealPredictPlots + 'Denormalized_' + _uniqueEvent_ + '_' + \
+                                currColumn + '.png'
+                            figTitle = _uniqueEvent_ + ': ' + currColumn
+                            y_max *= mul_ind
+                            figureQueue.submit(figRender.FR_FIGURE_REAL_PREDICTED,
+                                               y_Real=df_Y_realDenorm_TrainValTest[currColumn_real].to_numpy(),
+                                               y_Pred=df_Y_predDenorm_TrainValTest[currColumn_pred].to_numpy(),
+                                               exportPath=exportFigPath,
+                                               # y_max=y_max,
+                                               trainTestSplit=trainTestSplitIndex,
+                                               title=figTitle,
+                                               yLabel=currColumn,
+                                               xLabel='',
+                                               realLabel=currColumn_real, predLabel=currColumn_pred)
+
+                        # Errors - TrainValTest
+                        denormList_yReal = df_Y_realDenorm_TrainValTest[currColumn_real].to_numpy()
+                        denormList_yPred = df_Y_predDenorm_TrainValTest[currColumn_pred].to_numpy()
+
+                        exportFigPath = o_dir_RealPredictPlots + 'Denormalized_TrainValTest_AbsoluteErrors' + \
+                                        _uniqueEvent_ + '_' + currColumn + '.png'
+                        figTitle = _uniqueEvent_ + ': ' + currColumn + ' Absolute Errors Full Set'
+                        if plotFigures:
+                            self.plotAbsoluteErrors(denormList_yReal, denormList_yPred,
+                                                    path_toSavePlot=exportFigPath,
+                                                    trainTestSplit=trainTestSplitIndex,
+                                                    title=figTitle,
+                                                    figureQueue=figureQueue)
+
+                        exportFigPath = o_dir_RealPredictPlots + 'Denormalized_TrainValTest_QQPlot' + \
+                                        _uniqueEvent_ + '_' + currColumn + '.png'
+                        figTitle = _uniqueEvent_ + ': ' + currColumn + ' QQ-Plot'
+                        if plotFigures:
+                            figureQueue.submit(figRender.FR_FIGURE_QQ_PLOT,
+                                               y_Real=denormList_yReal,
+                                               y_Pred=denormList_yPred,
+                                               exportPath=exportFigPath,
+                                               title=figTitle,
+                                               yLabel='Predicted Values', xLabel='Real Values')
+
+                        tmpAppendRow_TrainValTest += regMetrics.metricsRow(modelMetrics, _RP_SPLIT_TRAIN_VAL_TEST,
+                                                                           _index_)
+
+                        # Errors - TrainVal
+                        denormList_yReal = df_Y_realDenorm_TrainVal[currColumn_real].to_numpy()
+                        denormList_yPred = df_Y_predDenorm_TrainVal[currColumn_pred].to_numpy()
+
+                        exportFigPath = o_dir_RealPredictPlots + 'Denormalized_TrainVal_AbsoluteErrors' + \
+                                        _uniqueEvent_ + '_' + currColumn + '.png'
+                        figTitle = _uniqueEvent_ + ': ' + currColumn + ' Absolute Errors Train-Validation Set'
+                        if plotFigures:
+                            self.plotAbsoluteErrors(denormList_yReal, denormList_yPred,
+                                                    path_toSavePlot=exportFigPath,
+                                                    trainTestSplit=None,
+                                                    title=figTitle,
+                                                    figureQueue=figureQueue)
+
+                        exportFigPath = o_dir_RealPredictPlots + 'Denormalized_TrainVal_QQPlot' + \
+                                        _uniqueEvent_ + '_' + currColumn + '.png'
+                        figTitle = _uniqueEvent_ + ': ' + currColumn + ' QQ-Plot'
+                        if plotFigures:
+                            figureQueue.submit(figRender.FR_FIGURE_QQ_PLOT,
+                                               y_Real=denormList_yReal,
+                                               y_Pred=denormList_yPred,
+                                               exportPath=exportFigPath,
+                                               title=figTitle,
+                                               yLabel='Predicted Values', xLabel='Real Values')
+
+                        tmpAppendRow_TrainVal += regMetrics.metricsRow(modelMetrics, _RP_SPLIT_TRAIN_VAL, _index_)
+
+                        # Errors - Test
+                        denormList_yReal = df_Y_realDenorm_Test[currColumn_real].to_numpy()
+                        denormList_yPred = df_Y_predDenorm_Test[currColumn_pred].to_numpy()
+
+                        exportFigPath = o_dir_RealPredictPlots + 'Denormalized_Test_AbsoluteErrors' + \
+                                        _uniqueEvent_ + '_' + currColumn + '.png'
+                        figTitle = _uniqueEvent_ + ': ' + currColumn + ' Absolute Errors Test Set'
+                        if plotFigures:
+                            self.plotAbsoluteErrors(denormList_yReal, denormList_yPred,
+                                                    path_toSavePlot=exportFigPath,
+                                                    trainTestSplit=None,
+                                                    title=figTitle,
+                                                    figureQueue=figureQueue)
+
+                        exportFigPath = o_dir_RealPredictPlots + 'Denormalized_Test_QQPlot' + \
+                                        _uniqueEvent_ + '_' + currColumn + '.png'
+                        figTitle = _uniqueEvent_ + ': ' + currColumn + ' QQ-Plot'
+                        if plotFigures:
+                            figureQueue.submit(figRender.FR_FIGURE_QQ_PLOT,
+                                               y_Real=denormList_yReal,
+                                               y_Pred=denormList_yPred,
+                                               exportPath=exportFigPath,
+                                               title=figTitle,
+                                               yLabel='Predicted Values', xLabel='Real Values')
+
+                        tmpAppendRow_Test += regMetrics.metricsRow(modelMetrics, _RP_SPLIT_TEST, _index_)
+
+                        if plotFigures:  # the figures of the signal compare methods
+                            corrFileName = _uniqueEvent_ + '_' + currColumn
+                            self.signCompMethods.signComp_exec_(
+                                arrData1=df_Y_realNorm_TrainValTest[currColumn_real].to_numpy(),
+                                arrData2=df_Y_predNorm_TrainValTest[currColumn_pred].to_numpy(),
+                                exportFigDirPath=o_dir_SignalCompare,
+                                exportFigFileName=corrFileName,
+                            )
+
+                    list_signCompLabels.append([_uniqueEvent_, _modelName_])
+                    list_signCompReal.append(df_Y_realNorm_TrainValTest.to_numpy(dtype=float))
+                    list_signCompPred.append(df_Y_predNorm_TrainValTest.to_numpy(dtype=float))
+
+                    print(file_manip.getCurrentDatetimeForConsole() + "::Export Files")
+                    wbSink_ErrorsForTrainValTest.append(tmpAppendRow_TrainValTest)
+                    wbSink_ErrorsForTrainVal.append(tmpAppendRow_TrainVal)
+                    wbSink_ErrorsForTest.append(tmpAppendRow_Test)
+                    df_Y_realNorm_TrainValTest.to_csv(
+                        o_dir_RealPredictCSV + '/' + _uniqueEvent_ + '_' + _modelName_ + '_OutputReal_Normalized.csv')
+                    df_Y_predNorm_TrainValTest.to_csv(
+                        o_dir_RealPredictCSV + '/' + _uniqueEvent_ + '_' + _modelName_ + '_OutputPred_Normalized.csv')
+                    df_Y_realDenorm_TrainValTest.to_csv(
+                        o_dir_RealPredictCSV + '/' + _uniqueEvent_ + '_' + _modelName_ + '_OutputReal_Denormalized.csv')
+                    df_Y_predDenorm_TrainValTest.to_csv(
+                        o_dir_RealPredictCSV + '/' + _uniqueEvent_ + '_' + _modelName_ + '_OutputPred_Denormalized.csv')
+
+                # o_file = os.path.normpath(dir_path + "/../") + '/Correlation_R2.csv'
+                # my_cal_v2.write_csv(o_file, cor_CSV)
+
+            if self.signCompMethods.hasSummaryMethods() and list_signCompLabels.__len__() > 0:
+                print(file_manip.getCurrentDatetimeForConsole() + "::Signal Compare")
+                self.exportSignalCompareSummary(workbookPath_SignalCompare, list_signCompLabels, list_signCompReal,
+                                                list_signCompPred,
+                                                columnLabels=dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS_FOR_ML])
+
+            completed = True
+            return True
+        finally:
+            # save the errors which have been collected (the finished events are kept on cancel or error too)
+            print(file_manip.getCurrentDatetimeForConsole() + "::Export Workbooks")
+            try:
+                wbSink.saveWorkbookSinks(workbookSinks)
+            finally:
+                if completed:
+                    print(file_manip.getCurrentDatetimeForConsole() + "::Wait for the Figures")
+                figureQueue.close(cancelPending=not completed)
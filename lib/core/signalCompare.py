@@ -1,5 +1,7 @@
 import os
-import dtw
+import itertools
+import multiprocessing
+import concurrent.futures
 
 import numpy as np
 import pandas as pd
@@ -9,6 +11,11 @@ import scipy.stats as stats
 import matplotlib
 import matplotlib.pyplot as plt
 
+import lib.core.file_manipulation as file_manip
+from lib.core.lazyImport import LazyModule
+
+dtw = LazyModule('dtw')  # dtw-python is needed only for the figures of Dynamic Time Warping
+
 # *************************************************************************************************** #
 
 matplotlib.use("Agg")  # Set matplotlib to use non-interface (don't plot figures)
@@ -46,6 +53,31 @@ SC_TIME_LAGGED_CROSS_CORRELATION_LABEL_TITLE = 'Title Lagged Cross Correlation T
 SC_TIME_LAGGED_CROSS_CORRELATION_NO_SPLITS_LABEL_TITLE = 'Title Lagged Cross Correlation No Splits Title'
 
 SC_DYNAMIC_TIME_WARPING_ALIGNMENT_DISTANCE = 'Alignment Distance'
+SC_DYNAMIC_TIME_WARPING_WINDOW_TYPE = 'Window Type'
+SC_DYNAMIC_TIME_WARPING_WINDOW_SIZE = 'Window Size'
+
+# DYNAMIC TIME WARPING WINDOWS (the names of dtw-python)
+SC_DTW_WINDOW_NONE = 'none'
+SC_DTW_WINDOW_SAKOE_CHIBA = 'sakoechiba'  # |i - j| <= window size
+SC_DTW_WINDOW_ITAKURA = 'itakura'  # the Itakura parallelogram (slopes between 1/2 and 2)
+SC_DTW_WINDOW_LIST = [SC_DTW_WINDOW_NONE, SC_DTW_WINDOW_SAKOE_CHIBA, SC_DTW_WINDOW_ITAKURA]
+SC_DTW_DEFAULT_WINDOW_SIZE = 10  # the default Sakoe-Chiba window size (samples)
+
+# SUMMARY (BATCH) COLUMNS
+SC_SUMMARY_COLUMN = 'Column'
+SC_SUMMARY_PEARSON_R = 'Pearson r'
+SC_SUMMARY_PEARSON_R2 = 'Pearson R2'
+SC_SUMMARY_PEARSON_P = 'Pearson p'
+SC_SUMMARY_TIME_LAGGED_CROSS_CORRELATION_OFFSET = 'Time Lagged Cross Correlation Offset'
+SC_SUMMARY_DYNAMIC_TIME_WARPING_DISTANCE = 'Dynamic Time Warping Distance'
+
+SC_TIME_LAGGED_CROSS_CORRELATION_LAG_RATIO = 0.2  # the lags are +-(ratio x signal length)
+
+SC_CROSSCORR_DIRECT_MAX_SIZE = 2048  # the signals up to this size are correlated directly (np.correlate), else FFT
+SC_WINDOWED_LAG_CHUNK_SIZE = 2 ** 21  # the maximum (lags x signal size) elements of each windowed lag chunk
+SC_ROLLING_WINDOW_MAX_WINDOWS = 200  # the rows of the rolling window heatmap (the window starts are strided)
+SC_ROLLING_WINDOW_MAX_LAGS = 201  # the columns of the rolling window heatmap (the lags are strided)
+SC_CROSSCORR_VARIANCE_TOLERANCE = 1e-12  # a lag with a relative variance below this is constant (r = NaN)
 
 
 def crosscorr(datax, datay, lag=0, wrap=False):
@@ -69,6 +101,273 @@ def crosscorr(datax, datay, lag=0, wrap=False):
         return datax.corr(datay.shift(lag))
 
 
+def _lagSums(listA, listB, lags, size):
+    """
+    :return: for each pair (a, b) of (series x size) arrays a (series x lags) array with the sums
+             sum_i(a[i] * b[i - lag]) of the lags
+    """
+    if size <= SC_CROSSCORR_DIRECT_MAX_SIZE:
+        return [np.array([np.correlate(rowA, rowB, mode='full')[lags + size - 1] for rowA, rowB in zip(a, b)])
+                .reshape(a.shape[0], lags.shape[0]) for a, b in zip(listA, listB)]
+    nfft = 1 << (2 * size - 1).bit_length()  # zero padding (no circular overlap of the lags)
+    dictFFT = {}  # the same arrays are transformed once
+    for arr in listA + listB:
+        if id(arr) not in dictFFT.keys():
+            dictFFT[id(arr)] = np.fft.rfft(arr, nfft, axis=-1)
+    return [np.fft.irfft(dictFFT[id(a)] * np.conj(dictFFT[id(b)]), nfft, axis=-1)[:, lags % nfft]
+            for a, b in zip(listA, listB)]
+
+
+def crosscorrLags(datax, datay, lags):
+    """ Lag-N cross correlation of many lags at once.
+    The same values as crosscorr(datax, datay, lag) for each lag (wrap=False): the pairs with NaN are skipped
+    and a lag with less than 2 pairs (or a constant signal) gives NaN. The sums of all the lags are computed
+    together (np.correlate for small signals, FFT for large signals).
+
+    Parameters
+    ----------
+    lags : a list (or array) of int
+    datax, datay : numpy arrays (or pandas.Series objects) of equal length, or (series x time) arrays
+    Returns
+    ----------
+    crosscorrLags : numpy array (the Pearson r of each lag, series x lags for 2D inputs)
+    """
+    x = np.asarray(datax, dtype=float)
+    y = np.asarray(datay, dtype=float)
+    isSingleSeries = x.ndim == 1
+    x = x.reshape(-1, x.shape[-1])
+    y = y.reshape(-1, y.shape[-1])
+    lags = np.asarray(lags, dtype=np.int64).reshape(-1)
+    size = x.shape[1]
+    rs = np.full((x.shape[0], lags.shape[0]), np.nan)
+    validLags = np.abs(lags) < size
+    if x.shape[0] > 0 and np.any(validLags):
+        maskX = (~np.isnan(x)).astype(float)
+        maskY = (~np.isnan(y)).astype(float)
+        # center the signals (smaller rounding errors in the sums)
+        meanX = np.nansum(x, axis=1, keepdims=True) / np.maximum(maskX.sum(axis=1, keepdims=True), 1)
+        meanY = np.nansum(y, axis=1, keepdims=True) / np.maximum(maskY.sum(axis=1, keepdims=True), 1)
+        x0 = np.where(maskX > 0, x - meanX, 0.0)
+        y0 = np.where(maskY > 0, y - meanY, 0.0)
+        x0x0 = x0 * x0
+        y0y0 = y0 * y0
+
+        n, sx, sy, sxx, syy, sxy = _lagSums([maskX, x0, maskX, x0x0, maskX, x0],
+                                            [maskY, maskY, y0, maskY, y0y0, y0], lags[validLags], size)
+        n = np.round(n)
+        cov = n * sxy - sx * sy
+        varX = n * sxx - sx * sx
+        varY = n * syy - sy * sy
+        isValid = (n >= 2) & (varX > SC_CROSSCORR_VARIANCE_TOLERANCE * n * sxx) & \
+                  (varY > SC_CROSSCORR_VARIANCE_TOLERANCE * n * syy)
+        r = np.full(n.shape, np.nan)
+        r[isValid] = np.clip(cov[isValid] / np.sqrt(varX[isValid] * varY[isValid]), -1.0, 1.0)
+        rs[:, validLags] = r
+    return rs[0] if isSingleSeries else rs
+
+
+def _cumulativeSums(x, y):
+    """
+    :return: the cumulative sums (with a leading 0) of the pairs count, x, y, x^2, y^2 and x*y along the last
+             axis (the pairs with NaN are skipped and the signals are centered for smaller rounding errors)
+    """
+    mask = ~np.isnan(x) & ~np.isnan(y)
+    count = mask.sum(axis=-1, keepdims=True)
+    x0 = np.where(mask, x, 0.0)
+    y0 = np.where(mask, y, 0.0)
+    x0 = np.where(mask, x0 - x0.sum(axis=-1, keepdims=True) / np.maximum(count, 1), 0.0)
+    y0 = np.where(mask, y0 - y0.sum(axis=-1, keepdims=True) / np.maximum(count, 1), 0.0)
+    zeros = np.zeros(x.shape[:-1] + (1,))
+    return [np.concatenate([zeros, np.cumsum(arr, axis=-1)], axis=-1)
+            for arr in [mask.astype(float), x0, y0, x0 * x0, y0 * y0, x0 * y0]]
+
+
+def _windowCorr(cumulativeSums, starts, ends, minPeriods=2):
+    """
+    :return: the Pearson r of the windows [starts, ends) from the cumulative sums (NaN for the windows with
+             less than minPeriods pairs or a constant signal)
+    """
+    n, sx, sy, sxx, syy, sxy = [np.take_along_axis(arr, ends, axis=-1) - np.take_along_axis(arr, starts, axis=-1)
+                                for arr in cumulativeSums]
+    n = np.round(n)
+    cov = n * sxy - sx * sy
+    varX = n * sxx - sx * sx
+    varY = n * syy - sy * sy
+    isValid = (n >= max(minPeriods, 2)) & (ends > starts) & \
+              (varX > SC_CROSSCORR_VARIANCE_TOLERANCE * n * sxx) & (varY > SC_CROSSCORR_VARIANCE_TOLERANCE * n * syy)
+    r = np.full(n.shape, np.nan)
+    r[isValid] = np.clip(cov[isValid] / np.sqrt(varX[isValid] * varY[isValid]), -1.0, 1.0)
+    return r
+
+
+def rollingCorr(datax, datay, window: int, center=False):
+    """
+    Rolling window Pearson correlation in O(n) with cumulative sums (the same as
+    Series.rolling(window, center=center).corr(other): a window with NaN values gives NaN).
+    :param datax: a 1D array (or pandas.Series)
+    :param datay: a 1D array (or pandas.Series)
+    :param window: the window size
+    :param center: True to set the result at the center of the window (else at the end)
+    :return: a numpy array with the r of each position
+    """
+    x = np.asarray(datax, dtype=float).reshape(-1)
+    y = np.asarray(datay, dtype=float).reshape(-1)
+    size = x.shape[0]
+    positions = np.arange(size)
+    starts = positions - window // 2 if center else positions - window + 1
+    ends = starts + window
+    isFull = (starts >= 0) & (ends <= size)  # only the full windows have a value
+    r = _windowCorr(_cumulativeSums(x, y), np.clip(starts, 0, size), np.clip(ends, 0, size), minPeriods=window)
+    r[~isFull] = np.nan
+    return r
+
+
+def windowedLagCorr(datax, datay, windowStarts, windowEnds, lags):
+    """
+    Lagged cross correlation of many windows at once: the value of (window, lag) is the same as
+    crosscorr(datax[start:end], datay[start:end], lag). For each lag the pairs of all the windows are found with
+    cumulative sums, so the cost is O(lags x n) for the whole (windows x lags) grid.
+    :param datax: a 1D array (or pandas.Series)
+    :param datay: a 1D array (or pandas.Series)
+    :param windowStarts: the first position of each window
+    :param windowEnds: the position after the last position of each window (clipped to the signal size)
+    :param lags: the lags (int)
+    :return: a (windows x lags) numpy array with the Pearson r
+    """
+    x = np.asarray(datax, dtype=float).reshape(-1)
+    y = np.asarray(datay, dtype=float).reshape(-1)
+    size = x.shape[0]
+    lags = np.asarray(lags, dtype=np.int64).reshape(-1)
+    windowStarts = np.clip(np.asarray(windowStarts, dtype=np.int64).reshape(-1), 0, size)
+    windowEnds = np.clip(np.asarray(windowEnds, dtype=np.int64).reshape(-1), 0, size)
+    rss = np.full((windowStarts.shape[0], lags.shape[0]), np.nan)
+    if size == 0 or windowStarts.shape[0] == 0:
+        return rss
+
+    lagsPerChunk = max(1, SC_WINDOWED_LAG_CHUNK_SIZE // size)  # (lags x size) arrays of limited size
+    for chunkStart in range(0, lags.shape[0], lagsPerChunk):
+        chunkLags = lags[chunkStart:chunkStart + lagsPerChunk]
+        # The shifted y of each lag (lags x size): z[lag, j] = y[j - lag]
+        sourceIndexes = np.arange(size)[None, :] - chunkLags[:, None]
+        isInside = (sourceIndexes >= 0) & (sourceIndexes < size)
+        z = np.where(isInside, y[np.clip(sourceIndexes, 0, size - 1)], np.nan)
+        # crosscorr shifts inside each window, so the pairs of a lag are [start + max(lag, 0), end + min(lag, 0))
+        starts = windowStarts[None, :] + np.maximum(chunkLags, 0)[:, None]
+        ends = np.maximum(windowEnds[None, :] + np.minimum(chunkLags, 0)[:, None], starts)
+        cumulativeSums = _cumulativeSums(np.broadcast_to(x, z.shape), z)
+        rss[:, chunkStart:chunkStart + chunkLags.shape[0]] = \
+            _windowCorr(cumulativeSums, np.clip(starts, 0, size), np.clip(ends, 0, size)).T
+    return rss
+
+
+def pearsonBatch(datax, datay):
+    """
+    Pearson correlation of many series at once (the same as stats.pearsonr after dropping the pairs with NaN).
+    :param datax: a (series x time) array
+    :param datay: a (series x time) array
+    :return: (r, p) arrays (NaN if a series has less than 2 pairs or a constant signal)
+    """
+    x = np.asarray(datax, dtype=float)
+    y = np.asarray(datay, dtype=float)
+    mask = ~np.isnan(x) & ~np.isnan(y)
+    n = mask.sum(axis=1)
+    x = np.where(mask, x, 0.0)
+    y = np.where(mask, y, 0.0)
+    meanX = x.sum(axis=1) / np.maximum(n, 1)
+    meanY = y.sum(axis=1) / np.maximum(n, 1)
+    x = np.where(mask, x - meanX[:, None], 0.0)
+    y = np.where(mask, y - meanY[:, None], 0.0)
+    varX = (x * x).sum(axis=1)
+    varY = (y * y).sum(axis=1)
+
+    r = np.full(x.shape[0], np.nan)
+    p = np.full(x.shape[0], np.nan)
+    isValid = (n >= 2) & (varX > 0) & (varY > 0)
+    r[isValid] = np.clip((x * y).sum(axis=1)[isValid] / np.sqrt(varX[isValid] * varY[isValid]), -1.0, 1.0)
+    isValid &= n > 2  # (p = 1 for 2 pairs, as stats.pearsonr)
+    p[(n == 2) & ~np.isnan(r)] = 1.0
+    ab = n[isValid] / 2 - 1  # r follows a beta distribution on [-1, 1] (the same p value as stats.pearsonr)
+    p[isValid] = 2 * stats.beta.sf(np.abs(r[isValid]), ab, ab, loc=-1, scale=2)
+    return r, p
+
+
+def dtwDistance(data1, data2, windowType=SC_DTW_WINDOW_NONE, windowSize=None):
+    """
+    The Dynamic Time Warping distance (the same as dtw.dtw(data1, data2, window_type=...).distance with the
+    default symmetric2 step pattern), without the cost matrix: the anti-diagonals of the cumulative cost are
+    computed one after the other and only the last two are kept, so the memory is O(n).
+    :param data1: a 1D array
+    :param data2: a 1D array
+    :param windowType: SC_DTW_WINDOW_NONE, SC_DTW_WINDOW_SAKOE_CHIBA or SC_DTW_WINDOW_ITAKURA
+    :param windowSize: the window size of Sakoe-Chiba
+    :return: the distance (np.inf if the window doesn't allow a warping path)
+    """
+    x = np.asarray(data1, dtype=float).reshape(-1)
+    y = np.asarray(data2, dtype=float).reshape(-1)
+    n = x.shape[0]
+    m = y.shape[0]
+    if windowType not in SC_DTW_WINDOW_LIST:
+        raise ValueError('Unknown Dynamic Time Warping window: ' + str(windowType))
+    if windowType == SC_DTW_WINDOW_SAKOE_CHIBA and windowSize is None:
+        raise ValueError('The Sakoe-Chiba window needs a window size')
+    if n == 0 or m == 0:
+        return np.nan
+
+    # The diagonals are indexed by i + 1 (index 0 is the cell before the first row)
+    prevDiag2 = np.full(n + 1, np.inf)  # diagonal k - 2
+    prevDiag1 = np.full(n + 1, np.inf)  # diagonal k - 1
+    currDiag = np.full(n + 1, np.inf)
+    for k in range(0, n + m - 1):  # the cells (i, j) with i + j = k
+        iStart = max(0, k - m + 1)
+        iEnd = min(n - 1, k)
+        if windowType == SC_DTW_WINDOW_SAKOE_CHIBA:  # |i - j| <= windowSize
+            iStart = max(iStart, -((windowSize - k) // 2))
+            iEnd = min(iEnd, (k + windowSize) // 2)
+        currDiag.fill(np.inf)
+        if iStart <= iEnd:
+            i = np.arange(iStart, iEnd + 1)
+            cost = np.abs(x[i] - y[k - i])
+            if k == 0:
+                cumCost = cost
+            else:
+                cumCost = np.minimum(np.minimum(prevDiag2[i] + 2 * cost,  # (i - 1, j - 1)
+                                                prevDiag1[i] + cost),  # (i - 1, j)
+                                     prevDiag1[i + 1] + cost)  # (i, j - 1)
+            if windowType == SC_DTW_WINDOW_ITAKURA:  # (1-based indexes)
+                i1 = i + 1
+                j1 = k - i + 1
+                isInside = (j1 < 2 * i1) & (i1 <= 2 * j1) & (i1 >= n - 1 - 2 * (m - j1)) & \
+                           (j1 > m - 1 - 2 * (n - i1))
+                isInside |= (i1 == 1) & (j1 == 1)
+                cumCost = np.where(isInside, cumCost, np.inf)
+            currDiag[i + 1] = cumCost
+        prevDiag2, prevDiag1, currDiag = prevDiag1, currDiag, prevDiag2
+    return float(prevDiag1[n])
+
+
+def dtwDistanceBatch(listData1: [], listData2: [], numOfJobs=None, windowType=SC_DTW_WINDOW_NONE,
+                     windowSize=None):
+    """
+    The Dynamic Time Warping distances of many pairs of series (in parallel processes if numOfJobs != 1).
+    :param listData1: a list of 1D arrays
+    :param listData2: a list of 1D arrays
+    :param numOfJobs: the number of processes (None or -1 = all the CPUs)
+    :param windowType: the window of dtwDistance
+    :param windowSize: the window size of dtwDistance
+    :return: a list with the distances
+    """
+    if numOfJobs == -1:
+        numOfJobs = None
+    if numOfJobs == 1 or listData1.__len__() <= 1:
+        return [dtwDistance(data1, data2, windowType, windowSize) for data1, data2 in zip(listData1, listData2)]
+    # The workers are spawned (not forked), since this runs in the threads of the GUI/pipeline workers
+    with concurrent.futures.ProcessPoolExecutor(max_workers=numOfJobs,
+                                                mp_context=multiprocessing.get_context('spawn')) as executor:
+        return list(executor.map(dtwDistance, listData1, listData2, itertools.repeat(windowType),
+                                 itertools.repeat(windowSize),
+                                 chunksize=max(1, listData1.__len__() // (4 * (numOfJobs or os.cpu_count() or 1)))))
+
+
 class SignalCompare:
     def __init__(self):
         self._SC_dictMethods = {}
@@ -108,13 +407,18 @@ class SignalCompare:
         self._SC_dictMethods[SC_DYNAMIC_TIME_WARPING] = {
             SC_EXEC_STATE: False,
             SC_EXEC_FUNC: self.method_DynamicTimeWarping,
-            SC_DYNAMIC_TIME_WARPING_ALIGNMENT_DISTANCE:  np.nan
+            SC_DYNAMIC_TIME_WARPING_ALIGNMENT_DISTANCE:  np.nan,
+            SC_DYNAMIC_TIME_WARPING_WINDOW_TYPE: SC_DTW_WINDOW_NONE,
+            SC_DYNAMIC_TIME_WARPING_WINDOW_SIZE: None
         }
 
     # ***************************** #
     # ***** SETTERS / GETTERS ***** #
     # ***************************** #
 
+    def setMethodState(self, methodKey: str, state: bool):
+        self._SC_dictMethods[methodKey][SC_EXEC_STATE] = state
+
     def setPearsonCorr_state(self, state: bool):
         self._SC_dictMethods[SC_PEARSON_CORRELATION][SC_EXEC_STATE] = state
 
@@ -130,6 +434,19 @@ class SignalCompare:
     def setDynamicTimeWarping_state(self, state: bool):
         self._SC_dictMethods[SC_DYNAMIC_TIME_WARPING][SC_EXEC_STATE] = state
 
+    def setDynamicTimeWarping_window(self, windowType: str, windowSize=None):
+        """
+        :param windowType: SC_DTW_WINDOW_NONE, SC_DTW_WINDOW_SAKOE_CHIBA or SC_DTW_WINDOW_ITAKURA
+        :param windowSize: the window size of Sakoe-Chiba (in samples)
+        """
+        if windowType not in SC_DTW_WINDOW_LIST:
+            raise ValueError('Unknown Dynamic Time Warping window: ' + str(windowType))
+        if windowType == SC_DTW_WINDOW_SAKOE_CHIBA and \
+                (isinstance(windowSize, bool) or not isinstance(windowSize, (int, np.integer)) or windowSize < 0):
+            raise ValueError('The Sakoe-Chiba window size must be a non-negative integer: ' + str(windowSize))
+        self._SC_dictMethods[SC_DYNAMIC_TIME_WARPING][SC_DYNAMIC_TIME_WARPING_WINDOW_TYPE] = windowType
+        self._SC_dictMethods[SC_DYNAMIC_TIME_WARPING][SC_DYNAMIC_TIME_WARPING_WINDOW_SIZE] = windowSize
+
     def getPearsonCorr_state(self):
         return self._SC_dictMethods[SC_PEARSON_CORRELATION][SC_EXEC_STATE]
 
@@ -216,7 +533,8 @@ class SignalCompare:
         # Interpolate missing data.
         df_interpolated = df_arrData.interpolate()
         # Compute rolling window synchrony
-        rolling_r = df_interpolated[labelYaxis_1].rolling(window=r_window, center=True).corr(df_interpolated[labelYaxis_2])
+        rolling_r = pd.Series(rollingCorr(df_interpolated[labelYaxis_1], df_interpolated[labelYaxis_2],
+                                          window=r_window, center=True), index=df_interpolated.index)
         _, ax = plt.subplots(2, 1, figsize=(14, 6))
         df_arrData.rolling(window=r_window, center=True).median().plot(ax=ax[0])
         ax[0].set(xlabel=xAxisLabel, ylabel=labelYaxisRollingR)
@@ -239,8 +557,8 @@ class SignalCompare:
         df_arrData = pd.DataFrame({labelYaxis_1: arrData1, labelYaxis_2: arrData2})
         d1 = df_arrData[labelYaxis_1]
         d2 = df_arrData[labelYaxis_2]
-        timeStep_mul_FPS = int(0.2 * arrData1.shape[0])
-        rs = [crosscorr(d1, d2, lag) for lag in range(-timeStep_mul_FPS, timeStep_mul_FPS + 1)]
+        timeStep_mul_FPS = int(SC_TIME_LAGGED_CROSS_CORRELATION_LAG_RATIO * arrData1.shape[0])
+        rs = crosscorrLags(d1, d2, range(-timeStep_mul_FPS, timeStep_mul_FPS + 1)).tolist()
 
         data_size = timeStep_mul_FPS * 2
         data_ticks = []
@@ -285,7 +603,7 @@ class SignalCompare:
         no_splits = int(0.1*timeStep_mul_FPS)
         samples_per_split = df_arrData.shape[0] / no_splits
 
-        rs = [crosscorr(d1, d2, lag) for lag in range(-timeStep_mul_FPS, timeStep_mul_FPS + 1)]
+        rs = crosscorrLags(d1, d2, range(-timeStep_mul_FPS, timeStep_mul_FPS + 1)).tolist()
 
         data_size = timeStep_mul_FPS * 2
         data_ticks = []
@@ -300,13 +618,12 @@ class SignalCompare:
 
         offset = np.ceil(len(rs) / 2) - np.argmax(rs)
         print(offset)
-        rss = []
-        for t in range(0, no_splits):
-            d1 = df_arrData[labelYaxis_1].loc[t * samples_per_split:(t + 1) * samples_per_split]
-            d2 = df_arrData[labelYaxis_2].loc[t * samples_per_split:(t + 1) * samples_per_split]
-            rs = [crosscorr(d1, d2, lag) for lag in range(timeStep_mul_FPS, timeStep_mul_FPS + 1)]
-            rss.append(rs)
-        rss = pd.DataFrame(rss)
+        # the splits [t * samples_per_split, (t + 1) * samples_per_split] (label slices include both ends)
+        split_starts = np.ceil(np.arange(0, no_splits) * samples_per_split).astype(np.int64)
+        split_ends = np.floor(np.arange(1, no_splits + 1) * samples_per_split).astype(np.int64) + 1
+        rss = pd.DataFrame(windowedLagCorr(df_arrData[labelYaxis_1], df_arrData[labelYaxis_2],
+                                           split_starts, split_ends,
+                                           range(timeStep_mul_FPS, timeStep_mul_FPS + 1)))
 
         data_size = timeStep_mul_FPS * 2
         data_ticks = []
@@ -338,31 +655,23 @@ class SignalCompare:
         labelYaxis_2 = 'Signal-2'
         df_arrData = pd.DataFrame({labelYaxis_1: arrData1, labelYaxis_2: arrData2})
 
-        # frequency = 5400
-        frequency = 500
-        t_start = 0
+        frequency = arrData1.shape[0]  # the windows slide over the whole signal
         timeStep_mul_FPS = int(0.2 * arrData1.shape[0])
-        t_end = t_start + (timeStep_mul_FPS * 2)
-        rss = []
-        while t_end < frequency:
-            d1 = df_arrData[labelYaxis_1].iloc[t_start:t_end]
-            d2 = df_arrData[labelYaxis_2].iloc[t_start:t_end]
-            rs = [crosscorr(d1, d2, lag, wrap=False) for lag in range(timeStep_mul_FPS, timeStep_mul_FPS)]
-            rss.append(rs)
-            t_start = t_start + 1
-            t_end = t_end + 1
-        rss = pd.DataFrame(rss)
-
-        data_size = timeStep_mul_FPS * 2
-        data_ticks = []
-        data_labels = []
-        for i in range(0, 7):
-            if i == 0:
-                data_ticks.append(int(0))
-                data_labels.append(int(-data_size / 2))
-            else:
-                data_ticks.append(int(data_ticks[i - 1] + (data_size / 6)))
-                data_labels.append(int(data_labels[i - 1] + (data_size / 6)))
+        window_size = timeStep_mul_FPS * 2
+        # the windows [t_start, t_start + window_size) with t_start + window_size < frequency and the lags are
+        # strided, so the heatmap has at most SC_ROLLING_WINDOW_MAX_WINDOWS x SC_ROLLING_WINDOW_MAX_LAGS cells
+        numOfWindows = max(frequency - window_size, 0)
+        windowStep = max(1, int(np.ceil(numOfWindows / SC_ROLLING_WINDOW_MAX_WINDOWS)))
+        t_starts = np.arange(0, numOfWindows, windowStep)
+        lagStep = max(1, int(np.ceil((2 * timeStep_mul_FPS + 1) / SC_ROLLING_WINDOW_MAX_LAGS)))
+        lags = np.arange(-timeStep_mul_FPS, timeStep_mul_FPS + 1, lagStep)
+        rss = pd.DataFrame(windowedLagCorr(df_arrData[labelYaxis_1], df_arrData[labelYaxis_2],
+                                           t_starts, t_starts + window_size, lags),
+                           index=t_starts, columns=lags)
+
+        data_size = lags.shape[0] - 1
+        data_ticks = np.linspace(0, data_size, 7).astype(int).tolist()  # 7 ticks from the first to the last lag
+        data_labels = lags[data_ticks].tolist()
 
         f, ax = plt.subplots(figsize=(10, 10))
         sns.heatmap(rss, cmap='RdBu_r', ax=ax)
@@ -374,6 +683,7 @@ class SignalCompare:
         final_export_path = os.path.normpath(exportFigDirPath) + '/' + 'FigNo07_' + exportFigFileName + \
                             '_RollingWindowTimeLaggedCrossCorrelation.png'
         plt.savefig(final_export_path)
+        plt.close()
 
     def method_DynamicTimeWarping(self, arrData1: np.ndarray, arrData2: np.ndarray, exportFigDirPath: str, exportFigFileName: str):
         labelYaxis_1 = 'Signal-1'
@@ -383,7 +693,21 @@ class SignalCompare:
         d1 = df_arrData[labelYaxis_1].interpolate().values
         d2 = df_arrData[labelYaxis_2].interpolate().values
 
-        alignment = dtw.dtw(d1, d2, keep_internals=True)
+        windowType = self._SC_dictMethods[SC_DYNAMIC_TIME_WARPING][SC_DYNAMIC_TIME_WARPING_WINDOW_TYPE]
+        windowSize = self._SC_dictMethods[SC_DYNAMIC_TIME_WARPING][SC_DYNAMIC_TIME_WARPING_WINDOW_SIZE]
+        distance = dtwDistance(d1, d2, windowType, windowSize)
+        self._SC_dictMethods[SC_DYNAMIC_TIME_WARPING][SC_DYNAMIC_TIME_WARPING_ALIGNMENT_DISTANCE] = distance
+
+        if exportFigDirPath is None:  # the distance only (the cost matrix and the alignment are not needed)
+            return
+        if np.isinf(distance):  # dtw.dtw raises an error when there is no warping path
+            print(file_manip.getCurrentDatetimeForConsole() + "::Dynamic Time Warping: the " + windowType +
+                  " window doesn't allow a warping path (the alignment figures of " + exportFigFileName +
+                  " are skipped)")
+            return
+
+        windowArgs = {'window_size': windowSize} if windowType == SC_DTW_WINDOW_SAKOE_CHIBA else {}
+        alignment = dtw.dtw(d1, d2, keep_internals=True, window_type=windowType, window_args=windowArgs)
 
         # Display the warping curve, i.e. the alignment curve
         alignment.plot(type="threeway")
@@ -392,7 +716,7 @@ class SignalCompare:
         plt.savefig(final_export_path)
 
         # Align and plot with the Rabiner-Juang type VI-c unsmoothed recursion
-        dtw.dtw(d1, d2, keep_internals=True,
+        dtw.dtw(d1, d2, keep_internals=True, window_type=windowType, window_args=windowArgs,
                 step_pattern=dtw.rabinerJuangStepPattern(6, "c")).plot(type="twoway", offset=-2)
         final_export_path = os.path.normpath(exportFigDirPath) + '/' + 'FigNo06_' + exportFigFileName + \
                             '_DynamicTimeWrappingTwowayRabinerJuangStepPattern.png'
@@ -404,8 +728,80 @@ class SignalCompare:
         final_export_path = os.path.normpath(exportFigDirPath) + '/' + 'FigNo07_' + exportFigFileName + \
                             '_DynamicTimeWrappingRabinerPlotCJuangStepPattern.png'
         plt.savefig(final_export_path)
-
-        self._SC_dictMethods[SC_DYNAMIC_TIME_WARPING][SC_DYNAMIC_TIME_WARPING_ALIGNMENT_DISTANCE] = alignment.distance
+        plt.close('all')
+
+    def signComp_batch_(self, arrData1: np.ndarray, arrData2: np.ndarray, seriesLengths=None, rowLabels=None,
+                        rowLabelHeaders=None, columnLabels=None, numOfJobs=None):
+        """
+        Compare many pairs of signals at once and return one summary table (no figures). Only the enabled methods
+        with scalar results are computed (Pearson r/R2/p, Time Lagged Cross Correlation offset and Dynamic Time
+        Warping distance).
+        :param arrData1: the first signals (rows x columns x time), NaN padded after the length of each row
+        :param arrData2: the second signals (rows x columns x time)
+        :param seriesLengths: the length of the signals of each row (None = all the time steps)
+        :param rowLabels: a list with the labels of each row (e.g. [event, model])
+        :param rowLabelHeaders: the headers of the row labels (e.g. ['Event', 'Technique'])
+        :param columnLabels: the label of each column
+        :param numOfJobs: the processes of Dynamic Time Warping (None or -1 = all the CPUs)
+        :return: a DataFrame with a row for each (row, column)
+        """
+        arrData1 = np.asarray(arrData1, dtype=float)
+        arrData2 = np.asarray(arrData2, dtype=float)
+        numOfRows, numOfColumns, numOfSteps = arrData1.shape
+        if seriesLengths is None:
+            seriesLengths = np.full(numOfRows, numOfSteps)
+        if rowLabels is None:
+            rowLabels = [[_row_] for _row_ in range(numOfRows)]
+        if rowLabelHeaders is None:
+            rowLabelHeaders = ['Row']
+        if columnLabels is None:
+            columnLabels = list(range(numOfColumns))
+
+        # A signal in each row (the padding is NaN)
+        padding = np.arange(numOfSteps)[None, None, :] >= np.asarray(seriesLengths).reshape(-1, 1, 1)
+        data1 = np.where(padding, np.nan, arrData1).reshape(-1, numOfSteps)
+        data2 = np.where(padding, np.nan, arrData2).reshape(-1, numOfSteps)
+        signalLengths = np.repeat(np.asarray(seriesLengths, dtype=np.int64), numOfColumns)
+
+        dictSummary = {}
+        for _index_, _header_ in enumerate(rowLabelHeaders):
+            dictSummary[_header_] = [_labels_[_index_] for _labels_ in rowLabels for _ in range(numOfColumns)]
+        dictSummary[SC_SUMMARY_COLUMN] = list(columnLabels) * numOfRows
+
+        if self._SC_dictMethods[SC_PEARSON_CORRELATION][SC_EXEC_STATE]:
+            pearson_r, pearson_p = pearsonBatch(data1, data2)
+            dictSummary[SC_SUMMARY_PEARSON_R] = pearson_r
+            dictSummary[SC_SUMMARY_PEARSON_R2] = pearson_r * pearson_r
+            dictSummary[SC_SUMMARY_PEARSON_P] = pearson_p
+
+        if self._SC_dictMethods[SC_TIME_LAGGED_CROSS_CORRELATION][SC_EXEC_STATE]:
+            offsets = np.full(signalLengths.shape[0], np.nan)
+            for _length_ in np.unique(signalLengths):  # the signals of the same length have the same lags
+                signals = signalLengths == _length_
+                timeStep_mul_FPS = int(SC_TIME_LAGGED_CROSS_CORRELATION_LAG_RATIO * _length_)
+                rs = crosscorrLags(data1[signals, :_length_], data2[signals, :_length_],
+                                   range(-timeStep_mul_FPS, timeStep_mul_FPS + 1))
+                offsets[signals] = np.ceil(rs.shape[1] / 2) - np.argmax(rs, axis=1)
+            dictSummary[SC_SUMMARY_TIME_LAGGED_CROSS_CORRELATION_OFFSET] = offsets
+
+        if self._SC_dictMethods[SC_DYNAMIC_TIME_WARPING][SC_EXEC_STATE]:
+            listData1 = [pd.Series(data1[_i_, :signalLengths[_i_]]).interpolate().values
+                         for _i_ in range(data1.shape[0])]
+            listData2 = [pd.Series(data2[_i_, :signalLengths[_i_]]).interpolate().values
+                         for _i_ in range(data2.shape[0])]
+            dictSummary[SC_SUMMARY_DYNAMIC_TIME_WARPING_DISTANCE] = dtwDistanceBatch(
+                listData1, listData2, numOfJobs=numOfJobs,
+                windowType=self._SC_dictMethods[SC_DYNAMIC_TIME_WARPING][SC_DYNAMIC_TIME_WARPING_WINDOW_TYPE],
+                windowSize=self._SC_dictMethods[SC_DYNAMIC_TIME_WARPING][SC_DYNAMIC_TIME_WARPING_WINDOW_SIZE])
+
+        return pd.DataFrame(dictSummary)
+
+    def hasSummaryMethods(self):
+        """
+        :return: True if a method with scalar results (for signComp_batch_) is enabled
+        """
+        return any(self._SC_dictMethods[_method_][SC_EXEC_STATE] for _method_ in
+                   [SC_PEARSON_CORRELATION, SC_TIME_LAGGED_CROSS_CORRELATION, SC_DYNAMIC_TIME_WARPING])
 
     def signComp_exec_(self, arrData1: np.ndarray, arrData2: np.ndarray, exportFigDirPath: str, exportFigFileName: str):
         for _method_ in self._SC_dictMethods.keys():
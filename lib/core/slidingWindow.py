@@ -0,0 +1,159 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# *************************************************************************************************** #
+
+SW_DTYPE = np.float32  # the dtype of the exported window arrays
+
+SW_SEQUENTIAL = 'Sequential'
+SW_AVERAGE = 'Average'
+SW_SEQUENTIAL_AVERAGE = 'Sequential-Average'
+
+
+def _asArray2D(arr):
+    """
+    Convert a list of rows (or an array) to a 2D float64 array (rows x columns).
+    :param arr: list of lists or array
+    :return: a 2D numpy array
+    """
+    arr = np.asarray(arr, dtype=np.float64)  # make it float64 (the computations are done in double precision)
+    if arr.ndim == 1:  # if a single column has been given as a 1D array
+        arr = arr.reshape(-1, 1)  # make it a column
+    return arr
+
+
+def _rowWindows(arr, windowSize, numOfSamples, startIndex=0):
+    """
+    Create a (numOfSamples x windowSize x columns) view of the arr. The i-th window contains
+    the rows [startIndex + i, startIndex + i + windowSize).
+    :param arr: a 2D numpy array
+    :param windowSize: the number of rows in each window
+    :param numOfSamples: the number of windows
+    :param startIndex: the row of the first window
+    :return: a read-only view of arr (no copy)
+    """
+    # sliding_window_view returns (rows - windowSize + 1, columns, windowSize), so swap the last two axes
+    windows = sliding_window_view(arr, windowSize, axis=0).swapaxes(1, 2)
+    return windows[startIndex:startIndex + numOfSamples]
+
+
+def _emptyWindows(columns):
+    return np.empty((0, columns), dtype=SW_DTYPE)
+
+
+def sequentialWindows(arrInput, arrOutput, windowSize: int):
+    """
+    Sequential Regression windows. For each sample i the input is the concatenation of the input rows
+    [i, i+windowSize) and the output is the concatenation of the output rows [i+windowSize, i+2*windowSize).
+    :param arrInput: list of rows or 2D array with the input values
+    :param arrOutput: list of rows or 2D array with the output values
+    :param windowSize: the method index (number of rows per window)
+    :return: X, y (C-contiguous float32 arrays)
+    """
+    arrInput = _asArray2D(arrInput)
+    arrOutput = _asArray2D(arrOutput)
+    numOfSamples = max(arrInput.shape[0] - (2 * windowSize + 1), 0)  # same as range(0, len - (2 * m + 1))
+    if numOfSamples == 0:
+        return _emptyWindows(windowSize * arrInput.shape[1]), _emptyWindows(windowSize * arrOutput.shape[1])
+
+    X = _rowWindows(arrInput, windowSize, numOfSamples).reshape(numOfSamples, -1)
+    y = _rowWindows(arrOutput, windowSize, numOfSamples, startIndex=windowSize).reshape(numOfSamples, -1)
+    return np.ascontiguousarray(X, dtype=SW_DTYPE), np.ascontiguousarray(y, dtype=SW_DTYPE)
+
+
+def averageWindows(arrInput, arrOutput, windowSize: int):
+    """
+    Average Regression windows. For each sample i the input (output) is the mean of the
+    input (output) rows [i, i+windowSize).
+    :param arrInput: list of rows or 2D array with the input values
+    :param arrOutput: list of rows or 2D array with the output values
+    :param windowSize: the method index (number of rows per window)
+    :return: X, y (C-contiguous float32 arrays)
+    """
+    arrInput = _asArray2D(arrInput)
+    arrOutput = _asArray2D(arrOutput)
+    numOfSamples = max(arrInput.shape[0] - (windowSize + 1), 0)  # same as range(0, len - (m + 1))
+    if numOfSamples == 0:
+        return _emptyWindows(arrInput.shape[1]), _emptyWindows(arrOutput.shape[1])
+
+    X = _rowWindows(arrInput, windowSize, numOfSamples).sum(axis=1) / windowSize
+    y = _rowWindows(arrOutput, windowSize, numOfSamples).sum(axis=1) / windowSize
+    return np.ascontiguousarray(X, dtype=SW_DTYPE), np.ascontiguousarray(y, dtype=SW_DTYPE)
+
+
+def sequentialAverageWindows(arrInput, arrOutput, windowSize: int):
+    """
+    Sequential-Average Regression windows. For each sample i the input is the concatenation of the input
+    rows [i, i+windowSize) minus their mean and the output is the same as in Sequential Regression.
+    :param arrInput: list of rows or 2D array with the input values
+    :param arrOutput: list of rows or 2D array with the output values
+    :param windowSize: the method index (number of rows per window)
+    :return: X, y (C-contiguous float32 arrays)
+    """
+    arrInput = _asArray2D(arrInput)
+    arrOutput = _asArray2D(arrOutput)
+    numOfSamples = max(arrInput.shape[0] - (2 * windowSize + 1), 0)  # same as range(0, len - (2 * m + 1))
+    if numOfSamples == 0:
+        return _emptyWindows(windowSize * arrInput.shape[1]), _emptyWindows(windowSize * arrOutput.shape[1])
+
+    windows = _rowWindows(arrInput, windowSize, numOfSamples)
+    windowsMean = windows.sum(axis=1, keepdims=True) / windowSize  # the mean of each window
+    X = (windows - windowsMean).reshape(numOfSamples, -1)  # Non absolute values (as in the widget)
+    y = _rowWindows(arrOutput, windowSize, numOfSamples, startIndex=windowSize).reshape(numOfSamples, -1)
+    return np.ascontiguousarray(X, dtype=SW_DTYPE), np.ascontiguousarray(y, dtype=SW_DTYPE)
+
+
+def movingAverageFilter(arr, filterSize: int):
+    """
+    Filter each column of arr with a moving average of filterSize. The result is the same as
+    np.convolve(column, np.ones(filterSize) / filterSize, mode='same') for every column.
+    :param arr: 2D array (samples x columns)
+    :param filterSize: the size of the moving average kernel
+    :return: the filtered array (C-contiguous float32)
+    """
+    arr = _asArray2D(arr)
+    if filterSize <= 1 or arr.shape[0] == 0:  # nothing to filter
+        return np.ascontiguousarray(arr, dtype=SW_DTYPE)
+
+    padded = np.pad(arr, ((filterSize - 1, filterSize - 1), (0, 0)))  # zero pad as in full convolution
+    fullConv = sliding_window_view(padded, filterSize, axis=0).sum(axis=-1) / filterSize
+    outSize = max(arr.shape[0], filterSize)  # the size of the 'same' mode
+    startIndex = (fullConv.shape[0] - outSize) // 2  # the center of the full convolution
+    return np.ascontiguousarray(fullConv[startIndex:startIndex + outSize], dtype=SW_DTYPE)
+
+
+_SW_dictMethods = {
+    SW_SEQUENTIAL: sequentialWindows,
+    SW_AVERAGE: averageWindows,
+    SW_SEQUENTIAL_AVERAGE: sequentialAverageWindows
+}
+
+
+def createWindows(method: str, arrInput, arrOutput, windowSize: int):
+    """
+    Create the (unfiltered) window arrays of an event for the specified method.
+    :param method: SW_SEQUENTIAL, SW_AVERAGE or SW_SEQUENTIAL_AVERAGE
+    :param arrInput: list of rows or 2D array with the input values
+    :param arrOutput: list of rows or 2D array with the output values
+    :param windowSize: the method index
+    :return: X, y (C-contiguous float32 arrays)
+    """
+    return _SW_dictMethods[method](arrInput, arrOutput, windowSize)
+
+
+def createWindowHeaders(method: str, inputHeaders: [], outputHeaders: [], windowSize: int):
+    """
+    Create the column names of the window arrays.
+    :param method: SW_SEQUENTIAL, SW_AVERAGE or SW_SEQUENTIAL_AVERAGE
+    :param inputHeaders: the input column names
+    :param outputHeaders: the output column names
+    :param windowSize: the method index
+    :return: inputHeadersForML, outputHeadersForML
+    """
+    if method == SW_AVERAGE:
+        return inputHeaders, outputHeaders
+    inputHeadersForML = [columnName + '_SEQ_' + str(_index_)
+                         for _index_ in range(0, windowSize) for columnName in inputHeaders]
+    outputHeadersForML = [columnName + '_SEQ_' + str(_index_)
+                          for _index_ in range(0, windowSize) for columnName in outputHeaders]
+    return inputHeadersForML, outputHeadersForML
@@ -0,0 +1,202 @@
+import os
+import json
+import shutil
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+import lib.core.file_manipulation as file_manip
+
+# *************************************************************************************************** #
+
+TC_DEFAULT_DIR_NAME = 'TableCache'  # the name of the cache folder (next to the exported data)
+TC_DEFAULT_MAX_SIZE_GB = 5.0  # the maximum size of the cache before the least recently used entries are deleted
+
+_TC_META_FILE = 'meta.json'
+_TC_HASH_BLOCK_SIZE = 16 * 1024 * 1024  # read the file in blocks of 16MB for hashing
+
+_TC_KEY_SOURCE_PATH = 'source-path'
+_TC_KEY_COLUMNS = 'columns'
+_TC_KEY_COLUMN_FILES = 'column-files'
+_TC_KEY_OBJECT_COLUMNS = 'object-columns'
+_TC_KEY_NULL_MASK_FILES = 'null-mask-files'  # {column: the .npy file with the mask of the missing values}
+_TC_KEY_FORMAT_VERSION = 'format-version'
+_TC_FORMAT_VERSION = 2  # the entries of other versions are not loaded (version 1 stored NaN strings as 'nan')
+
+
+def hashFileContent(path):
+    """
+    Calculate the hash of the content of a file.
+    :param path: the path of the file
+    :return: the hex digest of the file content
+    """
+    fileHash = hashlib.blake2b(digest_size=20)
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(_TC_HASH_BLOCK_SIZE), b''):
+            fileHash.update(block)
+    return fileHash.hexdigest()
+
+
+class TableCache:
+    """
+    An on-disk cache for the parsed (column projected) table files. Each entry is stored as one .npy file
+    per column and it is loaded memory-mapped. The entries are keyed by the hash of the file content and the
+    read options, so a changed file never hits an old entry.
+    """
+    def __init__(self, cacheDir: str, maxSizeGB=TC_DEFAULT_MAX_SIZE_GB):
+        self._cacheDir = os.path.normpath(cacheDir)
+        self._maxSize = maxSizeGB * 1024.0 * 1024.0 * 1024.0  # in bytes
+
+    def getCacheDir(self):
+        return self._cacheDir
+
+    @staticmethod
+    def getKey(path, useColumns=None, dtypes=None, readMode=''):
+        """
+        Create the key of a table file for the specified read options.
+        :param path: the path of the table file
+        :param useColumns: the columns to be read
+        :param dtypes: a dictionary {column: dtype}
+        :param readMode: any other option which changes the read data
+        :return: the key (str)
+        """
+        options = json.dumps({
+            'columns': useColumns,
+            'dtypes': None if dtypes is None else {str(key): np.dtype(dtypes[key]).str for key in dtypes.keys()},
+            'mode': readMode
+        }, sort_keys=True)
+        return hashFileContent(path) + '_' + hashlib.blake2b(options.encode(), digest_size=8).hexdigest()
+
+    def _entryDir(self, key):
+        return os.path.normpath(self._cacheDir + '/' + key)
+
+    def load(self, key):
+        """
+        Load an entry of the cache. The columns are memory-mapped (read-only).
+        :param key: the key of the entry
+        :return: a DataFrame (None if the entry doesn't exist)
+        """
+        entryDir = self._entryDir(key)
+        metaPath = os.path.normpath(entryDir + '/' + _TC_META_FILE)
+        if not os.path.exists(metaPath):
+            return None
+        try:
+            with open(metaPath, 'r') as f:
+                meta = json.load(f)
+            if meta.get(_TC_KEY_FORMAT_VERSION) != _TC_FORMAT_VERSION:
+                raise ValueError('Old cache entry')
+            columnData = {}
+            for column, fileName in zip(meta[_TC_KEY_COLUMNS], meta[_TC_KEY_COLUMN_FILES]):
+                arr = np.load(os.path.normpath(entryDir + '/' + fileName), mmap_mode='r')
+                if column in meta[_TC_KEY_OBJECT_COLUMNS]:
+                    arr = arr.astype(object)  # the strings are stored as fixed size unicode
+                    if column in meta[_TC_KEY_NULL_MASK_FILES].keys():  # restore the missing values
+                        arr[np.load(os.path.normpath(entryDir + '/' + meta[_TC_KEY_NULL_MASK_FILES][column]))] = \
+                            np.nan
+                columnData[column] = arr
+        except (OSError, ValueError, KeyError):  # broken (or old) entry
+            self.remove(key)
+            return None
+        os.utime(metaPath)  # set the access time of the entry (for eviction)
+        return pd.DataFrame(columnData, columns=meta[_TC_KEY_COLUMNS], copy=False)
+
+    def store(self, key, dataFrame: pd.DataFrame, sourcePath=''):
+        """
+        Store a DataFrame in the cache and evict the least recently used entries if the cache is full.
+        :param key: the key of the entry
+        :param dataFrame: the DataFrame to be stored
+        :param sourcePath: the path of the table file (used by invalidate)
+        :return: Nothing
+        """
+        entryDir = self._entryDir(key)
+        tmpDir = entryDir + '_tmp'  # write in a tmp folder and rename it (no half written entries)
+        shutil.rmtree(tmpDir, ignore_errors=True)
+        file_manip.checkAndCreateFolders(tmpDir)
+
+        meta = {_TC_KEY_FORMAT_VERSION: _TC_FORMAT_VERSION,
+                _TC_KEY_SOURCE_PATH: os.path.normpath(sourcePath) if sourcePath else '',
+                _TC_KEY_COLUMNS: [], _TC_KEY_COLUMN_FILES: [], _TC_KEY_OBJECT_COLUMNS: [],
+                _TC_KEY_NULL_MASK_FILES: {}}
+        for index, column in enumerate(dataFrame.columns):
+            arr = dataFrame[column].to_numpy()
+            if arr.dtype.kind not in 'biufcmM':  # not a numeric/datetime column
+                # the missing values are stored as a mask (astype(str) would make them the string 'nan')
+                nullMask = pd.isna(arr)
+                if nullMask.any():
+                    arr = np.where(nullMask, '', arr)
+                    maskFileName = 'null_mask_' + str(index) + '.npy'
+                    np.save(os.path.normpath(tmpDir + '/' + maskFileName), nullMask, allow_pickle=False)
+                    meta[_TC_KEY_NULL_MASK_FILES][column] = maskFileName
+                arr = arr.astype(str)
+                meta[_TC_KEY_OBJECT_COLUMNS].append(column)
+            fileName = 'column_' + str(index) + '.npy'
+            np.save(os.path.normpath(tmpDir + '/' + fileName), arr, allow_pickle=False)
+            meta[_TC_KEY_COLUMNS].append(column)
+            meta[_TC_KEY_COLUMN_FILES].append(fileName)
+        with open(os.path.normpath(tmpDir + '/' + _TC_META_FILE), 'w') as f:
+            json.dump(meta, f)
+
+        shutil.rmtree(entryDir, ignore_errors=True)
+        os.rename(tmpDir, entryDir)
+        self.evict(keepKey=key)
+
+    def remove(self, key):
+        shutil.rmtree(self._entryDir(key), ignore_errors=True)
+
+    def _entries(self):
+        """
+        :return: a list of [key, size in bytes, last access time] for each entry
+        """
+        entries = []
+        if not os.path.exists(self._cacheDir):
+            return entries
+        for key in os.listdir(self._cacheDir):
+            metaPath = os.path.normpath(self._entryDir(key) + '/' + _TC_META_FILE)
+            if not os.path.exists(metaPath):
+                continue
+            size = sum(os.stat(os.path.normpath(self._entryDir(key) + '/' + fileName)).st_size
+                       for fileName in os.listdir(self._entryDir(key)))
+            entries.append([key, size, os.stat(metaPath).st_mtime])
+        return entries
+
+    def size(self):
+        """
+        :return: the size of the cache in bytes
+        """
+        return sum(entry[1] for entry in self._entries())
+
+    def evict(self, keepKey=None):
+        """
+        Delete the least recently used entries until the cache size is less than the maximum size.
+        :param keepKey: an entry which will not be deleted (e.g. the last stored)
+        :return: a list with the deleted keys
+        """
+        entries = sorted(self._entries(), key=lambda entry: entry[2])  # oldest first
+        cacheSize = sum(entry[1] for entry in entries)
+        deletedKeys = []
+        for key, size, _ in entries:
+            if cacheSize <= self._maxSize:
+                break
+            if key == keepKey:
+                continue
+            self.remove(key)
+            cacheSize -= size
+            deletedKeys.append(key)
+        return deletedKeys
+
+    def invalidate(self, sourcePath=None):
+        """
+        Delete the entries of a table file (or all the entries).
+        :param sourcePath: the path of the table file (None for all the entries)
+        :return: a list with the deleted keys
+        """
+        deletedKeys = []
+        for key, _, _ in self._entries():
+            if sourcePath is not None:
+                with open(os.path.normpath(self._entryDir(key) + '/' + _TC_META_FILE), 'r') as f:
+                    if json.load(f)[_TC_KEY_SOURCE_PATH] != os.path.normpath(sourcePath):
+                        continue
+            self.remove(key)
+            deletedKeys.append(key)
+        return deletedKeys
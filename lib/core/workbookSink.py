@@ -0,0 +1,103 @@
+import os
+import csv
+
+import openpyxl as op
+
+# *************************************************************************************************** #
+
+WS_DEFAULT_CHECKPOINT_ROWS = 0  # the rows between two checkpoints (0 = no checkpoints)
+WS_CHECKPOINT_SUFFIX = '.rows.csv'  # the suffix of the append-only checkpoint log (next to the workbook)
+
+
+class WorkbookSink:
+    """
+    Collect the rows of a workbook in memory and write the workbook only once (save), instead of loading
+    and saving the xlsx file for each row. If checkpointRows > 0, every checkpointRows rows the new rows are
+    appended to a CSV log next to the workbook, so the results of a crashed execution are not lost. The log
+    is deleted when the workbook is saved.
+    """
+    def __init__(self, workbookPath: str, headers=None, checkpointRows=WS_DEFAULT_CHECKPOINT_ROWS):
+        """
+        :param workbookPath: the path of the xlsx file (if it exists the rows are appended to it)
+        :param headers: the header row (or None to set it later with setHeaders)
+        :param checkpointRows: the rows between two checkpoints (0 = no checkpoints)
+        """
+        self._workbookPath = workbookPath
+        self._checkpointPath = workbookPath + WS_CHECKPOINT_SUFFIX
+        self._checkpointRows = checkpointRows
+        self._headers = headers
+        self._rows = []
+        self._numOfCheckpointedRows = 0  # the rows which have been written to the checkpoint log
+
+    def getWorkbookPath(self):
+        return self._workbookPath
+
+    def getCheckpointPath(self):
+        return self._checkpointPath
+
+    def setHeaders(self, headers: []):
+        self._headers = headers
+
+    def hasHeaders(self):
+        return self._headers is not None
+
+    def rows(self):
+        return self._rows
+
+    def append(self, row: []):
+        """
+        Add a row to the workbook.
+        :param row: a list with the values of the row
+        :return: Nothing
+        """
+        self._rows.append(row)
+        if 0 < self._checkpointRows <= self._rows.__len__() - self._numOfCheckpointedRows:
+            self.checkpoint()
+
+    def checkpoint(self):
+        """
+        Append the rows which haven't been checkpointed to the CSV log.
+        :return: Nothing
+        """
+        if self._numOfCheckpointedRows == self._rows.__len__():
+            return
+        writeHeaders = not os.path.exists(self._checkpointPath) and self._headers is not None
+        with open(self._checkpointPath, 'a', newline='') as f:
+            writer = csv.writer(f)
+            if writeHeaders:
+                writer.writerow(self._headers)
+            writer.writerows(self._rows[self._numOfCheckpointedRows:])
+        self._numOfCheckpointedRows = self._rows.__len__()
+
+    def save(self):
+        """
+        Write the workbook (once) and delete the checkpoint log.
+        :return: Nothing
+        """
+        if os.path.exists(self._workbookPath):  # append the rows to the existing workbook
+            wb = op.load_workbook(self._workbookPath)  # load the xlsx file
+            ws = wb.worksheets[0]  # select first worksheet
+        else:
+            wb = op.Workbook(write_only=True)  # a write only workbook is written as a stream (faster)
+            ws = wb.create_sheet()
+            if self._headers is not None:
+                ws.append(self._headers)
+        for row in self._rows:
+            ws.append(row)
+        wb.save(self._workbookPath)
+
+        # The rows have been written, so start a new batch
+        self._rows = []
+        self._numOfCheckpointedRows = 0
+        if os.path.exists(self._checkpointPath):
+            os.remove(self._checkpointPath)
+
+
+def saveWorkbookSinks(sinks: []):
+    """
+    Save a list of WorkbookSinks.
+    :param sinks: the WorkbookSinks
+    :return: Nothing
+    """
+    for sink in sinks:
+        sink.save()
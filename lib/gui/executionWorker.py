@@ -0,0 +1,49 @@
+import threading
+import traceback
+
+from PySide2.QtCore import (
+    QThread,
+    Signal
+)
+
+EW_STATE_FINISHED = 'Finished'
+EW_STATE_CANCELLED = 'Cancelled'
+EW_STATE_FAILED = 'Failed'
+
+# *************************************************************************************************** #
+
+
+class ExecutionWorker(QThread):
+    """
+    Run a long execution function (e.g. the machine learning pipeline) in a background thread, so the GUI
+    stays responsive. The function is called as executeFunc(progressFunc, isCancelledFunc):
+        progressFunc(stage: str, current: int, total: int) -> sends the progress to the GUI (signalProgress)
+        isCancelledFunc() -> True if the user asked to cancel (the function should stop at the next check)
+    """
+    signalProgress = Signal(str, int, int)  # stage, current, total
+    signalError = Signal(str)  # the error message
+    signalExecutionFinished = Signal(str)  # EW_STATE_FINISHED, EW_STATE_CANCELLED or EW_STATE_FAILED
+
+    def __init__(self, executeFunc, parent=None):
+        super().__init__(parent)
+        self._executeFunc = executeFunc
+        self._cancelEvent = threading.Event()
+
+    def requestCancel(self):
+        self._cancelEvent.set()
+
+    def isCancelled(self):
+        return self._cancelEvent.is_set()
+
+    def emitProgress(self, stage: str, current: int, total: int):
+        self.signalProgress.emit(stage, current, total)
+
+    def run(self):
+        try:
+            self._executeFunc(self.emitProgress, self.isCancelled)
+            state = EW_STATE_CANCELLED if self.isCancelled() else EW_STATE_FINISHED
+        except Exception as e:  # send the error to the GUI thread (the dialogs must be created there)
+            traceback.print_exc()
+            self.signalError.emit(str(e))
+            state = EW_STATE_FAILED
+        self.signalExecutionFinished.emit(state)
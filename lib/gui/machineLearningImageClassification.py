@@ -37,6 +37,7 @@ from PySide2.QtGui import (
 from lib.core.project_flags import *
 from lib.gui.commonFunctions import *
 import lib.core.machineLearningClassification as mlc
+import lib.core.imageLoader as imgLoader
 # import lib.core.signalCompare as signComp
 
 from lib.gui.guiStyle import setStyle_
@@ -91,7 +92,7 @@ class WidgetMachineLearningImageClassification(QWidget):
         # ---------------------- #
         self.setWindowTitle(winTitle)  # Set Window Title
         self.setWindowIcon(QIcon(self.iconPath))  # Set Window Icon
-        self.setGeometry(INT_SCREEN_WIDTH / 4, INT_SCREEN_HEIGHT / 4, w, h)  # Set Window Geometry
+        self.setGeometry(getScreenWidth() / 4, getScreenHeight() / 4, w, h)  # Set Window Geometry
         self.setMinimumWidth(minW)  # Set Window Minimum Width
         self.setMinimumHeight(minH)  # Set Window Minimum Height
         if maxW is not None:
@@ -431,33 +432,24 @@ class WidgetMachineLearningImageClassification(QWidget):
 
                 # Create the Train-Validation set
                 X_train_paths = np.array(XY_dict[_folderName_]['x'])[trainIndexes]
-                X_train_images = []
                 Y_train = np.array(XY_dict[_folderName_]['y'])[trainIndexes]
 
                 # Create the Test set
                 X_test_paths = np.array(XY_dict[_folderName_]['x'])[testIndexes]
-                X_test_images = []
                 Y_test = np.array(XY_dict[_folderName_]['y'])[testIndexes]
 
-                # Read images for train set
-                for _path_ in X_train_paths:
-                    img = cv2.imread(_path_)
-                    # print(img.shape)
-                    X_train_images.append(img)
-                X_train_images = np.array(X_train_images)
-
-                # Read images for test set
-                for _path_ in X_test_paths:
-                    img = cv2.imread(_path_)
-                    # print(img.shape)
-                    X_test_images.append(img)
-                X_test_images = np.array(X_test_images)
+                # The images are read (and resized to the input layer) in batches while training
+                trainLoader = imgLoader.ImageBatchLoader(X_train_paths, Y_train,
+                                                         width=MLF_DEFAULT_INPUT_LAYER_IMAGE_WIDTH_RESOLUTION,
+                                                         height=MLF_DEFAULT_INPUT_LAYER_IMAGE_HEIGHT_RESOLUTION,
+                                                         shuffle=True)
+                testLoader = imgLoader.ImageBatchLoader(X_test_paths, Y_test,
+                                                        width=MLF_DEFAULT_INPUT_LAYER_IMAGE_WIDTH_RESOLUTION,
+                                                        height=MLF_DEFAULT_INPUT_LAYER_IMAGE_HEIGHT_RESOLUTION)
 
                 # Execute the Classification
-                self.mlc_Classification.fit(X_TrainVal=X_train_images,
-                                            y_TrainVal=Y_train,
-                                            X_Test=X_test_images,
-                                            y_Test=Y_test,
+                self.mlc_Classification.fit(trainValLoader=trainLoader,
+                                            testLoader=testLoader,
                                             exportFolder=exportPrimaryDir)
 
 
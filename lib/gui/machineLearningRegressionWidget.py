@@ -1,11 +1,5 @@
 import os.path
 import sys
-import matplotlib
-import pandas as pd
-import numpy as np
-import openpyxl as op
-import matplotlib.pyplot as plt
-import sklearn
 
 from PySide2.QtCore import (
     Qt
@@ -30,7 +24,8 @@ from PySide2.QtWidgets import (
     QLineEdit,
     QComboBox,
     QCheckBox,
-    QScrollArea
+    QScrollArea,
+    QProgressBar
 )
 
 from PySide2.QtGui import (
@@ -41,14 +36,14 @@ from PySide2.QtGui import (
 from lib.core.project_flags import *
 import lib.core.machineLearningRegression as mlr
 import lib.core.signalCompare as signComp
+import lib.core.regressionPipeline as regPipe
 
 from lib.gui.guiStyle import setStyle_
 import lib.gui.commonFunctions as coFunc
+import lib.gui.executionWorker as execWorker
 
 # *************************************************************************************************** #
 
-matplotlib.use("Agg")  # Set matplotlib to use non-interface (don't plot figures)
-
 
 class WidgetMachineLearningRegressionWidget(QWidget):
     def __init__(self, w=512, h=512, minW=256, minH=256, maxW=None, maxH=None,
@@ -65,24 +60,28 @@ class WidgetMachineLearningRegressionWidget(QWidget):
         # -------------------------------- #
 
         # DICTIONARY FILE PARAMETERS
-        self._DKEY_FILE_NAME: str = 'name'
-        self._DKEY_FULLPATH: str = 'full-path'
-        self._DKEY_COLUMNS: str = 'columns'
-        self._DKEY_INPUT_LIST: str = 'input-list'
-        self._DKEY_OUTPUT_LIST: str = 'output-list'
-        self._DKEY_PRIMARY_EVENT_COLUMN: str = 'primary-event'
+        self._DKEY_FILE_NAME: str = regPipe.RP_DKEY_FILE_NAME
+        self._DKEY_FULLPATH: str = regPipe.RP_DKEY_FULLPATH
+        self._DKEY_COLUMNS: str = regPipe.RP_DKEY_COLUMNS
+        self._DKEY_INPUT_LIST: str = regPipe.RP_DKEY_INPUT_LIST
+        self._DKEY_OUTPUT_LIST: str = regPipe.RP_DKEY_OUTPUT_LIST
+        self._DKEY_PRIMARY_EVENT_COLUMN: str = regPipe.RP_DKEY_PRIMARY_EVENT_COLUMN
 
         # DICTIONARY MACHINE LEARNING PARAMETERS
-        self._DKEY_MLP_TEST_PERCENTAGE: str = 'test-percentage'
-        self._DKEY_MLP_TEST_PERCENTAGE_DISTRIBUTION: str = 'test-percentage-distribution'
-        self._DKEY_MLP_HOLDOUT_PERCENTAGE: str = 'holdout-percentage'
-        self._DKEY_MLP_HOLDOUT_PERCENTAGE_DISTRIBUTION: str = 'holdout-percentage-distribution'
-        self._DKEY_MLP_EXPORT_FOLDER: str = 'export-folder'
-        self._DKEY_MLP_EXPER_NUMBER: str = 'experiment-number'
-        self._DKEY_MLP_ML_METHOD: str = 'ml-method'
-        self._DKEY_MLP_METHOD_INDEX: str = 'ml-method-index'
-        self._DKEY_MLP_FILTER_INDEX: str = 'ml-filter-index'
-        self._DKEY_MLP_MULTIFILE_TRAINING_PROCESSING: str = 'multifile-training-processing'
+        self._DKEY_MLP_TEST_PERCENTAGE: str = regPipe.RP_DKEY_MLP_TEST_PERCENTAGE
+        self._DKEY_MLP_TEST_PERCENTAGE_DISTRIBUTION: str = regPipe.RP_DKEY_MLP_TEST_PERCENTAGE_DISTRIBUTION
+        self._DKEY_MLP_HOLDOUT_PERCENTAGE: str = regPipe.RP_DKEY_MLP_HOLDOUT_PERCENTAGE
+        self._DKEY_MLP_HOLDOUT_PERCENTAGE_DISTRIBUTION: str = regPipe.RP_DKEY_MLP_HOLDOUT_PERCENTAGE_DISTRIBUTION
+        self._DKEY_MLP_EXPORT_FOLDER: str = regPipe.RP_DKEY_MLP_EXPORT_FOLDER
+        self._DKEY_MLP_EXPER_NUMBER: str = regPipe.RP_DKEY_MLP_EXPER_NUMBER
+        self._DKEY_MLP_ML_METHOD: str = regPipe.RP_DKEY_MLP_ML_METHOD
+        self._DKEY_MLP_METHOD_INDEX: str = regPipe.RP_DKEY_MLP_METHOD_INDEX
+        self._DKEY_MLP_FILTER_INDEX: str = regPipe.RP_DKEY_MLP_FILTER_INDEX
+        self._DKEY_MLP_MULTIFILE_TRAINING_PROCESSING: str = regPipe.RP_DKEY_MLP_MULTIFILE_TRAINING_PROCESSING
+        self._DKEY_MLP_MULTIFILE_WORKERS: str = regPipe.RP_DKEY_MLP_MULTIFILE_WORKERS
+        self._DKEY_MLP_FIGURE_WORKERS: str = regPipe.RP_DKEY_MLP_FIGURE_WORKERS
+        self._DKEY_MLP_PLOT_EVENTS: str = regPipe.RP_DKEY_MLP_PLOT_EVENTS
+        self._DKEY_MLP_PLOT_MODELS: str = regPipe.RP_DKEY_MLP_PLOT_MODELS
 
         # -------------------------------- #
         # ----- Set QTabWidget ----------- #
@@ -114,7 +113,7 @@ class WidgetMachineLearningRegressionWidget(QWidget):
         # ---------------------- #
         self.setWindowTitle(winTitle)  # Set Window Title
         self.setWindowIcon(QIcon(self.iconPath))  # Set Window Icon
-        self.setGeometry(INT_SCREEN_WIDTH / 4, INT_SCREEN_HEIGHT / 4, w, h)  # Set Window Geometry
+        self.setGeometry(getScreenWidth() / 4, getScreenHeight() / 4, w, h)  # Set Window Geometry
         self.setMinimumWidth(minW)  # Set Window Minimum Width
         self.setMinimumHeight(minH)  # Set Window Minimum Height
         if maxW is not None:
@@ -148,6 +147,19 @@ class WidgetMachineLearningRegressionWidget(QWidget):
         self.buttonExecute.setMinimumHeight(INT_ADD_REMOVE_BUTTON_SIZE)  # Set Minimum Height
         self.buttonExecute.setToolTip('Run the machine learning process.')  # Add Description
 
+        self.buttonCancel = QPushButton("Cancel")
+        self.buttonCancel.setMinimumWidth(0)  # Set Minimum Width
+        self.buttonCancel.setMinimumHeight(INT_ADD_REMOVE_BUTTON_SIZE)  # Set Minimum Height
+        self.buttonCancel.setToolTip('Stop the machine learning process after the current step.')  # Add Description
+
+        # --------------------------- #
+        # ----- Set ProgressBar ----- #
+        # --------------------------- #
+        self.progressBarExecute = QProgressBar()  # Create a progress bar for the execution
+        self.progressBarExecute.setTextVisible(True)  # Show the current stage
+        self.progressBarExecute.setFormat('')  # No stage yet
+        self.executionWorker = None  # the background worker of the execution (None if not running)
+
         # -------------------------------- #
         # ----- Set QListWidgetItems ----- #
         # -------------------------------- #
@@ -176,7 +188,11 @@ class WidgetMachineLearningRegressionWidget(QWidget):
             self.dkey_mlpMethod(): self.widgetTabMachineLearningSettings.tabGeneral.getDefaultMethod(),
             self.dkey_mlpMethodIndex(): self.widgetTabMachineLearningSettings.tabGeneral.getDefaultMethodIndex(),
             self.dkey_mlpFilterIndex(): self.widgetTabMachineLearningSettings.tabGeneral.getDefaultFilterIndex(),
-            self.dkey_multifileTrainingProcessing(): self.widgetTabMachineLearningSettings.tabGeneral.getDefaultMultifileTrainingProcessing()
+            self.dkey_multifileTrainingProcessing(): self.widgetTabMachineLearningSettings.tabGeneral.getDefaultMultifileTrainingProcessing(),
+            self.dkey_multifileWorkers(): self.widgetTabMachineLearningSettings.tabGeneral.getDefaultMultifileWorkers(),
+            self.dkey_figureWorkers(): self.widgetTabMachineLearningSettings.tabGeneral.getDefaultFigureWorkers(),
+            self.dkey_plotEvents(): self.widgetTabMachineLearningSettings.tabGeneral.getDefaultPlotEvents(),
+            self.dkey_plotModels(): self.widgetTabMachineLearningSettings.tabGeneral.getDefaultPlotModels()
         }
 
         self.mlr_Regression = mlr.MachineLearningRegression()
@@ -235,6 +251,18 @@ class WidgetMachineLearningRegressionWidget(QWidget):
     def dkey_multifileTrainingProcessing(self):
         return self._DKEY_MLP_MULTIFILE_TRAINING_PROCESSING
 
+    def dkey_multifileWorkers(self):
+        return self._DKEY_MLP_MULTIFILE_WORKERS
+
+    def dkey_figureWorkers(self):
+        return self._DKEY_MLP_FIGURE_WORKERS
+
+    def dkey_plotEvents(self):
+        return self._DKEY_MLP_PLOT_EVENTS
+
+    def dkey_plotModels(self):
+        return self._DKEY_MLP_PLOT_MODELS
+
     # --------------------------- #
     # ----- Reuse Functions ----- #
     # --------------------------- #
@@ -263,6 +291,7 @@ class WidgetMachineLearningRegressionWidget(QWidget):
 
         # Disable Generate Button
         self.buttonExecute.setEnabled(False)
+        self.buttonCancel.setEnabled(False)
 
         # Set Column vbox
         labelColumnList = QLabel("Column List:")
@@ -275,6 +304,7 @@ class WidgetMachineLearningRegressionWidget(QWidget):
         hbox_listFileButtons.addWidget(self.buttonAdd)  # Add buttonAdd
         hbox_listFileButtons.addWidget(self.buttonRemove)  # Add buttonRemove
         hbox_listFileButtons.addWidget(self.buttonExecute)  # Add buttonGenerate
+        hbox_listFileButtons.addWidget(self.buttonCancel)  # Add buttonCancel
 
         # Set FileList in hbox
         labelFileList = QLabel("Opened File List:")
@@ -283,6 +313,7 @@ class WidgetMachineLearningRegressionWidget(QWidget):
         vbox_listFile.addWidget(self.listWidget_FileList)  # Add FileList
         vbox_listFile.addLayout(vbox_listColumns)  # Add listColumns
         vbox_listFile.addLayout(hbox_listFileButtons)  # Add vbox_listFileButtons layout
+        vbox_listFile.addWidget(self.progressBarExecute)  # Add the execution progress bar
 
         # Set List and Tab Widget Layout
         hbox_final_layout = QHBoxLayout()  # Create a Horizontal Box Layout
@@ -374,6 +405,12 @@ class WidgetMachineLearningRegressionWidget(QWidget):
         self.widgetTabMachineLearningSettings.tabGeneral.spinBox_MachineLearningFilterIndex.valueChanged.connect(
             self.actionMachineLearningFilterIndexChange)
 
+        self.widgetTabMachineLearningSettings.tabGeneral.spinBox_MultifileWorkers.valueChanged.connect(
+            self.actionMultifileWorkersChange)
+
+        self.widgetTabMachineLearningSettings.tabGeneral.spinBox_FigureWorkers.valueChanged.connect(
+            self.actionFigureWorkersChange)
+
         # Double Spin Boxes  Events
         self.widgetTabMachineLearningSettings.tabGeneral.doubleSpinBox_TestPercentage.valueChanged.connect(
             self.actionTestPercentageChange)
@@ -385,6 +422,12 @@ class WidgetMachineLearningRegressionWidget(QWidget):
         self.widgetTabMachineLearningSettings.tabGeneral.lineEdit_SetOutPath.textChanged.connect(
             self.actionLineEditChange)
 
+        self.widgetTabMachineLearningSettings.tabGeneral.lineEdit_PlotEvents.textChanged.connect(
+            self.actionPlotEventsChange)
+
+        self.widgetTabMachineLearningSettings.tabGeneral.lineEdit_PlotModels.textChanged.connect(
+            self.actionPlotModelsChange)
+
         # Button Events
         self.widgetTabMachineLearningSettings.tabGeneral.buttonSetOutPath.clicked.connect(
             self.actionButtonSetOutPathClicked)
@@ -520,6 +563,10 @@ class WidgetMachineLearningRegressionWidget(QWidget):
             self.actionStateChangeRollingWindowTimeLagCrossCorrelation)
         self.widgetTabMachineLearningSettings.tabSignalCompare.checkbox_DynamicTimeWarping.stateChanged.connect(
             self.actionStateChangeDynamicTimeWarping)
+        self.widgetTabMachineLearningSettings.tabSignalCompare.comboBox_DynamicTimeWarpingWindow.currentTextChanged.connect(
+            self.actionDynamicTimeWarpingWindowChange)
+        self.widgetTabMachineLearningSettings.tabSignalCompare.spinBox_DynamicTimeWarpingWindowSize.valueChanged.connect(
+            self.actionDynamicTimeWarpingWindowChange)
 
     # Set event for RidgeOptions
     def setWidgetRidgeEvents_(self):
@@ -581,6 +628,7 @@ class WidgetMachineLearningRegressionWidget(QWidget):
         self.buttonAdd.clicked.connect(self.actionButtonAdd)  # buttonAdd -> clicked
         self.buttonRemove.clicked.connect(self.actionButtonRemove)  # buttonRemove -> clicked
         self.buttonExecute.clicked.connect(self.actionButtonExecute)  # buttonGenerate -> clicked
+        self.buttonCancel.clicked.connect(self.actionButtonCancel)  # buttonCancel -> clicked
         # ListWidget Events
         self.listWidget_FileList.currentRowChanged.connect(self.actionFileListRowChanged_event)
 
@@ -666,1016 +714,73 @@ class WidgetMachineLearningRegressionWidget(QWidget):
             return True  # return True
         return False  # return False
 
-    def BE_readFileData(self, fName):
-        # find the file suffix (extension) and take is as lowercase without the comma
-        suffix = os.path.splitext(self.dict_tableFilesPaths[fName][self.dkeyFullPath()])[1].lower().split('.')[1]
-        # create a variable named fileData and set it to None (it will store panda array if all goes well)
-        fileData = None
-        # create a list to store all the needed columns (we don't need columns we will not use - RAM saving)
-        fileDataUseColumns = []
-        # Check if user selected primary event column
-        if self.dict_tableFilesPaths[fName][self.dkeyPrimaryEventColumn()] is not None:
-            fileDataUseColumns.append(self.dict_tableFilesPaths[fName][self.dkeyPrimaryEventColumn()])  # add it to list
-            # print(self.dict_tableFilesPaths[fName][self.dkeyPrimaryEventColumn()])
-        # append to list (if not already) the values from input column list
-        [fileDataUseColumns.append(col) for col in self.dict_tableFilesPaths[fName][self.dkeyInputList()]
-         if col not in fileDataUseColumns]
-        # append to list (if not already) the values from output column list
-        [fileDataUseColumns.append(col) for col in self.dict_tableFilesPaths[fName][self.dkeyOutputList()]
-         if col not in fileDataUseColumns]
-        # print(fileDataUseColumns)
-
-        print("Read " + suffix + " file.")  # info message
-
-        # Read the file Data - CSV
-        if suffix == 'csv':
-            # read only the needed columns
-            fileData = pd.read_csv(self.dict_tableFilesPaths[fName][self.dkeyFullPath()])[fileDataUseColumns]
-            # print(fileData.keys())
-        elif suffix == 'xlsx':
-            # read only the needed columns
-            fileData = pd.read_excel(self.dict_tableFilesPaths[fName][self.dkeyFullPath()])[fileDataUseColumns]
-
-        # print(fileData)
-
-        if fileData is not None:  # if file has been read successfully
-            fileData.fillna(method='ffill', inplace=True)  # fill na values using ffill
-            fileData.fillna(method='bfill', inplace=True)  # fill na values using bfill
-        return fileData  # return the fileData
-
-    # Create the Train-Validation-Test Arrays
-    def BE_setTrainValTestArrays(self, dictDataInput: {}, dictDataOutput: {}, inputHeaders: [], outputHeaders: []):
-        def getTrainValTest(inputArr, outputArr):
-            datasetSize = inputArr.__len__()
-            testPercentage = self.dict_machineLearningParameters[self.dkey_mlpTestPercentage()]
-            X_train_val_ = []
-            y_train_val_ = []
-            X_test_ = []
-            y_test_ = []
-            testTrainIndex = None
-
-            if self.dict_machineLearningParameters[
-                self.dkey_mlpTestPercentageDistribution()] == MLPF_PERCENTAGE_DISTRIBUTION_RANDOM_FROM_START:
-                permIndexes = np.random.permutation(datasetSize).tolist()
-                trainIdxs = permIndexes[int(testPercentage * datasetSize):]
-                testIdxs = permIndexes[:int(testPercentage * datasetSize)]
-
-                X_train_val_ = np.array(inputArr)[trainIdxs]
-                y_train_val_ = np.array(outputArr)[trainIdxs]
-                X_test_ = np.array(inputArr)[testIdxs]
-                y_test_ = np.array(outputArr)[testIdxs]
-
-            elif self.dict_machineLearningParameters[
-                self.dkey_mlpTestPercentageDistribution()] == MLPF_PERCENTAGE_DISTRIBUTION_RANDOM_FROM_MIDDLE:
-                permIndexes = np.random.permutation(datasetSize).tolist()
-                midIndex = datasetSize / 2
-                sliceSize = testPercentage * datasetSize
-                startIndex = int(midIndex - sliceSize / 2)
-                endIndex = int(midIndex - sliceSize / 2)
-
-                trainIdxs = permIndexes[:startIndex] + permIndexes[-endIndex:]
-                testIdxs = permIndexes[startIndex:-endIndex]
-
-                X_train_val_ = np.array(inputArr)[trainIdxs]
-                y_train_val_ = np.array(outputArr)[trainIdxs]
-                X_test_ = np.array(inputArr)[testIdxs]
-                y_test_ = np.array(outputArr)[testIdxs]
-
-            elif self.dict_machineLearningParameters[
-                self.dkey_mlpTestPercentageDistribution()] == MLPF_PERCENTAGE_DISTRIBUTION_RANDOM_FROM_END:
-                permIndexes = np.random.permutation(datasetSize).tolist()
-                trainIdxs = permIndexes[:-int(testPercentage * datasetSize)]
-                testIdxs = permIndexes[-int(testPercentage * datasetSize):]
-
-                X_train_val_ = np.array(inputArr)[trainIdxs]
-                y_train_val_ = np.array(outputArr)[trainIdxs]
-                X_test_ = np.array(inputArr)[testIdxs]
-                y_test_ = np.array(outputArr)[testIdxs]
-
-            elif self.dict_machineLearningParameters[
-                self.dkey_mlpTestPercentageDistribution()] == MLPF_PERCENTAGE_DISTRIBUTION_FROM_START:
-                datasetIndexes = list(range(datasetSize))
-                trainIdxs = datasetIndexes[int(testPercentage * datasetSize):]
-                testIdxs = datasetIndexes[:int(testPercentage * datasetSize)]
-                testTrainIndex = [testPercentage * datasetSize]
-
-                X_train_val_ = np.array(inputArr)[trainIdxs]
-                y_train_val_ = np.array(outputArr)[trainIdxs]
-                X_test_ = np.array(inputArr)[testIdxs]
-                y_test_ = np.array(outputArr)[testIdxs]
-
-            elif self.dict_machineLearningParameters[
-                self.dkey_mlpTestPercentageDistribution()] == MLPF_PERCENTAGE_DISTRIBUTION_FROM_MIDDLE:
-                datasetIndexes = list(range(datasetSize))
-                midIndex = datasetSize / 2
-                sliceSize = testPercentage * datasetSize
-                startIndex = int(midIndex - sliceSize / 2)
-                endIndex = int(midIndex - sliceSize / 2)
-                testTrainIndex = [startIndex, endIndex]
-
-                trainIdxs = datasetIndexes[:startIndex] + datasetIndexes[-endIndex:]
-                testIdxs = datasetIndexes[startIndex:-endIndex]
-
-                X_train_val_ = np.array(inputArr)[trainIdxs]
-                y_train_val_ = np.array(outputArr)[trainIdxs]
-                X_test_ = np.array(inputArr)[testIdxs]
-                y_test_ = np.array(outputArr)[testIdxs]
-
-            elif self.dict_machineLearningParameters[
-                self.dkey_mlpTestPercentageDistribution()] == MLPF_PERCENTAGE_DISTRIBUTION_FROM_END:
-                datasetIndexes = np.array(list(range(datasetSize)))
-                trainIdxs = datasetIndexes[:-int(testPercentage * datasetSize)]
-                testIdxs = datasetIndexes[-int(testPercentage * datasetSize):]
-                testTrainIndex = [datasetSize - (testPercentage * datasetSize)]
-
-                X_train_val_ = np.array(inputArr)[trainIdxs]
-                y_train_val_ = np.array(outputArr)[trainIdxs]
-                X_test_ = np.array(inputArr)[testIdxs]
-                y_test_ = np.array(outputArr)[testIdxs]
-
-            return X_train_val_, y_train_val_, X_test_, y_test_, testTrainIndex
-
-        X_full = {}  # Create an input dict to store the values of train_val + test lists
-        y_full = {}  # Create an output dict to store the values of train_val + test lists
-        X_train_val = {}  # Create an input dict to store the values of train_val lists
-        y_train_val = {}  # Create an output dict to store the values of train_val lists
-        X_test = {}  # Create an input dict to store the values of test lists
-        y_test = {}  # Create an output dict to store the values of test lists
-        # Shorten the name of methodIndex
-        methodIndex = self.dict_machineLearningParameters[self.dkey_mlpMethodIndex()]
-        filterIndex = self.dict_machineLearningParameters[self.dkey_mlpFilterIndex()]
-        dict_test_train_index = {}
-
-        inputHeaderColumnsForML = []
-        outputHeaderColumnsForML = []
-
-        print('Data will be filtered with FILTER_VALUE = ', filterIndex)
-
-        # Check if the user selected Sequential method
-        if self.dict_machineLearningParameters[self.dkey_mlpMethod()] == MLPF_METHOD_SEQUENTIAL_REGRESSION:
-            for _event_ in dictDataInput.keys():
-                X_full[_event_] = []
-                y_full[_event_] = []
-                X_train_val[_event_] = []
-                y_train_val[_event_] = []
-                X_test[_event_] = []
-                y_test[_event_] = []
-                dict_test_train_index[_event_] = []
-
-                tmp_event_arr_input = []
-                tmp_event_arr_output = []
-                for _index_ in range(0, dictDataInput[_event_].__len__() - (2 * methodIndex + 1)):
-                    tmp_arr_input = []
-                    tmp_arr_output = []
-                    for _index2_ in range(_index_, _index_ + methodIndex):
-                        tmp_arr_input.extend(dictDataInput[_event_][_index2_])
-                        tmp_arr_output.extend(dictDataOutput[_event_][_index2_ + methodIndex])
-                    tmp_event_arr_input.append(tmp_arr_input)
-                    tmp_event_arr_output.append(tmp_arr_output)
-                    X_full[_event_].append(tmp_arr_input)
-                    y_full[_event_].append(tmp_arr_output)
-
-                # print("Event: ", _event_)
-                # print("InputShape: ", np.array(tmp_event_arr_input).shape)
-                # print("OutputShape: ", np.array(tmp_event_arr_output).shape)
-                # print()
-                # *************************** #
-                # ***** FILTER THE DATA ***** #
-                # *************************** #
-                X_train_val[_event_], y_train_val[_event_], X_test[_event_], y_test[
-                    _event_], dict_test_train_index[_event_] = getTrainValTest(
-                    tmp_event_arr_input,
-                    tmp_event_arr_output)
-                # np.convolve(np.array(X_full[_event_]), np.ones(methodIndex), 'valid') / methodIndex
-                X_full[_event_] = np.array(X_full[_event_]).T
-                y_full[_event_] = np.array(y_full[_event_]).T
-
-                for _index_ in range(X_full[_event_].shape[0]):
-                    X_full[_event_][_index_] = np.convolve(X_full[_event_][_index_], np.ones(methodIndex) / methodIndex,
-                                                           mode='same')
-                for _index_ in range(y_full[_event_].shape[0]):
-                    y_full[_event_][_index_] = np.convolve(y_full[_event_][_index_], np.ones(filterIndex) / filterIndex,
-                                                           mode='same')
-
-                X_full[_event_] = np.array(X_full[_event_]).T
-                y_full[_event_] = np.array(y_full[_event_]).T
-
-            for _index_ in range(0, methodIndex):
-                for columnName in inputHeaders:
-                    inputHeaderColumnsForML.append(columnName + '_SEQ_' + str(_index_))
-            for _index_ in range(0, methodIndex):
-                for columnName in outputHeaders:
-                    outputHeaderColumnsForML.append(columnName + '_SEQ_' + str(_index_))
-
-        # Else if the user selected Average method
-        elif self.dict_machineLearningParameters[self.dkey_mlpMethod()] == MLPF_METHOD_AVERAGE_REGRESSION:
-            for _event_ in dictDataInput.keys():
-                X_full[_event_] = []
-                y_full[_event_] = []
-                X_train_val[_event_] = []
-                y_train_val[_event_] = []
-                X_test[_event_] = []
-                y_test[_event_] = []
-                dict_test_train_index[_event_] = []
-
-                tmp_event_arr_input = []
-                tmp_event_arr_output = []
-                for _index_ in range(0, dictDataInput[_event_].__len__() - (methodIndex + 1)):
-                    tmp_arr_input = np.zeros(np.array(dictDataInput[_event_][_index_]).shape)
-                    tmp_arr_output = np.zeros(np.array(dictDataOutput[_event_][_index_]).shape)
-                    for _index2_ in range(_index_, _index_ + methodIndex):
-                        tmp_arr_input += np.array(np.array(dictDataInput[_event_][_index2_]))
-                        tmp_arr_output += np.array(np.array(dictDataOutput[_event_][_index2_]))
-                    tmp_arr_input /= methodIndex
-                    tmp_arr_output /= methodIndex
-
-                    tmp_event_arr_input.append(tmp_arr_input.tolist())
-                    tmp_event_arr_output.append(tmp_arr_output.tolist())
-                    X_full[_event_].append(tmp_arr_input.tolist())
-                    y_full[_event_].append(tmp_arr_output.tolist())
-
-                # print("Event: ", _event_)
-                # print("InputShape: ", np.array(tmp_event_arr_input).shape)
-                # print("OutputShape: ", np.array(tmp_event_arr_output).shape)
-                # print()
-                # *************************** #
-                # ***** FILTER THE DATA ***** #
-                # *************************** #
-                X_train_val[_event_], y_train_val[_event_], X_test[_event_], y_test[
-                    _event_], dict_test_train_index[_event_] = getTrainValTest(
-                    tmp_event_arr_input,
-                    tmp_event_arr_output)
-                X_full[_event_] = np.array(X_full[_event_]).T
-                y_full[_event_] = np.array(y_full[_event_]).T
-
-                for _index_ in range(X_full[_event_].shape[0]):
-                    X_full[_event_][_index_] = np.convolve(X_full[_event_][_index_], np.ones(methodIndex) / methodIndex,
-                                                           mode='same')
-                for _index_ in range(y_full[_event_].shape[0]):
-                    y_full[_event_][_index_] = np.convolve(y_full[_event_][_index_], np.ones(filterIndex) / filterIndex,
-                                                           mode='same')
-
-                X_full[_event_] = np.array(X_full[_event_]).T
-                y_full[_event_] = np.array(y_full[_event_]).T
-
-            inputHeaderColumnsForML = inputHeaders
-            outputHeaderColumnsForML = outputHeaders
-
-        # Check if the user selected Sequential Average method
-        elif self.dict_machineLearningParameters[self.dkey_mlpMethod()] == MLPF_METHOD_SEQUENTIAL_AVERAGE_REGRESSION:
-            for _event_ in dictDataInput.keys():
-                X_full[_event_] = []
-                y_full[_event_] = []
-                X_train_val[_event_] = []
-                y_train_val[_event_] = []
-                X_test[_event_] = []
-                y_test[_event_] = []
-                dict_test_train_index[_event_] = []
-
-                tmp_event_arr_input = []
-                tmp_event_arr_output = []
-                for _index_ in range(0, dictDataInput[_event_].__len__() - (2 * methodIndex + 1)):
-                    tmp_arr_input = []
-                    tmp_arr_output = []
-
-                    tmp_arr_input_mean = np.zeros(np.array(dictDataInput[_event_][_index_]).shape)
-                    for _index2_ in range(_index_, _index_ + methodIndex):
-                        tmp_arr_input_mean += dictDataInput[_event_][_index2_]
-                    tmp_arr_input_mean /= methodIndex
-
-                    for _index2_ in range(_index_, _index_ + methodIndex):
-                        # Non absolute values - Uncomment this line for setting the input as non absolute values
-                        tmp_input_ext = np.array(dictDataInput[_event_][_index2_]) - tmp_arr_input_mean
-                        # Absolute values  - Uncomment this line for setting the input as absolute values
-                        # tmp_input_ext = np.absolute(np.array(dictDataInput[_event_][_index2_]) - tmp_arr_input_mean)
-                        tmp_arr_input.extend(tmp_input_ext.tolist())
-                        tmp_arr_output.extend(dictDataOutput[_event_][_index2_ + methodIndex])
-
-                    tmp_event_arr_input.append(tmp_arr_input)
-                    tmp_event_arr_output.append(tmp_arr_output)
-                    X_full[_event_].append(tmp_arr_input)
-                    y_full[_event_].append(tmp_arr_output)
-
-                # print("Event: ", _event_)
-                # print("InputShape: ", np.array(tmp_event_arr_input).shape)
-                # print("OutputShape: ", np.array(tmp_event_arr_output).shape)
-                # print()
-                # *************************** #
-                # ***** FILTER THE DATA ***** #
-                # *************************** #
-                X_train_val[_event_], y_train_val[_event_], X_test[_event_], y_test[
-                    _event_], dict_test_train_index[_event_] = getTrainValTest(
-                    tmp_event_arr_input,
-                    tmp_event_arr_output)
-                X_full[_event_] = np.array(X_full[_event_]).T
-                y_full[_event_] = np.array(y_full[_event_]).T
-
-                for _index_ in range(X_full[_event_].shape[0]):
-                    X_full[_event_][_index_] = np.convolve(X_full[_event_][_index_], np.ones(methodIndex) / methodIndex,
-                                                           mode='same')
-                for _index_ in range(y_full[_event_].shape[0]):
-                    y_full[_event_][_index_] = np.convolve(y_full[_event_][_index_], np.ones(filterIndex) / filterIndex,
-                                                           mode='same')
-
-                X_full[_event_] = np.array(X_full[_event_]).T
-                y_full[_event_] = np.array(y_full[_event_]).T
-
-            for _index_ in range(0, methodIndex):
-                for columnName in inputHeaders:
-                    inputHeaderColumnsForML.append(columnName + '_SEQ_' + str(_index_))
-            for _index_ in range(0, methodIndex):
-                for columnName in outputHeaders:
-                    outputHeaderColumnsForML.append(columnName + '_SEQ_' + str(_index_))
-
-        else:
-            pass
-
-        return X_train_val, y_train_val, X_test, y_test, X_full, y_full, \
-               inputHeaderColumnsForML, outputHeaderColumnsForML, dict_test_train_index
-
-    @staticmethod
-    def BE_getArrayFromDictList(inputDictList: dict):
-        tmpOutput = []
-        for key in inputDictList.keys():
-            for value in inputDictList[key]:
-                tmpOutput.append(value)
-        return np.array(tmpOutput)
-
-    @staticmethod
-    def BE_saveRealPredictedOutputFigure(y_Real: pd.DataFrame, y_Pred: pd.DataFrame, exportPath: str, y_max=None,
-                                         trainTestSplit=None, title='Figure: Real-Predicted Values',
-                                         yLabel='', xLabel=''):
-        y_Real.plot(style=['bs-'])
-        y_Pred.plot(style=['go-'])
-        plt.gcf().set_size_inches(24.8, 12.4)
-        plt.gcf().subplots_adjust(bottom=0.25)
-        plt.title(title, fontsize=25)
-        plt.legend(fontsize=20, loc='upper center', bbox_to_anchor=(0.5, -0.05), fancybox=True, shadow=False, ncol=2)
-        plt.yticks(fontsize=20)
-        plt.ylabel(yLabel,
-                   fontsize=22.5)
-        plt.xticks(fontsize=20)
-        plt.xlabel(xLabel,
-                   fontsize=22.5)
-
-        if y_max is not None:
-            y_bottom, y_top = plt.ylim(0, y_max)
-        else:
-            y_bottom, y_top = plt.ylim(0)
-        if trainTestSplit is not None:
-            for _vxLine_ in trainTestSplit:
-                plt.vlines(_vxLine_, y_bottom, y_top, colors='r', linestyles='dashed')
-        plt.savefig(exportPath, bbox_inches='tight', dpi=100)
-        plt.close()
-
-    @staticmethod
-    def BE_saveQQPlotFigure(y_Real: np.ndarray, y_Pred: np.ndarray, exportPath: str,
-                            title='Figure: QQ-PLot', yLabel='', xLabel=''):
-        plt.scatter(y_Real, y_Pred)
-        plt.plot(y_Real, y_Real, color='r', lw=3, scalex=False, scaley=False)
-        plt.gcf().set_size_inches(24.8, 12.4)
-        plt.gcf().subplots_adjust(bottom=0.25)
-        plt.title(title, fontsize=25)
-        plt.yticks(fontsize=20)
-        plt.ylabel(yLabel,
-                   fontsize=22.5)
-        plt.xticks(fontsize=20)
-        plt.xlabel(xLabel,
-                   fontsize=22.5)
-
-        plt.savefig(exportPath, bbox_inches='tight', dpi=100)
-        plt.close()
-
-    @staticmethod
-    def BE_saveAbsoluteErrorsFigure(absErrors: pd.DataFrame, exportPath: str, y_max=None,
-                                    trainTestSplit=None, title='Figure: Absolute Errors',
-                                    yLabel='', xLabel=''):
-        absErrors.plot()
-        plt.gcf().set_size_inches(24.8, 12.4)
-        plt.gcf().subplots_adjust(bottom=0.25)
-        plt.title(title, fontsize=25)
-        plt.legend(fontsize=20, loc='upper center', bbox_to_anchor=(0.5, -0.05), fancybox=True, shadow=False, ncol=2)
-        plt.yticks(fontsize=20)
-        plt.ylabel(yLabel,
-                   fontsize=22.5)
-        plt.xticks(fontsize=20)
-        plt.xlabel(xLabel,
-                   fontsize=22.5)
-
-        if y_max is not None:
-            y_bottom, y_top = plt.ylim(0, y_max)
-        else:
-            y_bottom, y_top = plt.ylim(0)
-        if trainTestSplit is not None:
-            for _vxLine_ in trainTestSplit:
-                plt.vlines(_vxLine_, y_bottom, y_top, colors='r', linestyles='dashed')
-        plt.savefig(exportPath, bbox_inches='tight', dpi=100)
-        plt.close()
-
-    def BE_calculateErrors(self, y_Real_norm: np.ndarray, y_Pred_norm: np.ndarray,
-                           y_Real_denorm: np.ndarray, y_Pred_denorm: np.ndarray,
-                           path_toSavePlot=None, trainTestSplit=None,
-                           title='Figure: Absolute Errors'):
-        tmpAppendRow = []
-
-        DY_RealPred_abs_norm = np.abs(y_Real_norm - y_Pred_norm)
-        DY_RealPred_abs_denorm = np.abs(y_Real_denorm - y_Pred_denorm)
-
-        # max
-        norm_err_max_TrainValTest = DY_RealPred_abs_norm.max()
-        denorm_err_max_TrainValTest = DY_RealPred_abs_denorm.max()
-        # min
-        norm_err_min_TrainValTest = DY_RealPred_abs_norm.min()
-        denorm_err_min_TrainValTest = DY_RealPred_abs_denorm.min()
-        # mse
-        norm_err_mse_TrainValTest = sklearn.metrics.mean_squared_error(y_Real_norm,
-                                                                       y_Pred_norm)
-        denorm_err_mse_TrainValTest = sklearn.metrics.mean_squared_error(y_Real_denorm,
-                                                                         y_Pred_denorm)
-        # rmse
-        norm_err_rmse_TrainValTest = np.sqrt(norm_err_mse_TrainValTest)
-        denorm_err_rmse_TrainValTest = np.sqrt(denorm_err_mse_TrainValTest)
-        # mae
-        norm_err_mae_TrainValTest = sklearn.metrics.mean_absolute_error(y_Real_norm,
-                                                                        y_Pred_norm)
-        denorm_err_mae_TrainValTest = sklearn.metrics.mean_absolute_error(y_Real_denorm,
-                                                                          y_Pred_denorm)
-
-        tmpAppendRow.append(norm_err_max_TrainValTest)
-        tmpAppendRow.append(denorm_err_max_TrainValTest)
-        tmpAppendRow.append(norm_err_min_TrainValTest)
-        tmpAppendRow.append(denorm_err_min_TrainValTest)
-        tmpAppendRow.append(norm_err_mse_TrainValTest)
-        tmpAppendRow.append(denorm_err_mse_TrainValTest)
-        tmpAppendRow.append(norm_err_rmse_TrainValTest)
-        tmpAppendRow.append(denorm_err_rmse_TrainValTest)
-        tmpAppendRow.append(norm_err_mae_TrainValTest)
-        tmpAppendRow.append(denorm_err_mae_TrainValTest)
-
-        if path_toSavePlot is not None:
-            print(file_manip.getCurrentDatetimeForConsole() +
-                  "::Plot Denormalized Absolute Error Figure")
-            y_max = DY_RealPred_abs_denorm.max()
-            yLabel = 'Absolute Error'
-            xLabel = ''
-            self.BE_saveAbsoluteErrorsFigure(absErrors=pd.DataFrame(DY_RealPred_abs_denorm, columns=['Absolute Errors']),
-                                             exportPath=path_toSavePlot,
-                                             y_max=y_max,
-                                             trainTestSplit=trainTestSplit,
-                                             title=title,
-                                             yLabel=yLabel, xLabel=xLabel)
-
-        return tmpAppendRow
-
     # *                                                         * #
     # *********************************************************** #
 
     def actionButtonExecute(self):
-        # FUNCTION FLAGS
-        _FF_KEY_DATA = 'Data'
-        _FF_KEY_COLUMN_PRIMARY_EVENT_DATA = 'Column Primary Event Data'
-        _FF_KEY_PRIMARY_EVENT_UNIQUE_VALUES = 'Primary Event Unique Values'
-        _FF_KEY_INPUT_COLUMNS = 'Input Columns'
-        _FF_KEY_OUTPUT_COLUMNS = 'Output Columns'
-        _FF_KEY_INPUT_COLUMNS_FOR_ML = 'Input Columns Machine Learning'
-        _FF_KEY_OUTPUT_COLUMNS_FOR_ML = 'Output Columns Machine Learning'
-        _FF_KEY_OUT_COL_HEADER_REAL = 'Output Header Real'
-        _FF_KEY_OUT_COL_HEADER_PRED = 'Output Header Predicted'
-        _FF_KEY_INP_COL_DENORM_VAL = 'Denormalize Input Values'
-        _FF_KEY_OUT_COL_DENORM_VAL = 'Denormalize Output Values'
-        _FF_KEY_TRAIN_VAL_ARRAY = 'Training Validation Array'
-        _FF_KEY_TEST_ARRAY = 'Test Array'
-        _FF_KEY_FULL_ARRAY = 'Full Array'
-        _FF_KEY_INPUT = 'Input Array'
-        _FF_KEY_OUTPUT = 'Output Array'
-        _FF_KEY_TRAIN_TEST_SPLIT_INDEX = 'Train-Test Split Index'
-        dict_fileData = {}
-
         # If true run the main pipeline
-        if self.dict_tableFilesPaths.keys().__len__() > 0:  # if there is at least a file (safety if)
+        if self.dict_tableFilesPaths.keys().__len__() > 0 and self.executionWorker is None:
             # 00 - Error Checking
             for fileName in self.dict_tableFilesPaths.keys():  # for each file in tableFilePaths
                 if self.BE_errorExist(fileName):  # if errors exists
                     return  # exit the function
 
-            # 01 - Run The Main Routine
-            for fileName in self.dict_tableFilesPaths.keys():
-                # Create a tmp variable primaryEvent for code simplicity
-                primaryEvent = self.dict_tableFilesPaths[fileName][self.dkeyPrimaryEventColumn()]
-                dict_fileData[fileName] = {}  # Create a dictionary for file Data
-                # read the data and store them in dictionary
-                dict_fileData[fileName][_FF_KEY_DATA] = self.BE_readFileData(fileName)
-
-                # Set the input/output columns
-                dict_fileData[fileName][_FF_KEY_INPUT_COLUMNS] = self.dict_tableFilesPaths[fileName][
-                    self.dkeyInputList()]
-                dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS] = self.dict_tableFilesPaths[fileName][
-                    self.dkeyOutputList()]
-
-                # Set the normalize/denormalize values
-                dict_fileData[fileName][_FF_KEY_INP_COL_DENORM_VAL] = {}
-                for _value_ in dict_fileData[fileName][_FF_KEY_INPUT_COLUMNS]:
-                    tmp_col_max_value = dict_fileData[fileName][_FF_KEY_DATA][_value_].max()
-                    dict_fileData[fileName][_FF_KEY_INP_COL_DENORM_VAL][_value_] = tmp_col_max_value
-                dict_fileData[fileName][_FF_KEY_OUT_COL_DENORM_VAL] = {}
-                for _value_ in dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS]:
-                    tmp_col_max_value = dict_fileData[fileName][_FF_KEY_DATA][_value_].max()
-                    dict_fileData[fileName][_FF_KEY_OUT_COL_DENORM_VAL][_value_] = tmp_col_max_value
-
-                # Set a path for exporting the input-output data
-                currentFileName = os.path.splitext(fileName)[0]
-                currentDatetime = file_manip.getCurrentDatetimeForPath()  # Find Current Datetime
-                exportPrimaryDir = self.dict_machineLearningParameters[self.dkey_mlpExportFolder()] + \
-                                   '/' + currentFileName + '/' + currentDatetime
-                exportDataFolder = os.path.normpath(exportPrimaryDir + '/Data')
-                file_manip.checkAndCreateFolders(exportDataFolder)  # check if path exists and if not create it
-                # Export the input values
-                file_manip.exportDictionaryNonList(dictForExport=dict_fileData[fileName][_FF_KEY_INP_COL_DENORM_VAL],
-                                                   exportPath=os.path.normpath(
-                                                       exportDataFolder + '/InputColumnsDenormValues.csv'),
-                                                   headerLine=['InputColumn, DenormValue'])
-                # Export the output values
-                file_manip.exportDictionaryNonList(dictForExport=dict_fileData[fileName][_FF_KEY_OUT_COL_DENORM_VAL],
-                                                   exportPath=os.path.normpath(
-                                                       exportDataFolder + '/OutputColumnsDenormValues.csv'),
-                                                   headerLine=['OutputColumn, DenormValue'])
-
-                # Set the PRIMARY_EVENT_DATA as a dict
-                dict_fileData[fileName][_FF_KEY_COLUMN_PRIMARY_EVENT_DATA] = {_FF_KEY_INPUT: {}, _FF_KEY_OUTPUT: {}}
-                # if primaryEvent value is not None (means the user picked a primary column)
-                if primaryEvent is not None:
-                    # add the unique event values in the dictionary with key PRIMARY_EVENT_UNIQUE_VALUES
-                    dict_fileData[fileName][_FF_KEY_PRIMARY_EVENT_UNIQUE_VALUES] = []
-                    [dict_fileData[fileName][_FF_KEY_PRIMARY_EVENT_UNIQUE_VALUES].append(value)
-                     for value in dict_fileData[fileName][_FF_KEY_DATA][primaryEvent]
-                     if value not in dict_fileData[fileName][_FF_KEY_PRIMARY_EVENT_UNIQUE_VALUES]]
-
-                    # Create a dictionary to normalize the data
-                    tmp_dict_normValues = {}
-                    for key in dict_fileData[fileName][_FF_KEY_INP_COL_DENORM_VAL].keys():
-                        tmp_dict_normValues[key] = dict_fileData[fileName][_FF_KEY_INP_COL_DENORM_VAL][key]
-                    for key in dict_fileData[fileName][_FF_KEY_OUT_COL_DENORM_VAL].keys():
-                        tmp_dict_normValues[key] = dict_fileData[fileName][_FF_KEY_OUT_COL_DENORM_VAL][key]
-
-                    # Create the event keys and store the corresponding rows for each key
-                    for _event_ in dict_fileData[fileName][_FF_KEY_PRIMARY_EVENT_UNIQUE_VALUES]:
-                        tmp_df = dict_fileData[fileName][_FF_KEY_DATA].copy()  # create a tmp copy of the data
-                        tmp_df = tmp_df.loc[tmp_df[primaryEvent] == _event_]  # select only the rows of the events
-                        del tmp_df[primaryEvent]
-
-                        for key in tmp_df.keys():
-                            tmp_df[key] /= tmp_dict_normValues[key]
-
-                        tmp_input_columns = dict_fileData[fileName][_FF_KEY_INPUT_COLUMNS]
-                        tmp_output_columns = dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS]
-
-                        dict_fileData[fileName][_FF_KEY_COLUMN_PRIMARY_EVENT_DATA][_FF_KEY_INPUT][_event_] = tmp_df[
-                            tmp_input_columns].values.tolist()
-                        dict_fileData[fileName][_FF_KEY_COLUMN_PRIMARY_EVENT_DATA][_FF_KEY_OUTPUT][_event_] = tmp_df[
-                            tmp_output_columns].values.tolist()
-
-                else:
-                    # Create a dictionary to normalize the date
-                    tmp_dict_normValues = {}
-                    for key in dict_fileData[fileName][_FF_KEY_INP_COL_DENORM_VAL].keys():
-                        tmp_dict_normValues[key] = dict_fileData[fileName][_FF_KEY_INP_COL_DENORM_VAL][key]
-                    for key in dict_fileData[fileName][_FF_KEY_OUT_COL_DENORM_VAL].keys():
-                        tmp_dict_normValues[key] = dict_fileData[fileName][_FF_KEY_OUT_COL_DENORM_VAL][key]
-
-                    tmp_df = dict_fileData[fileName][_FF_KEY_DATA].copy()
-
-                    for key in tmp_df.keys():
-                        tmp_df[key] /= tmp_dict_normValues[key]
-
-                    tmp_input_columns = dict_fileData[fileName][_FF_KEY_INPUT_COLUMNS]
-                    tmp_output_columns = dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS]
-
-                    dict_fileData[fileName][_FF_KEY_COLUMN_PRIMARY_EVENT_DATA][_FF_KEY_INPUT][_FF_KEY_DATA] = tmp_df[
-                        tmp_input_columns].values.tolist()
-                    dict_fileData[fileName][_FF_KEY_COLUMN_PRIMARY_EVENT_DATA][_FF_KEY_OUTPUT][_FF_KEY_DATA] = tmp_df[
-                        tmp_output_columns].values.tolist()
-
-                dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ARRAY] = {}
-                dict_fileData[fileName][_FF_KEY_TEST_ARRAY] = {}
-                dict_fileData[fileName][_FF_KEY_FULL_ARRAY] = {}
-                dict_fileData[fileName][_FF_KEY_INPUT_COLUMNS_FOR_ML] = []
-                dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS_FOR_ML] = []
-                dict_fileData[fileName][_FF_KEY_TRAIN_TEST_SPLIT_INDEX] = {}
-
-                (dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ARRAY][_FF_KEY_INPUT],
-                 dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ARRAY][_FF_KEY_OUTPUT],
-                 dict_fileData[fileName][_FF_KEY_TEST_ARRAY][_FF_KEY_INPUT],
-                 dict_fileData[fileName][_FF_KEY_TEST_ARRAY][_FF_KEY_OUTPUT],
-                 dict_fileData[fileName][_FF_KEY_FULL_ARRAY][_FF_KEY_INPUT],
-                 dict_fileData[fileName][_FF_KEY_FULL_ARRAY][_FF_KEY_OUTPUT],
-                 dict_fileData[fileName][_FF_KEY_INPUT_COLUMNS_FOR_ML],
-                 dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS_FOR_ML],
-                 dict_fileData[fileName][_FF_KEY_TRAIN_TEST_SPLIT_INDEX]) = \
-                    self.BE_setTrainValTestArrays(
-                        dictDataInput=dict_fileData[fileName][_FF_KEY_COLUMN_PRIMARY_EVENT_DATA][_FF_KEY_INPUT],
-                        dictDataOutput=dict_fileData[fileName][_FF_KEY_COLUMN_PRIMARY_EVENT_DATA][_FF_KEY_OUTPUT],
-                        inputHeaders=dict_fileData[fileName][_FF_KEY_INPUT_COLUMNS],
-                        outputHeaders=dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS])
-
-                tmp_input_header_arr = ['Event']
-                tmp_input_header_arr.extend(dict_fileData[fileName][_FF_KEY_INPUT_COLUMNS_FOR_ML])
-                tmp_output_header_arr = ['Event']
-                tmp_output_header_arr.extend(dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS_FOR_ML])
-
-                print(file_manip.getCurrentDatetimeForConsole() + "::Export INPUT training array...")
-                file_manip.exportDictionaryList(
-                    dictForExport=dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ARRAY][_FF_KEY_INPUT],
-                    exportPath=os.path.normpath(
-                        exportDataFolder + '/InputTrainingValidation.csv'),
-                    headerLine=tmp_input_header_arr)
-
-                print(file_manip.getCurrentDatetimeForConsole() + "::Export OUTPUT training array...")
-                file_manip.exportDictionaryList(
-                    dictForExport=dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ARRAY][_FF_KEY_OUTPUT],
-                    exportPath=os.path.normpath(
-                        exportDataFolder + '/OutputTrainingValidation.csv'),
-                    headerLine=tmp_output_header_arr)
-
-                print(file_manip.getCurrentDatetimeForConsole() + "::Export INPUT testing array...")
-                file_manip.exportDictionaryList(
-                    dictForExport=dict_fileData[fileName][_FF_KEY_TEST_ARRAY][_FF_KEY_INPUT],
-                    exportPath=os.path.normpath(
-                        exportDataFolder + '/InputTest.csv'),
-                    headerLine=tmp_input_header_arr)
-
-                print(file_manip.getCurrentDatetimeForConsole() + "::Export OUTPUT testing array...")
-                file_manip.exportDictionaryList(
-                    dictForExport=dict_fileData[fileName][_FF_KEY_TEST_ARRAY][_FF_KEY_OUTPUT],
-                    exportPath=os.path.normpath(
-                        exportDataFolder + '/OutputTest.csv'),
-                    headerLine=tmp_output_header_arr)
-
-                # Set the output headers Real/Pred which will be used later in the exported results
-                dict_fileData[fileName][_FF_KEY_OUT_COL_HEADER_REAL] = []
-                [dict_fileData[fileName][_FF_KEY_OUT_COL_HEADER_REAL].append(col + "_Real")
-                 for col in dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS_FOR_ML]]
-                dict_fileData[fileName][_FF_KEY_OUT_COL_HEADER_PRED] = []
-                [dict_fileData[fileName][_FF_KEY_OUT_COL_HEADER_PRED].append(col + "_Pred")
-                 for col in dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS_FOR_ML]]
-
-                # print(dict_fileData[fileName])
-
-                headerCorrelation = ['Method']
-                for column_name in dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS_FOR_ML]:
-                    headerCorrelation.append(column_name)
-                dirExportPlot = 'ExportPlots'
-
-                # 02 - Run Machine Learning Process
-                print(file_manip.getCurrentDatetimeForConsole() + "::Start Machine Learning Process")
-                # ******** THIS CODE MAY BE EDITED WITH THREADING ****
-                X_TrainVal = self.BE_getArrayFromDictList(
-                    dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ARRAY][_FF_KEY_INPUT])
-                y_TrainVal = self.BE_getArrayFromDictList(
-                    dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ARRAY][_FF_KEY_OUTPUT])
-                X_Test = self.BE_getArrayFromDictList(
-                    dict_fileData[fileName][_FF_KEY_TEST_ARRAY][_FF_KEY_INPUT])
-                y_Test = self.BE_getArrayFromDictList(
-                    dict_fileData[fileName][_FF_KEY_TEST_ARRAY][_FF_KEY_OUTPUT])
-                listStr_ModelPaths, exportBaseDirPath, workbookDirPath = \
-                    self.mlr_Regression.fit(X_TrainVal=X_TrainVal,
-                                            y_TrainVal=y_TrainVal,
-                                            X_Test=X_Test,
-                                            y_Test=y_Test,
-                                            exportFolder=exportPrimaryDir)
-                # Create a workbook for storing the Errors for each unique event
-                workbookPath_ErrorsForTrainValTest = workbookDirPath + '/' + currentFileName + '_ErrorsForTrainValTest.xlsx'
-                workbookPath_ErrorsForTrainVal = workbookDirPath + '/' + currentFileName + '_ErrorsForTrainVal.xlsx'
-                workbookPath_ErrorsForTest = workbookDirPath + '/' + currentFileName + '_ErrorsForTest.xlsx'
-
-                # for each uniqueEvent
-                uniqueEventCounter = 0
-                uniqueEventSize = dict_fileData[fileName][_FF_KEY_PRIMARY_EVENT_UNIQUE_VALUES].__len__()
-                for _uniqueEvent_ in dict_fileData[fileName][_FF_KEY_PRIMARY_EVENT_UNIQUE_VALUES]:
-                    print('\n' + file_manip.getCurrentDatetimeForConsole() + '::(' + str(uniqueEventCounter + 1) +
-                          ' / ' + str(uniqueEventSize) + ') Event: ', _uniqueEvent_)
-                    uniqueEventCounter += 1
-                    # Shorten the variable name of trainTestSplitIndex
-                    trainTestSplitIndex = dict_fileData[fileName][_FF_KEY_TRAIN_TEST_SPLIT_INDEX][_uniqueEvent_]
-
-                    # ---------------------------------------------------------------------------- #
-
-                    # ***** workbookPath_ErrorsForTrainValTest ***** #
-                    # try to load the workbook for storing the errors
-                    try:
-                        wb_ErrorsForTrainValTest = op.load_workbook(workbookPath_ErrorsForTrainValTest)  # load workbook
-                        ws_ErrorsForTrainValTest = wb_ErrorsForTrainValTest.worksheets[0]  # select first worksheet
-                    except FileNotFoundError:  # exception: Create the workbook
-                        # Create the header row
-                        headers_row = ['Event', 'Technique']
-                        headers_errors = ['_MAX_NORM', '_MAX_DENORM',
-                                          '_MIN_NORM', '_MIN_DENORM',
-                                          '_MSE_NORM', '_MSE_DENORM',
-                                          '_RMSE_NORM', '_RMSE_DENORM',
-                                          '_MAE_NORM', '_MAE_DENORM']
-                        for _header_ in dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS_FOR_ML]:
-                            for _headerError_ in headers_errors:
-                                headers_row.append(_header_ + _headerError_)
-
-                        wb_ErrorsForTrainValTest = op.Workbook()  # open a workbook
-                        ws_ErrorsForTrainValTest = wb_ErrorsForTrainValTest.active  # set a worksheet active
-                        ws_ErrorsForTrainValTest.append(headers_row)  # append to worksheet the header row
-                        wb_ErrorsForTrainValTest.save(workbookPath_ErrorsForTrainValTest)  # save the workbook
-
-                    # ***** workbookPath_ErrorsForTrainVal ***** #
-                    try:
-                        wb_ErrorsForTrainVal = op.load_workbook(workbookPath_ErrorsForTrainVal)  # load workbook
-                        ws_ErrorsForTrainVal = wb_ErrorsForTrainVal.worksheets[0]  # select first worksheet
-                    except FileNotFoundError:  # exception: Create the workbook
-                        # Create the header row
-                        headers_row = ['Event', 'Technique']
-                        headers_errors = ['_MAX_NORM', '_MAX_DENORM',
-                                          '_MIN_NORM', '_MIN_DENORM',
-                                          '_MSE_NORM', '_MSE_DENORM',
-                                          '_RMSE_NORM', '_RMSE_DENORM',
-                                          '_MAE_NORM', '_MAE_DENORM']
-                        for _header_ in dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS_FOR_ML]:
-                            for _headerError_ in headers_errors:
-                                headers_row.append(_header_ + _headerError_)
-
-                        wb_ErrorsForTrainVal = op.Workbook()  # open a workbook
-                        ws_ErrorsForTrainVal = wb_ErrorsForTrainVal.active  # set a worksheet active
-                        ws_ErrorsForTrainVal.append(headers_row)  # append to worksheet the header row
-                        wb_ErrorsForTrainVal.save(workbookPath_ErrorsForTrainVal)  # save the workbook
-
-                    # ***** workbookPath_ErrorsForTest ***** #
-                    try:
-                        wb_ErrorsForTest = op.load_workbook(workbookPath_ErrorsForTest)  # load workbook
-                        ws_ErrorsForTest = wb_ErrorsForTest.worksheets[0]  # select first worksheet
-                    except FileNotFoundError:  # exception: Create the workbook
-                        # Create the header row
-                        headers_row = ['Event', 'Technique']
-                        headers_errors = ['_MAX_NORM', '_MAX_DENORM',
-                                          '_MIN_NORM', '_MIN_DENORM',
-                                          '_MSE_NORM', '_MSE_DENORM',
-                                          '_RMSE_NORM', '_RMSE_DENORM',
-                                          '_MAE_NORM', '_MAE_DENORM']
-                        for _header_ in dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS_FOR_ML]:
-                            for _headerError_ in headers_errors:
-                                headers_row.append(_header_ + _headerError_)
-
-                        wb_ErrorsForTest = op.Workbook()  # open a workbook
-                        ws_ErrorsForTest = wb_ErrorsForTest.active  # set a worksheet active
-                        ws_ErrorsForTest.append(headers_row)  # append to worksheet the header row
-                        wb_ErrorsForTest.save(workbookPath_ErrorsForTest)  # save the workbook
-
-                    # ---------------------------------------------------------------------------- #
-
-                    # Store the INPUT and OUTPUT of current event to shortened named variables
-                    df_x_TrainValTest = dict_fileData[fileName][_FF_KEY_FULL_ARRAY][_FF_KEY_INPUT][_uniqueEvent_]
-                    df_y_TrainValTest = dict_fileData[fileName][_FF_KEY_FULL_ARRAY][_FF_KEY_OUTPUT][_uniqueEvent_]
-
-                    df_x_TrainVal = dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ARRAY][_FF_KEY_INPUT][_uniqueEvent_]
-                    df_y_TrainVal = dict_fileData[fileName][_FF_KEY_TRAIN_VAL_ARRAY][_FF_KEY_OUTPUT][_uniqueEvent_]
-
-                    df_x_Test = dict_fileData[fileName][_FF_KEY_TEST_ARRAY][_FF_KEY_INPUT][_uniqueEvent_]
-                    df_y_Test = dict_fileData[fileName][_FF_KEY_TEST_ARRAY][_FF_KEY_OUTPUT][_uniqueEvent_]
-
-                    # make predictions for all models on TrainValTest
-                    dict_Y_TrainValTest = self.mlr_Regression.predict(df_x_TrainValTest,
-                                                                      df_y_TrainValTest)
-                    # make predictions for all models on TrainVal
-                    dict_Y_TrainVal = self.mlr_Regression.predict(df_x_TrainVal,
-                                                                  df_y_TrainVal)
-
-                    # make predictions for all models on Test
-                    dict_Y_Test = self.mlr_Regression.predict(df_x_Test,
-                                                              df_y_Test)
-
-                    # cor_CSV = [headerCorrelation]  # create a CSV list and add the header row
-                    for _modelName_ in dict_Y_TrainValTest:  # for each modelName in dict_Y
-                        # Create an append row (for workbook) and add the uniqueEvent and modelName
-                        tmpAppendRow_TrainValTest = [_uniqueEvent_, _modelName_]
-                        tmpAppendRow_TrainVal = [_uniqueEvent_, _modelName_]
-                        tmpAppendRow_Test = [_uniqueEvent_, _modelName_]
-                        # Create an append row (for cor_CSV) and add the modelName
-                        # tmpCorRow_CSV = [_modelName_]
-
-                        # Store the normalized values (real, predicted) to shortened variables
-                        df_Y_realNorm_TrainValTest = pd.DataFrame(
-                            dict_Y_TrainValTest[_modelName_]['real'],
-                            columns=dict_fileData[fileName][
-                                _FF_KEY_OUT_COL_HEADER_REAL])
-                        df_Y_predNorm_TrainValTest = pd.DataFrame(
-                            dict_Y_TrainValTest[_modelName_]['pred'],
-                            columns=dict_fileData[fileName][
-                                _FF_KEY_OUT_COL_HEADER_PRED])
-
-                        df_Y_realNorm_TrainVal = pd.DataFrame(
-                            dict_Y_TrainVal[_modelName_]['real'],
-                            columns=dict_fileData[fileName][
-                                _FF_KEY_OUT_COL_HEADER_REAL])
-                        df_Y_predNorm_TrainVal = pd.DataFrame(
-                            dict_Y_TrainVal[_modelName_]['pred'],
-                            columns=dict_fileData[fileName][
-                                _FF_KEY_OUT_COL_HEADER_PRED])
-
-                        df_Y_realNorm_Test = pd.DataFrame(
-                            dict_Y_Test[_modelName_]['real'],
-                            columns=dict_fileData[fileName][
-                                _FF_KEY_OUT_COL_HEADER_REAL])
-                        df_Y_predNorm_Test = pd.DataFrame(
-                            dict_Y_Test[_modelName_]['pred'],
-                            columns=dict_fileData[fileName][
-                                _FF_KEY_OUT_COL_HEADER_PRED])
-
-                        # Copy the normalized values to denormalized variables
-                        df_Y_realDenorm_TrainValTest = df_Y_realNorm_TrainValTest.copy()
-                        df_Y_predDenorm_TrainValTest = df_Y_predNorm_TrainValTest.copy()
-
-                        df_Y_realDenorm_TrainVal = df_Y_realNorm_TrainVal.copy()
-                        df_Y_predDenorm_TrainVal = df_Y_predNorm_TrainVal.copy()
-
-                        df_Y_realDenorm_Test = df_Y_realNorm_Test.copy()
-                        df_Y_predDenorm_Test = df_Y_predNorm_Test.copy()
-
-                        # Create the paths for exporting data
-                        # Main Directory
-                        o_dir_Model = os.path.normpath(exportBaseDirPath + '/' + dirExportPlot + '/' +
-                                                       _uniqueEvent_ + '/' + _modelName_) + '/'
-                        file_manip.checkAndCreateFolders(o_dir_Model)
-                        # Directory to Export the Signal Comparison
-                        o_dir_SignalCompare = os.path.normpath(o_dir_Model + 'SignalCompare') + '/'
-                        file_manip.checkAndCreateFolders(o_dir_SignalCompare)
-                        # Directory to Export the Real and Predicted Plots
-                        o_dir_RealPredictPlots = os.path.normpath(o_dir_Model + 'RealPredictPlots') + '/'
-                        file_manip.checkAndCreateFolders(o_dir_RealPredictPlots)
-                        # Directory to Export the Real and Predicted CSV normalized/denormalized values
-                        o_dir_RealPredictCSV = os.path.normpath(o_dir_Model + 'RealPredictCSV') + '/'
-                        file_manip.checkAndCreateFolders(o_dir_RealPredictCSV)
-
-                        for _index_ in range(0, dict_fileData[fileName][_FF_KEY_OUT_COL_HEADER_REAL].__len__()):
-                            mul_ind = 1.0  # set multiply index to 1
-                            # get current row
-                            currColumn_real = dict_fileData[fileName][_FF_KEY_OUT_COL_HEADER_REAL][_index_]
-                            currColumn_pred = dict_fileData[fileName][_FF_KEY_OUT_COL_HEADER_PRED][_index_]
-                            currColumn = dict_fileData[fileName][_FF_KEY_OUTPUT_COLUMNS_FOR_ML][_index_]
-
-                            for _oColumn_ in dict_fileData[fileName][_FF_KEY_OUT_COL_DENORM_VAL]:
-                                if currColumn_real.__contains__(_oColumn_):
-                                    mul_ind = dict_fileData[fileName][_FF_KEY_OUT_COL_DENORM_VAL][_oColumn_]
-
-                            df_Y_realDenorm_TrainValTest[currColumn_real] *= mul_ind
-                            df_Y_predDenorm_TrainValTest[currColumn_pred] *= mul_ind
-
-                            df_Y_realDenorm_TrainVal[currColumn_real] *= mul_ind
-                            df_Y_predDenorm_TrainVal[currColumn_pred] *= mul_ind
-
-                            df_Y_realDenorm_Test[currColumn_real] *= mul_ind
-                            df_Y_predDenorm_Test[currColumn_pred] *= mul_ind
-
-                            print(file_manip.getCurrentDatetimeForConsole() +
-                                  "::Plot normalized figure for column: " + currColumn)
-                            y_max = df_Y_realNorm_TrainValTest[currColumn_real].max()
-                            if df_Y_predNorm_TrainValTest[currColumn_pred].max() > y_max:
-                                y_max = df_Y_predNorm_TrainValTest[currColumn_pred].max()
-                            exportFigPath = o_dir_RealPredictPlots + 'Normalized_' + _uniqueEvent_ + '_' + currColumn + '.png'
-                            figTitle = _uniqueEvent_ + ': ' + currColumn
-                            self.BE_saveRealPredictedOutputFigure(y_Real=df_Y_realNorm_TrainValTest[currColumn_real],
-                                                                  y_Pred=df_Y_predNorm_TrainValTest[currColumn_pred],
-                                                                  exportPath=exportFigPath,
-                                                                  # y_max=y_max,
-                                                                  trainTestSplit=trainTestSplitIndex,
-                                                                  title=figTitle,
-                                                                  yLabel=currColumn + ' (x' + str(mul_ind) + ')',
-                                                                  xLabel='')
-
-                            print(file_manip.getCurrentDatetimeForConsole() +
-                                  "::Plot normalized figure for column: " + currColumn)
-                            exportFigPath = o_dir_RealPredictPlots + 'Denormalized_' + _uniqueEvent_ + '_' + currColumn + '.png'
-                            figTitle = _uniqueEvent_ + ': ' + currColumn
-                            y_max *= mul_ind
-                            self.BE_saveRealPredictedOutputFigure(y_Real=df_Y_realDenorm_TrainValTest[currColumn_real],
-                                                                  y_Pred=df_Y_predDenorm_TrainValTest[currColumn_pred],
-                                                                  exportPath=exportFigPath,
-                                                                  # y_max=y_max,
-                                                                  trainTestSplit=trainTestSplitIndex,
-                                                                  title=figTitle,
-                                                                  yLabel=currColumn,
-                                                                  xLabel='')
-
-                            print(file_manip.getCurrentDatetimeForConsole() + "::Calculate the Errors")
-                            # Calculate the Errors - TrainValTest
-                            normList_yReal = df_Y_realNorm_TrainValTest[currColumn_real].to_numpy()
-                            normList_yPred = df_Y_predNorm_TrainValTest[currColumn_pred].to_numpy()
-                            denormList_yReal = df_Y_realDenorm_TrainValTest[currColumn_real].to_numpy()
-                            denormList_yPred = df_Y_predDenorm_TrainValTest[currColumn_pred].to_numpy()
-
-                            exportFigPath = o_dir_RealPredictPlots + 'Denormalized_TrainValTest_AbsoluteErrors' + \
-                                            _uniqueEvent_ + '_' + currColumn + '.png'
-                            figTitle = _uniqueEvent_ + ': ' + currColumn + ' Absolute Errors Full Set'
-                            tmpErrorArr = self.BE_calculateErrors(
-                                normList_yReal, normList_yPred,
-                                denormList_yReal, denormList_yPred,
-                                path_toSavePlot=exportFigPath,
-                                trainTestSplit=trainTestSplitIndex,
-                                title=figTitle
-                            )
-
-                            exportFigPath = o_dir_RealPredictPlots + 'Denormalized_TrainValTest_QQPlot' + \
-                                            _uniqueEvent_ + '_' + currColumn + '.png'
-                            figTitle = _uniqueEvent_ + ': ' + currColumn + ' QQ-Plot'
-                            self.BE_saveQQPlotFigure(
-                                y_Real=denormList_yReal,
-                                y_Pred=denormList_yPred,
-                                exportPath=exportFigPath,
-                                title=figTitle,
-                                yLabel='Predicted Values', xLabel='Real Values')
-
-                            for _error_ in tmpErrorArr:
-                                tmpAppendRow_TrainValTest.append(_error_)
-
-                            # Calculate the Errors - TrainVal
-                            normList_yReal = df_Y_realNorm_TrainVal[currColumn_real].to_numpy()
-                            normList_yPred = df_Y_predNorm_TrainVal[currColumn_pred].to_numpy()
-                            denormList_yReal = df_Y_realDenorm_TrainVal[currColumn_real].to_numpy()
-                            denormList_yPred = df_Y_predDenorm_TrainVal[currColumn_pred].to_numpy()
-
-                            exportFigPath = o_dir_RealPredictPlots + 'Denormalized_TrainVal_AbsoluteErrors' + \
-                                            _uniqueEvent_ + '_' + currColumn + '.png'
-                            figTitle = _uniqueEvent_ + ': ' + currColumn + ' Absolute Errors Train-Validation Set'
-                            tmpErrorArr = self.BE_calculateErrors(
-                                normList_yReal, normList_yPred,
-                                denormList_yReal, denormList_yPred,
-                                path_toSavePlot=exportFigPath,
-                                trainTestSplit=None,
-                                title=figTitle
-                            )
-
-                            exportFigPath = o_dir_RealPredictPlots + 'Denormalized_TrainVal_QQPlot' + \
-                                            _uniqueEvent_ + '_' + currColumn + '.png'
-                            figTitle = _uniqueEvent_ + ': ' + currColumn + ' QQ-Plot'
-                            self.BE_saveQQPlotFigure(
-                                y_Real=denormList_yReal,
-                                y_Pred=denormList_yPred,
-                                exportPath=exportFigPath,
-                                title=figTitle,
-                                yLabel='Predicted Values', xLabel='Real Values')
-
-                            for _error_ in tmpErrorArr:
-                                tmpAppendRow_TrainVal.append(_error_)
-
-                            # Calculate the Errors - Test
-                            normList_yReal = df_Y_realNorm_Test[currColumn_real].to_numpy()
-                            normList_yPred = df_Y_predNorm_Test[currColumn_pred].to_numpy()
-                            denormList_yReal = df_Y_realDenorm_Test[currColumn_real].to_numpy()
-                            denormList_yPred = df_Y_predDenorm_Test[currColumn_pred].to_numpy()
-
-                            exportFigPath = o_dir_RealPredictPlots + 'Denormalized_Test_AbsoluteErrors' + \
-                                            _uniqueEvent_ + '_' + currColumn + '.png'
-                            figTitle = _uniqueEvent_ + ': ' + currColumn + ' Absolute Errors Test Set'
-                            tmpErrorArr = self.BE_calculateErrors(
-                                normList_yReal, normList_yPred,
-                                denormList_yReal, denormList_yPred,
-                                path_toSavePlot=exportFigPath,
-                                trainTestSplit=None,
-                                title=figTitle
-                            )
-
-                            exportFigPath = o_dir_RealPredictPlots + 'Denormalized_Test_QQPlot' + \
-                                            _uniqueEvent_ + '_' + currColumn + '.png'
-                            figTitle = _uniqueEvent_ + ': ' + currColumn + ' QQ-Plot'
-                            self.BE_saveQQPlotFigure(
-                                y_Real=denormList_yReal,
-                                y_Pred=denormList_yPred,
-                                exportPath=exportFigPath,
-                                title=figTitle,
-                                yLabel='Predicted Values', xLabel='Real Values')
-
-                            for _error_ in tmpErrorArr:
-                                tmpAppendRow_Test.append(_error_)
-
-                            corrFileName = _uniqueEvent_ + '_' + currColumn
-                            self.signComp_Methods.signComp_exec_(
-                                arrData1=df_Y_realNorm_TrainValTest[currColumn_real].to_numpy(),
-                                arrData2=df_Y_predNorm_TrainValTest[currColumn_pred].to_numpy(),
-                                exportFigDirPath=o_dir_SignalCompare,
-                                exportFigFileName=corrFileName,
-                            )
-
-                        print(file_manip.getCurrentDatetimeForConsole() + "::Export Files")
-                        ws_ErrorsForTrainValTest.append(tmpAppendRow_TrainValTest)
-                        wb_ErrorsForTrainValTest.save(workbookPath_ErrorsForTrainValTest)
-                        ws_ErrorsForTrainVal.append(tmpAppendRow_TrainVal)
-                        wb_ErrorsForTrainVal.save(workbookPath_ErrorsForTrainVal)
-                        ws_ErrorsForTest.append(tmpAppendRow_Test)
-                        wb_ErrorsForTest.save(workbookPath_ErrorsForTest)
-                        df_Y_realNorm_TrainValTest.to_csv(
-                            o_dir_RealPredictCSV + '/' + _uniqueEvent_ + '_' + _modelName_ + '_OutputReal_Normalized.csv')
-                        df_Y_predNorm_TrainValTest.to_csv(
-                            o_dir_RealPredictCSV + '/' + _uniqueEvent_ + '_' + _modelName_ + '_OutputPred_Normalized.csv')
-                        df_Y_realDenorm_TrainValTest.to_csv(
-                            o_dir_RealPredictCSV + '/' + _uniqueEvent_ + '_' + _modelName_ + '_OutputReal_Denormalized.csv')
-                        df_Y_predDenorm_TrainValTest.to_csv(
-                            o_dir_RealPredictCSV + '/' + _uniqueEvent_ + '_' + _modelName_ + '_OutputPred_Denormalized.csv')
-
-                    # o_file = os.path.normpath(dir_path + "/../") + '/Correlation_R2.csv'
-                    # my_cal_v2.write_csv(o_file, cor_CSV)
-        print(file_manip.getCurrentDatetimeForConsole() + "::Execution Finished Successfully!!!")
+            # 01 - Run The Main Routine in a background thread (the window stays responsive)
+            self.executionWorker = execWorker.ExecutionWorker(executeFunc=self.BE_execute, parent=self)
+            self.executionWorker.signalProgress.connect(self.actionExecutionProgress)
+            self.executionWorker.signalError.connect(self.actionExecutionError)
+            self.executionWorker.signalExecutionFinished.connect(self.actionExecutionFinished)
+            self.BE_setExecutionRunning(True)
+            self.executionWorker.start()
+
+    def actionButtonCancel(self):
+        if self.executionWorker is not None:
+            self.executionWorker.requestCancel()  # the worker will stop at the next check
+            self.buttonCancel.setEnabled(False)  # disable the Cancel Button
+            self.progressBarExecute.setFormat('Cancelling...')
+            print(file_manip.getCurrentDatetimeForConsole() +
+                  "::Cancel requested. The execution will stop after the current step.")
+
+    def actionExecutionProgress(self, stage: str, current: int, total: int):
+        self.progressBarExecute.setMaximum(max(total, 1))  # set the total steps of the stage
+        self.progressBarExecute.setValue(current)  # set the current step
+        self.progressBarExecute.setFormat(stage + ' (%v / %m)')  # show the stage
+
+    def actionExecutionError(self, msg: str):
+        errorType = "Execution Error: "  # set error type
+        coFunc.consoleMessage(errorType + msg)  # print message to Console as Warning
+        coFunc.errorMessageDialog(classRef=self,
+                                  errorType=errorType,
+                                  textMessageInfo=msg,
+                                  iconPath=self.iconPath)  # print message to Error Dialog
+
+    def actionExecutionFinished(self, state: str):
+        self.executionWorker = None  # the worker thread has finished
+        self.BE_setExecutionRunning(False)
+        self.progressBarExecute.setFormat(state)  # Finished, Cancelled or Failed
+
+    def BE_setExecutionRunning(self, running: bool):
+        # Disable the components which change the execution settings while running
+        self.buttonAdd.setEnabled(not running)
+        self.buttonRemove.setEnabled(not running)
+        self.buttonExecute.setEnabled(not running and self.dict_tableFilesPaths.keys().__len__() > 0)
+        self.buttonCancel.setEnabled(running)
+        self.mainTabWidget.setEnabled(not running)
+        if running:
+            self.progressBarExecute.setValue(0)
+            self.progressBarExecute.setFormat('Starting...')
+
+    def BE_execute(self, progressFunc=None, isCancelledFunc=None):
+        """
+        Run the main pipeline (read, train, predict, plot and export) for all the opened files.
+        :param progressFunc: a function (stage, current, total) to report the progress (or None)
+        :param isCancelledFunc: a function which returns True if the execution must stop (or None)
+        :return: True if finished, False if cancelled
+        """
+        pipeline = regPipe.RegressionPipeline(dictParameters=self.dict_machineLearningParameters,
+                                              mlrRegression=self.mlr_Regression,
+                                              signCompMethods=self.signComp_Methods)
+        return pipeline.execute(self.dict_tableFilesPaths, progressFunc=progressFunc, isCancelledFunc=isCancelledFunc)
 
     def actionFileListRowChanged_event(self):
         self.listWidget_ColumnList.clear()  # Clear Column Widget
@@ -1895,6 +1000,30 @@ class WidgetMachineLearningRegressionWidget(QWidget):
         if self.debugMessageFlag:
             print(self.dict_machineLearningParameters[self.dkey_multifileTrainingProcessing()])
 
+    def actionMultifileWorkersChange(self):
+        self.dict_machineLearningParameters[self.dkey_multifileWorkers()] = \
+            self.widgetTabMachineLearningSettings.tabGeneral.spinBox_MultifileWorkers.value()
+        if self.debugMessageFlag:
+            print(self.dict_machineLearningParameters[self.dkey_multifileWorkers()])
+
+    def actionFigureWorkersChange(self):
+        self.dict_machineLearningParameters[self.dkey_figureWorkers()] = \
+            self.widgetTabMachineLearningSettings.tabGeneral.spinBox_FigureWorkers.value()
+        if self.debugMessageFlag:
+            print(self.dict_machineLearningParameters[self.dkey_figureWorkers()])
+
+    def actionPlotEventsChange(self):
+        self.dict_machineLearningParameters[self.dkey_plotEvents()] = \
+            self.widgetTabMachineLearningSettings.tabGeneral.getPlotEvents()
+        if self.debugMessageFlag:
+            print(self.dict_machineLearningParameters[self.dkey_plotEvents()])
+
+    def actionPlotModelsChange(self):
+        self.dict_machineLearningParameters[self.dkey_plotModels()] = \
+            self.widgetTabMachineLearningSettings.tabGeneral.getPlotModels()
+        if self.debugMessageFlag:
+            print(self.dict_machineLearningParameters[self.dkey_plotModels()])
+
     def actionTestPercentageDistributionChange(self):
         self.dict_machineLearningParameters[self.dkey_mlpTestPercentageDistribution()] = \
             self.widgetTabMachineLearningSettings.tabGeneral.comboBox_TestPercentageDistribution.currentText()
@@ -2076,6 +1205,15 @@ class WidgetMachineLearningRegressionWidget(QWidget):
         state = self.widgetTabMachineLearningSettings.tabSignalCompare.getCheckState_DynamicTimeWarping()
         self.signComp_Methods.setDynamicTimeWarping_state(state)
 
+    def actionDynamicTimeWarpingWindowChange(self):
+        windowType = self.widgetTabMachineLearningSettings.tabSignalCompare.getDynamicTimeWarpingWindow()
+        windowSize = self.widgetTabMachineLearningSettings.tabSignalCompare.getDynamicTimeWarpingWindowSize()
+        # the window size is used only by the Sakoe-Chiba window
+        self.widgetTabMachineLearningSettings.tabSignalCompare.spinBox_DynamicTimeWarpingWindowSize.setEnabled(
+            windowType == signComp.SC_DTW_WINDOW_SAKOE_CHIBA)
+        self.signComp_Methods.setDynamicTimeWarping_window(
+            windowType, windowSize if windowType == signComp.SC_DTW_WINDOW_SAKOE_CHIBA else None)
+
     # ***** MACHINE LEARNING WIDGET OPTIONS EVENTS *** #
     # _____ RIDGE _____ #
     def actionButtonClicked_Ridge_TolAdd(self):
@@ -2355,6 +1493,20 @@ class WidgetTabMachineLearningSettingsGeneral(QWidget):
         # set the minimum value to 1 (at least a row needs to be used as input/output)
         self.spinBox_MachineLearningFilterIndex.setMinimum(1)
 
+        # create a spinBox for the MultifileWorkers
+        self.spinBox_MultifileWorkers = QSpinBox()
+        # set the minimum value to 0 (0 = auto, a worker per file up to the number of cores)
+        self.spinBox_MultifileWorkers.setMinimum(0)
+        # set the maximum value to the number of cores
+        self.spinBox_MultifileWorkers.setMaximum(os.cpu_count() or 1)
+
+        # create a spinBox for the FigureWorkers
+        self.spinBox_FigureWorkers = QSpinBox()
+        # set the minimum value to 0 (0 = render the figures in the main loop)
+        self.spinBox_FigureWorkers.setMinimum(0)
+        # set the maximum value to the number of cores
+        self.spinBox_FigureWorkers.setMaximum(os.cpu_count() or 1)
+
         # -------------------------- #
         # ----- QDoubleSpinBox ----- #
         # -------------------------- #
@@ -2381,6 +1533,12 @@ class WidgetTabMachineLearningSettingsGeneral(QWidget):
         self.lineEdit_SetOutPath = QLineEdit()
         self.lineEdit_SetOutPath.setEnabled(False)
 
+        # the events/models to be plotted (comma separated, empty = all)
+        self.lineEdit_PlotEvents = QLineEdit()
+        self.lineEdit_PlotEvents.setPlaceholderText('All Events')
+        self.lineEdit_PlotModels = QLineEdit()
+        self.lineEdit_PlotModels.setPlaceholderText('All Models')
+
         # --------------------- #
         # ----- QComboBox ----- #
         # --------------------- #
@@ -2415,6 +1573,10 @@ class WidgetTabMachineLearningSettingsGeneral(QWidget):
         self._mlMethodIndexDefaultValue = MLF_DEFAULT_METHOD_INDEX
         self._mlFilterIndexDefaultValue = MLF_DEFAULT_FILTER_INDEX
         self._mlMultifileTrainingProcessingDefaultValue = MLF_DEFAULT_MULTIFILE_TRAINING_PROCESSING
+        self._mlMultifileWorkersDefaultValue = MLF_DEFAULT_MULTIFILE_WORKERS
+        self._figureWorkersDefaultValue = MLF_DEFAULT_FIGURE_WORKERS
+        self._plotEventsDefaultValue = MLF_DEFAULT_PLOT_EVENTS
+        self._plotModelsDefaultValue = MLF_DEFAULT_PLOT_MODELS
         self._testPercentageDistributionDefaultValue = MLF_DEFAULT_TEST_PERCENTAGE_DISTRIBUTION
         self._holdoutPercentageDistributionDefaultValue = MLF_DEFAULT_HOLDOUT_PERCENTAGE_DISTRIBUTION
 
@@ -2450,6 +1612,14 @@ class WidgetTabMachineLearningSettingsGeneral(QWidget):
         # label_MachineLearningMethodIndex.setMinimumWidth(100)
         label_MultifileTrainingProcessing = QLabel("Multifile Training Processing:")
         # label_MultifileTrainingProcessing.setMinimumWidth(100)
+        label_MultifileWorkers = QLabel("Parallel Workers (0 = Auto):")
+        # label_MultifileWorkers.setMinimumWidth(100)
+        label_FigureWorkers = QLabel("Figure Render Workers (0 = No Workers):")
+        # label_FigureWorkers.setMinimumWidth(100)
+        label_PlotEvents = QLabel("Plot Events (comma separated):")
+        # label_PlotEvents.setMinimumWidth(100)
+        label_PlotModels = QLabel("Plot Models (comma separated):")
+        # label_PlotModels.setMinimumWidth(100)
 
         # Set SpinBoxes
         hbox_ExperimentalNumber = QHBoxLayout()
@@ -2523,10 +1693,36 @@ class WidgetTabMachineLearningSettingsGeneral(QWidget):
         hbox_MultifileTrainingProcessing.addWidget(self.comboBox_MultifileTrainingProcessing)
         hbox_MultifileTrainingProcessing.addSpacerItem(QSpacerItem(INT_MAX_STRETCH, 0))
 
+        hbox_MultifileWorkers = QHBoxLayout()
+        hbox_MultifileWorkers.addWidget(label_MultifileWorkers)
+        hbox_MultifileWorkers.addWidget(self.spinBox_MultifileWorkers)
+        hbox_MultifileWorkers.addSpacerItem(QSpacerItem(INT_MAX_STRETCH, 0))
+
+        # Figures
+        hbox_FigureWorkers = QHBoxLayout()
+        hbox_FigureWorkers.addWidget(label_FigureWorkers)
+        hbox_FigureWorkers.addWidget(self.spinBox_FigureWorkers)
+        hbox_FigureWorkers.addSpacerItem(QSpacerItem(INT_MAX_STRETCH, 0))
+
+        hbox_PlotEvents = QHBoxLayout()
+        hbox_PlotEvents.addWidget(label_PlotEvents)
+        hbox_PlotEvents.addWidget(self.lineEdit_PlotEvents)
+
+        hbox_PlotModels = QHBoxLayout()
+        hbox_PlotModels.addWidget(label_PlotModels)
+        hbox_PlotModels.addWidget(self.lineEdit_PlotModels)
+
+        vbox_finalFigures = QVBoxLayout()
+        vbox_finalFigures.addLayout(hbox_FigureWorkers)
+        vbox_finalFigures.addLayout(hbox_PlotEvents)
+        vbox_finalFigures.addLayout(hbox_PlotModels)
+
         self.vbox_main_layout.addLayout(vbox_finalSpinBoxes)
         self.vbox_main_layout.addLayout(hbox_SetOutPath)
         self.vbox_main_layout.addLayout(vbox_finalMachineLearningMethods)
         self.vbox_main_layout.addLayout(hbox_MultifileTrainingProcessing)
+        self.vbox_main_layout.addLayout(hbox_MultifileWorkers)
+        self.vbox_main_layout.addLayout(vbox_finalFigures)
         # self.vbox_main_layout.addSpacerItem(QSpacerItem(0, INT_MAX_STRETCH))
         self.vbox_main_layout.addLayout(hbox_buttons)
 
@@ -2540,6 +1736,10 @@ class WidgetTabMachineLearningSettingsGeneral(QWidget):
         self.spinBox_MachineLearningMethodsIndex.setValue(self._mlMethodIndexDefaultValue)
         self.spinBox_MachineLearningFilterIndex.setValue(self._mlFilterIndexDefaultValue)
         self.comboBox_MultifileTrainingProcessing.setCurrentText(self._mlMultifileTrainingProcessingDefaultValue)
+        self.spinBox_MultifileWorkers.setValue(self._mlMultifileWorkersDefaultValue)
+        self.spinBox_FigureWorkers.setValue(self._figureWorkersDefaultValue)
+        self.lineEdit_PlotEvents.setText(', '.join(self._plotEventsDefaultValue))
+        self.lineEdit_PlotModels.setText(', '.join(self._plotModelsDefaultValue))
         self.comboBox_TestPercentageDistribution.setCurrentText(self._testPercentageDistributionDefaultValue)
         self.comboBox_HoldoutPercentageDistribution.setCurrentText(self._holdoutPercentageDistributionDefaultValue)
 
@@ -2579,6 +1779,31 @@ class WidgetTabMachineLearningSettingsGeneral(QWidget):
     def getDefaultMultifileTrainingProcessing(self):
         return self._mlMultifileTrainingProcessingDefaultValue
 
+    def getDefaultMultifileWorkers(self):
+        return self._mlMultifileWorkersDefaultValue
+
+    def getDefaultFigureWorkers(self):
+        return self._figureWorkersDefaultValue
+
+    def getDefaultPlotEvents(self):
+        return self._plotEventsDefaultValue
+
+    def getDefaultPlotModels(self):
+        return self._plotModelsDefaultValue
+
+    # ------------------------------ #
+    # ----- GET CURRENT VALUES ----- #
+    # ------------------------------ #
+    @staticmethod
+    def _splitNames(text: str):
+        return [name.strip() for name in text.split(',') if name.strip() != '']
+
+    def getPlotEvents(self):
+        return self._splitNames(self.lineEdit_PlotEvents.text())
+
+    def getPlotModels(self):
+        return self._splitNames(self.lineEdit_PlotModels.text())
+
 
 # *********** Machine Learning Settings --> Regression Methods *********** #
 class WidgetTabMachineLearningSettingsRegressionMethods(QWidget):
@@ -3230,6 +2455,19 @@ class WidgetTabMachineLearningSettingsSignalCompareMethods(QWidget):
         self.checkbox_TimeLaggedCrossCorrelationNoSplits.setEnabled(False)
         self.checkbox_RollingWindowTimeLaggedCrossCorrelation.setEnabled(False)
 
+        # ---------------------------------- #
+        # ----- Dynamic Time Warping ------- #
+        # ---------------------------------- #
+        # the window of the warping path (none, Sakoe-Chiba band or Itakura parallelogram)
+        self.comboBox_DynamicTimeWarpingWindow = QComboBox()
+        self.comboBox_DynamicTimeWarpingWindow.addItems(signComp.SC_DTW_WINDOW_LIST)
+        # the Sakoe-Chiba window size (in samples)
+        self.spinBox_DynamicTimeWarpingWindowSize = QSpinBox()
+        self.spinBox_DynamicTimeWarpingWindowSize.setMinimum(0)
+        self.spinBox_DynamicTimeWarpingWindowSize.setMaximum(1000000)
+        self.spinBox_DynamicTimeWarpingWindowSize.setValue(signComp.SC_DTW_DEFAULT_WINDOW_SIZE)
+        self.spinBox_DynamicTimeWarpingWindowSize.setEnabled(False)
+
         # ---------------------- #
         # ----- ScrollArea ----- #
         # ---------------------- #
@@ -3262,11 +2500,15 @@ class WidgetTabMachineLearningSettingsSignalCompareMethods(QWidget):
         label_TimeLaggedCrossCorrelationNoSplits = QLabel(signComp.SC_TIME_LAGGED_CROSS_CORRELATION_NO_SPLITS)
         label_RollingWindowTimeLaggedCrossCorrelation = QLabel(signComp.SC_ROLLING_WINDOW_TIME_LAGGED_CROSS_CORRELATION)
         label_DynamicTimeWarping = QLabel(signComp.SC_DYNAMIC_TIME_WARPING)
+        label_DynamicTimeWarpingWindow = QLabel(signComp.SC_DYNAMIC_TIME_WARPING + ' ' +
+                                                signComp.SC_DYNAMIC_TIME_WARPING_WINDOW_TYPE)
+        label_DynamicTimeWarpingWindowSize = QLabel(signComp.SC_DYNAMIC_TIME_WARPING + ' ' +
+                                                    signComp.SC_DYNAMIC_TIME_WARPING_WINDOW_SIZE)
 
         # Set layout
         scrollAreaWidget = QWidget()
         scrollAreaWidget.setMaximumWidth(480)
-        scrollAreaWidget.setMaximumHeight(200)
+        scrollAreaWidget.setMaximumHeight(260)
         gridBox_Methods = QGridLayout(scrollAreaWidget)
 
         gridBox_Methods.addWidget(label_Method, 0, 0, alignment=Qt.AlignLeft)
@@ -3288,6 +2530,12 @@ class WidgetTabMachineLearningSettingsSignalCompareMethods(QWidget):
         gridBox_Methods.addWidget(label_DynamicTimeWarping, 5, 0, alignment=Qt.AlignLeft)
         gridBox_Methods.addWidget(self.checkbox_DynamicTimeWarping, 5, 1, alignment=Qt.AlignHCenter)
 
+        gridBox_Methods.addWidget(label_DynamicTimeWarpingWindow, 6, 0, alignment=Qt.AlignLeft)
+        gridBox_Methods.addWidget(self.comboBox_DynamicTimeWarpingWindow, 6, 1, alignment=Qt.AlignHCenter)
+
+        gridBox_Methods.addWidget(label_DynamicTimeWarpingWindowSize, 7, 0, alignment=Qt.AlignLeft)
+        gridBox_Methods.addWidget(self.spinBox_DynamicTimeWarpingWindowSize, 7, 1, alignment=Qt.AlignHCenter)
+
         return scrollAreaWidget
 
     # ------------------------------ #
@@ -3323,6 +2571,12 @@ class WidgetTabMachineLearningSettingsSignalCompareMethods(QWidget):
     def getCheckState_DynamicTimeWarping(self):
         return self.checkbox_DynamicTimeWarping.checkState()
 
+    def getDynamicTimeWarpingWindow(self):
+        return self.comboBox_DynamicTimeWarpingWindow.currentText()
+
+    def getDynamicTimeWarpingWindowSize(self):
+        return self.spinBox_DynamicTimeWarpingWindowSize.value()
+
 
 # *                                 * #
 # *********************************** #
@@ -3346,7 +2600,7 @@ class WidgetRidgeML(QWidget):
         # ---------------------- #
         self.setWindowTitle(winTitle)  # Set Window Title
         self.setWindowIcon(QIcon(self.iconPath))  # Set Window Icon
-        self.setGeometry(INT_SCREEN_WIDTH / 4, INT_SCREEN_HEIGHT / 4, w, h)  # Set Window Geometry
+        self.setGeometry(getScreenWidth() / 4, getScreenHeight() / 4, w, h)  # Set Window Geometry
         self.setMinimumWidth(minW)  # Set Window Minimum Width
         self.setMinimumHeight(minH)  # Set Window Minimum Height
         if maxW is not None:
@@ -3621,7 +2875,7 @@ class WidgetSVRML(QWidget):
         # ---------------------- #
         self.setWindowTitle(winTitle)  # Set Window Title
         self.setWindowIcon(QIcon(self.iconPath))  # Set Window Icon
-        self.setGeometry(INT_SCREEN_WIDTH / 4, INT_SCREEN_HEIGHT / 4, w, h)  # Set Window Geometry
+        self.setGeometry(getScreenWidth() / 4, getScreenHeight() / 4, w, h)  # Set Window Geometry
         self.setMinimumWidth(minW)  # Set Window Minimum Width
         self.setMinimumHeight(minH)  # Set Window Minimum Height
         if maxW is not None:
@@ -1,21 +1,14 @@
 import sys
 import os
-import tkinter as tk
 import qdarkstyle
 from PySide2.QtCore import Qt
 from PySide2.QtWidgets import QMainWindow, QApplication, QWidget, QAction, QStatusBar
 from PySide2.QtGui import QIcon
 
-from lib.gui.mergeTableFiles_simple import WidgetMergeTableFilesSimple
-from lib.gui.mergeTableFiles_calendar import WidgetMergeTableFilesCalendar
-
-from lib.gui.machineLearningRegressionWidget import WidgetMachineLearningRegressionWidget
-from lib.gui.machineLearningImageClassification import WidgetMachineLearningImageClassification
+from lib.core.project_flags import getScreenWidth, getScreenHeight
 
 _STR_PROJECT_FOLDER = os.path.normpath(os.path.realpath(__file__) + '/../../../')
 
-_INT_SCREEN_WIDTH = tk.Tk().winfo_screenwidth()  # get the screen width
-_INT_SCREEN_HEIGHT = tk.Tk().winfo_screenheight()  # get the screen height
 _INT_WIN_WIDTH = 1024  # this variable is only for the if __name__ == "__main__"
 _INT_WIN_HEIGHT = 512  # this variable is only for the if __name__ == "__main__"
 
@@ -30,6 +23,12 @@ _ICON_PATH_SETTINGS_48x48 = _STR_PROJECT_FOLDER + '/icon/settings_48_48.png'
 _ICON_PATH_EXIT_APP_48x48 = _STR_PROJECT_FOLDER + '/icon/exit_app_48x48.png'
 _ICON_PATH_CALENDAR_48x48 = _STR_PROJECT_FOLDER + '/icon/calendar_48x48.png'
 
+# Tool Windows
+_TOOL_MERGE_TABLE_FILES_SIMPLE = 'MergeTableFilesSimple'
+_TOOL_MERGE_TABLE_FILES_CALENDAR = 'MergeTableFilesCalendar'
+_TOOL_MACHINE_LEARNING_REGRESSION = 'MachineLearningRegression'
+_TOOL_MACHINE_LEARNING_IMAGE_CLASSIFICATION = 'MachineLearningImageClassification'
+
 
 class MainWindowCrabsMLearning(QMainWindow):
     def __init__(self, app, w=512, h=512, minW=256, minH=256, winTitle='My Window', iconPath='', parent=None):
@@ -43,39 +42,14 @@ class MainWindowCrabsMLearning(QMainWindow):
         # ***************************** #
         # Tools -> ....                 #
 
-        # .... -> MergeTableFilesSimple
-        self.widgetMergeTableFilesSimple = WidgetMergeTableFilesSimple(w=512, h=512,
-                                                                       minW=512, minH=256,
-                                                                       maxW=840, maxH=512,
-                                                                       winTitle='Merge Table Files',
-                                                                       iconPath=_ICON_PATH_LOGO_32x32)
-        self.widgetMergeTableFilesSimple.setWidget()
-
-        # .... -> MergeTableFilesCalendar
-        self.widgetMergeTableFilesCalendar = WidgetMergeTableFilesCalendar(w=1024, h=512,
-                                                                           minW=512, minH=256,
-                                                                           maxW=1280, maxH=840,
-                                                                           winTitle='Merge Table Files',
-                                                                           iconPath=_ICON_PATH_LOGO_32x32)
-        self.widgetMergeTableFilesCalendar.setWidget()
-
-        # .... -> MachineLearningRegression
-        self.widgetMachineLearningRegressionWidget = WidgetMachineLearningRegressionWidget(w=1024, h=512,
-                                                                                           minW=512, minH=256,
-                                                                                           maxW=None,
-                                                                                           maxH=None,
-                                                                                           winTitle='Machine Learning Regression',
-                                                                                           iconPath=_ICON_PATH_LOGO_32x32)
-        self.widgetMachineLearningRegressionWidget.setWidget()
-
-        # .... -> MachineLearningForVideo
-        self.widgetMachineLearningForVideoWidget = WidgetMachineLearningImageClassification(w=1024, h=512,
-                                                                                            minW=512, minH=256,
-                                                                                            maxW=None,
-                                                                                            maxH=None,
-                                                                                            winTitle='Machine Learning Image Classification',
-                                                                                            iconPath=_ICON_PATH_LOGO_32x32)
-        self.widgetMachineLearningForVideoWidget.setWidget()
+        # The tool windows are created the first time they are opened and then they are reused
+        self._dictToolWidgets = {}
+        self._dictToolBuilders = {
+            _TOOL_MERGE_TABLE_FILES_SIMPLE: self.createWidgetMergeTableFilesSimple,
+            _TOOL_MERGE_TABLE_FILES_CALENDAR: self.createWidgetMergeTableFilesCalendar,
+            _TOOL_MACHINE_LEARNING_REGRESSION: self.createWidgetMachineLearningRegression,
+            _TOOL_MACHINE_LEARNING_IMAGE_CLASSIFICATION: self.createWidgetMachineLearningImageClassification
+        }
 
         #                               #
         # ***************************** #
@@ -86,7 +60,7 @@ class MainWindowCrabsMLearning(QMainWindow):
         self.setStyle_()
         self.setWindowTitle(winTitle)  # Set Window Title
         self.setWindowIcon(QIcon(iconPath))  # Set Window Icon
-        self.setGeometry(_INT_SCREEN_WIDTH / 4, _INT_SCREEN_HEIGHT / 4, w, h)  # Set Window Geometry
+        self.setGeometry(getScreenWidth() / 4, getScreenHeight() / 4, w, h)  # Set Window Geometry
         self.setMinimumWidth(minW)  # Set Window Minimum Width
         self.setMinimumHeight(minH)  # Set Window Minimum Height
 
@@ -170,6 +144,68 @@ class MainWindowCrabsMLearning(QMainWindow):
     def setStyle_(self):
         self.app.setStyleSheet(qdarkstyle.load_stylesheet(qt_api='pyside2'))
 
+    # ************************ #
+    # ***** Tool Windows ***** #
+    # ************************ #
+    # The modules of the tools are imported when the tool is created, so the application starts without
+    # loading the heavy libraries of the tools which are not used
+
+    @staticmethod
+    def createWidgetMergeTableFilesSimple():
+        from lib.gui.mergeTableFiles_simple import WidgetMergeTableFilesSimple
+        widget = WidgetMergeTableFilesSimple(w=512, h=512,
+                                             minW=512, minH=256,
+                                             maxW=840, maxH=512,
+                                             winTitle='Merge Table Files',
+                                             iconPath=_ICON_PATH_LOGO_32x32)
+        widget.setWidget()
+        return widget
+
+    @staticmethod
+    def createWidgetMergeTableFilesCalendar():
+        from lib.gui.mergeTableFiles_calendar import WidgetMergeTableFilesCalendar
+        widget = WidgetMergeTableFilesCalendar(w=1024, h=512,
+                                               minW=512, minH=256,
+                                               maxW=1280, maxH=840,
+                                               winTitle='Merge Table Files',
+                                               iconPath=_ICON_PATH_LOGO_32x32)
+        widget.setWidget()
+        return widget
+
+    @staticmethod
+    def createWidgetMachineLearningRegression():
+        from lib.gui.machineLearningRegressionWidget import WidgetMachineLearningRegressionWidget
+        widget = WidgetMachineLearningRegressionWidget(w=1024, h=512,
+                                                       minW=512, minH=256,
+                                                       maxW=None,
+                                                       maxH=None,
+                                                       winTitle='Machine Learning Regression',
+                                                       iconPath=_ICON_PATH_LOGO_32x32)
+        widget.setWidget()
+        return widget
+
+    @staticmethod
+    def createWidgetMachineLearningImageClassification():
+        from lib.gui.machineLearningImageClassification import WidgetMachineLearningImageClassification
+        widget = WidgetMachineLearningImageClassification(w=1024, h=512,
+                                                          minW=512, minH=256,
+                                                          maxW=None,
+                                                          maxH=None,
+                                                          winTitle='Machine Learning Image Classification',
+                                                          iconPath=_ICON_PATH_LOGO_32x32)
+        widget.setWidget()
+        return widget
+
+    def getToolWidget(self, toolKey: str):
+        """
+        Get the window of a tool (it is created the first time).
+        :param toolKey: the tool (_TOOL_*)
+        :return: the tool widget
+        """
+        if toolKey not in self._dictToolWidgets.keys():
+            self._dictToolWidgets[toolKey] = self._dictToolBuilders[toolKey]()
+        return self._dictToolWidgets[toolKey]
+
     def createMenuBar(self):
         """
         This function runs all the createMenuBar* menu functions to create each menu.
@@ -258,10 +294,10 @@ class MainWindowCrabsMLearning(QMainWindow):
     # *** Tools *** #
     # ************* #
     def actionMergeTF_Simple_func_(self):
-        self.widgetMergeTableFilesSimple.show()
+        self.getToolWidget(_TOOL_MERGE_TABLE_FILES_SIMPLE).show()
 
     def actionMergeTF_Calendar_func_(self):
-        self.widgetMergeTableFilesCalendar.show()
+        self.getToolWidget(_TOOL_MERGE_TABLE_FILES_CALENDAR).show()
 
     def actionMachineLearningSequential_func_(self):
         self.widgetMachineLearningSequential.show()
@@ -270,10 +306,10 @@ class MainWindowCrabsMLearning(QMainWindow):
         self.widgetMachineLearningMean.show()
 
     def actionMachineLearningRegression_func_(self):
-        self.widgetMachineLearningRegressionWidget.show()
+        self.getToolWidget(_TOOL_MACHINE_LEARNING_REGRESSION).show()
 
     def actionMachineLearningForVideo_func_(self):
-        self.widgetMachineLearningForVideoWidget.show()
+        self.getToolWidget(_TOOL_MACHINE_LEARNING_IMAGE_CLASSIFICATION).show()
 
 
 # ******************************************************* #
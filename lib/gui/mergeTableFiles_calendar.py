@@ -1,21 +1,20 @@
 import sys
 import os
-import tkinter as tk
 from PySide2.QtCore import QUrl
 from PySide2.QtWidgets import QWidget, QApplication, QPushButton, QHBoxLayout, QVBoxLayout, QSpacerItem, \
     QListWidget, QListWidgetItem, QFileDialog, QLabel, QTabWidget, QComboBox, QCheckBox, QRadioButton, QLineEdit, \
     QButtonGroup, QSpinBox
 from PySide2.QtGui import QIcon, QPixmap, QFont
 
+from lib.core.project_flags import getScreenWidth, getScreenHeight
 import lib.core.file_manipulation as file_manip
 import lib.core.my_calendar_v2 as my_cal_v2
+import lib.core.calendarMerge as calMerge
 
 
 _NEW_PROJECT_DEFAULT_FOLDER = file_manip.PATH_HOME
 _PROJECT_FOLDER = os.path.normpath(os.path.realpath(__file__) + '/../../../')
 
-_INT_SCREEN_WIDTH = tk.Tk().winfo_screenwidth()  # get the screen width
-_INT_SCREEN_HEIGHT = tk.Tk().winfo_screenheight()  # get the screen height
 _INT_WIN_WIDTH = 1024  # this variable is only for the if __name__ == "__main__"
 _INT_WIN_HEIGHT = 512  # this variable is only for the if __name__ == "__main__"
 
@@ -111,7 +110,7 @@ class WidgetMergeTableFilesCalendar(QWidget):
         # ---------------------- #
         self.setWindowTitle(winTitle)  # Set Window Title
         self.setWindowIcon(QIcon(iconPath))  # Set Window Icon
-        self.setGeometry(_INT_SCREEN_WIDTH / 4, _INT_SCREEN_HEIGHT / 4, w, h)  # Set Window Geometry
+        self.setGeometry(getScreenWidth() / 4, getScreenHeight() / 4, w, h)  # Set Window Geometry
         self.setMinimumWidth(minW)  # Set Window Minimum Width
         self.setMinimumHeight(minH)  # Set Window Minimum Height
         self.setMaximumWidth(maxW)  # Set Window Maximum Width
@@ -490,54 +489,19 @@ class WidgetMergeTableFilesCalendar(QWidget):
                 self.buttonGenerate.setEnabled(False)
 
     def actionButtonGenerate(self):
-        list_primary_event = []  # create a list to store the primary events
-        list_of_events = []  # create list to store the actual events
         list_of_year = []  # a list to store the years for the calendar
 
         myCalV2_DateFormat = self.dict_myCalendar_v2_settings[_DKEY_MYCALV2_DATE_FORMAT]
         myCalV2_DateDelimiter = self.dict_myCalendar_v2_settings[_DKEY_MYCALV2_DATE_DELIMITER]
 
-        def set_list_primary_event(listInput, listOfSelectedEvents, tmpPrimaryEventIndex=0):
-            """
-            A tmp function to create the list_primary_event and the list_of_events
-            :param listInput: The list of all data
-            :param listOfSelectedEvents: The list of selected event columns
-            :param tmpPrimaryEventIndex:  The primary event index
-            :return: Nothing
-            """
-            for event_name in listInput[0]:  # for each event_name (column) in data list
-                if event_name in listOfSelectedEvents and event_name not in list_of_events:
-                    list_of_events.append(event_name)
-            for index in range(1, len(listInput)):
-                if listInput[index][tmpPrimaryEventIndex] not in list_primary_event:
-                    list_primary_event.append(listInput[index][tmpPrimaryEventIndex])
-
-        dict_primary_event_index = {}  # a dictionary to store the primary event indexes
-        dict_date_index = {}   # a dictionary to store the date column indexes
         if self.dict_tableFilesPaths.keys().__len__() >= 2:  # if there are at least 2 files (safety if)
             # Error Checking
-            bool_add_primary_event = True
-            bool_add_date_column = True
             for fileName in self.dict_tableFilesPaths.keys():
-                if self.dict_tableFilesPaths[fileName][_DKEY_PRIMARY_COLUMN] is not None:
-                    primary_event = self.dict_tableFilesPaths[fileName][_DKEY_PRIMARY_COLUMN]
-                    primary_event_index = self.dict_tableFilesPaths[fileName][_DKEY_COLUMNS].index(primary_event)
-                    dict_primary_event_index[fileName] = primary_event_index
-                    if bool_add_primary_event:
-                        list_of_events.append(primary_event)
-                        bool_add_primary_event = False
-                else:
+                if self.dict_tableFilesPaths[fileName][_DKEY_PRIMARY_COLUMN] is None:
                     print("ERROR: <", fileName, "> has no Primary event specified!")
                     return
 
-                if self.dict_tableFilesPaths[fileName][_DKEY_DATE_COLUMN] is not None:
-                    date_column = self.dict_tableFilesPaths[fileName][_DKEY_DATE_COLUMN]
-                    date_index = self.dict_tableFilesPaths[fileName][_DKEY_COLUMNS].index(date_column)
-                    dict_date_index[fileName] = date_index
-                    if bool_add_date_column:
-                        list_of_events.append(date_column)
-                        bool_add_date_column = False
-                else:
+                if self.dict_tableFilesPaths[fileName][_DKEY_DATE_COLUMN] is None:
                     print("ERROR: <", fileName, "> has not a Date column specified!")
                     return
 
@@ -545,14 +509,6 @@ class WidgetMergeTableFilesCalendar(QWidget):
                     print("ERROR: <", fileName, "> has not a single Event specified!")
                     return
 
-            # Set Primary Event List and Event List
-            for fileName in self.dict_tableFilesPaths.keys():
-                filePath = self.dict_tableFilesPaths[fileName][_DKEY_FULLPATH]
-                delimiter = self.dict_tableFilesPaths[fileName][_DKEY_COLUMN_DELIMITER]
-                fileData = my_cal_v2.read_csv(filePath, delimiter)
-                list_of_selected_events = self.dict_tableFilesPaths[fileName][_DKEY_EVENT_COLUMNS]
-                set_list_primary_event(fileData, list_of_selected_events, dict_primary_event_index[fileName])
-
             # Create the Calendar
             # We need to write code (widget to set up this parameters) **************************************
             for i in range(self.dict_myCalendar_v2_settings[_DKEY_MYCALV2_START_YEAR],
@@ -560,40 +516,29 @@ class WidgetMergeTableFilesCalendar(QWidget):
                 list_of_year.append(i)
             # print(list_of_year)
 
-            event_calendar = my_cal_v2.MyCalendar(list_of_years=list_of_year, is_time=False,
-                                                  date_format=myCalV2_DateFormat,
-                                                  date_delimiter=myCalV2_DateDelimiter,
-                                                  time_format=my_cal_v2.HH_MM,
-                                                  time_delimiter=my_cal_v2.del_colon,
-                                                  hour_start=0, hour_end=0, hour_step=1,
-                                                  minute_start=0, minute_end=0, minute_step=0)
-            event_calendar.add_list_key_event_to_calendar(list_key_event=list_primary_event)
-            event_calendar.add_list_key_event_to_calendar(list_key_event=list_primary_event,
-                                                          list_of_headers=list_of_events)
-
+            event_calendar = calMerge.CalendarMerge(listOfYears=list_of_year, dateFormat=myCalV2_DateFormat,
+                                                    dateDelimiter=myCalV2_DateDelimiter)
             # ***********************************************************************************************
 
-            # Add events to Calender (we may need to edit calendar lib so to be fully compatible with the interface)
+            # Add the files to the Calendar (each file is read once)
             for fileName in self.dict_tableFilesPaths.keys():
                 print(fileName)
-                filePath = self.dict_tableFilesPaths[fileName][_DKEY_FULLPATH]
-                delimiter = self.dict_tableFilesPaths[fileName][_DKEY_COLUMN_DELIMITER]
-                fileData = my_cal_v2.read_csv(filePath, delimiter)
-                event_calendar.add_events_to_calendar(list_of_events=fileData,
-                                                      date_index=dict_date_index[fileName],
-                                                      time_index=None,
-                                                      first_row_header=True,
-                                                      list_of_headers=None,
-                                                      event_index=dict_primary_event_index[fileName],
-                                                      add_events_in_this_list=list_of_events)
+                event_calendar.addFile(fileName=fileName,
+                                       path=self.dict_tableFilesPaths[fileName][_DKEY_FULLPATH],
+                                       dateColumn=self.dict_tableFilesPaths[fileName][_DKEY_DATE_COLUMN],
+                                       primaryColumn=self.dict_tableFilesPaths[fileName][_DKEY_PRIMARY_COLUMN],
+                                       eventColumns=self.dict_tableFilesPaths[fileName][_DKEY_EVENT_COLUMNS],
+                                       delimiter=self.dict_tableFilesPaths[fileName][_DKEY_COLUMN_DELIMITER])
 
             # Export Final List
             # We need to write code (widget to set up this parameters) **************************************
-            list_calendar = event_calendar.dict_to_list(date_range=['2020-01-01', '2021-09-20'])
-            my_cal_v2.write_csv(csv_path=_PROJECT_FOLDER + "/export_folder/netherlands_RNA.csv",
-                                list_write=list_calendar, delimiter=my_cal_v2.del_comma)
+            try:
+                event_calendar.exportCSV(csvPath=_PROJECT_FOLDER + "/export_folder/netherlands_RNA.csv",
+                                         delimiter=my_cal_v2.del_comma)
+            except ValueError as e:
+                print("ERROR:", e)
+                return
             # ***********************************************************************************************
-            # event_calendar.print(5)
 
             print("Finished Successfully!")
 
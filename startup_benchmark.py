@@ -0,0 +1,70 @@
+"""
+Measure the cold start of the application: each run imports the startup module in a new python process
+and reports the import time and the heavy backends which have been loaded.
+
+    python startup_benchmark.py [--module lib.gui.mainwindow] [--repeat 5]
+
+To compare two versions, run the script in each checkout (e.g. with git worktree) and compare the times.
+"""
+import os
+import sys
+import json
+import argparse
+import statistics
+import subprocess
+
+_STR_PROJECT_FOLDER = os.path.dirname(os.path.abspath(__file__))
+
+SB_DEFAULT_MODULE = 'lib.gui.mainwindow'  # the module which starts the application
+SB_DEFAULT_REPEAT = 5
+SB_HEAVY_MODULES = ['tensorflow', 'keras_tuner', 'pmdarima', 'statsmodels', 'tkinter']
+
+_SB_CHILD_CODE = '''
+import sys
+import json
+import time
+sys.path.insert(0, {projectFolder!r})
+startTime = time.perf_counter()
+import {module}
+importTime = time.perf_counter() - startTime
+print(json.dumps({{'time': importTime,
+                   'loaded': [name for name in {heavyModules!r} if name in sys.modules]}}))
+'''
+
+
+def measureColdStart(module=SB_DEFAULT_MODULE):
+    """
+    Import the module in a new python process.
+    :param module: the module name
+    :return: (the import time in seconds, the list of the loaded heavy modules)
+    """
+    code = _SB_CHILD_CODE.format(projectFolder=_STR_PROJECT_FOLDER, module=module,
+                                 heavyModules=SB_HEAVY_MODULES)
+    result = subprocess.run([sys.executable, '-c', code], cwd=_STR_PROJECT_FOLDER,
+                            capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError('Import of ' + module + ' failed:\n' + result.stderr)
+    values = json.loads(result.stdout.strip().splitlines()[-1])
+    return values['time'], values['loaded']
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Measure the cold start time of the application.')
+    parser.add_argument('--module', default=SB_DEFAULT_MODULE, help='the startup module')
+    parser.add_argument('--repeat', type=int, default=SB_DEFAULT_REPEAT, help='the number of cold starts')
+    args = parser.parse_args()
+
+    times = []
+    loaded = []
+    for _ in range(max(1, args.repeat)):
+        importTime, loaded = measureColdStart(args.module)
+        times.append(importTime)
+
+    print('Module: ' + args.module)
+    print('Cold starts: ' + str(times.__len__()))
+    print('Min: %.3f s, Median: %.3f s, Max: %.3f s' % (min(times), statistics.median(times), max(times)))
+    print('Heavy modules loaded at start: ' + (', '.join(loaded) if loaded.__len__() > 0 else 'None'))
+
+
+if __name__ == "__main__":
+    main()
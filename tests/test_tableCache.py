@@ -0,0 +1,49 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+import lib.core.file_manipulation as file_manip
+import lib.core.tableCache as tableCache
+import lib.core.eventPartition as eventPartition
+
+
+class TestTableCache(unittest.TestCase):
+    def setUp(self):
+        self.tmpDir = tempfile.mkdtemp()
+        self.filePath = os.path.normpath(self.tmpDir + '/events.csv')
+        with open(self.filePath, 'w') as f:
+            f.write('Event,Input,Output\n'
+                    'A,1.0,10.0\n'
+                    ',2.0,20.0\n'  # a row without event
+                    'B,3.0,30.0\n'
+                    'A,4.0,40.0\n'
+                    'nan,5.0,50.0\n'  # parsed as a missing value by pandas
+                    'B,6.0,60.0\n')
+        self.useColumns = ['Event', 'Input', 'Output']
+        self.dtypes = {'Input': np.float64, 'Output': np.float64}
+
+    def tearDown(self):
+        shutil.rmtree(self.tmpDir, ignore_errors=True)
+
+    def test_cachedAndUncachedReadHaveTheSameEvents(self):
+        fileData = file_manip.readTableFile(self.filePath, useColumns=self.useColumns, dtypes=self.dtypes)
+        cache = tableCache.TableCache(cacheDir=os.path.normpath(self.tmpDir + '/' + tableCache.TC_DEFAULT_DIR_NAME))
+        key = cache.getKey(self.filePath, useColumns=self.useColumns, dtypes=self.dtypes)
+        cache.store(key, fileData, sourcePath=self.filePath)
+        cachedData = cache.load(key)
+        self.assertIsNotNone(cachedData)
+
+        uncachedPartition = eventPartition.EventPartition(eventValues=fileData['Event'].to_numpy())
+        cachedPartition = eventPartition.EventPartition(eventValues=cachedData['Event'].to_numpy())
+        self.assertEqual(uncachedPartition.events(), ['A', 'B'])
+        self.assertEqual(cachedPartition.events(), uncachedPartition.events())
+        for event in uncachedPartition.events():
+            np.testing.assert_array_equal(cachedPartition.split(cachedData['Input'].to_numpy())[event],
+                                          uncachedPartition.split(fileData['Input'].to_numpy())[event])
+
+
+if __name__ == '__main__':
+    unittest.main()